@@ -0,0 +1 @@
+"""Benchmarks for geotech-pandas, run with airspeed velocity (asv)."""
@@ -0,0 +1,44 @@
+"""Benchmarks for the construction and validation of the geotech accessor."""
+
+from benchmarks.common import ROWS, TIMEOUT, make_frame
+from geotech_pandas.accessor import GeotechDataFrameAccessor
+
+
+class Accessor:
+    """Construction of the geotech accessor, which validates the DataFrame."""
+
+    params = ROWS
+    param_names = ("rows",)
+    timeout = TIMEOUT
+
+    def setup(self, rows):
+        """Create the DataFrame."""
+        self.df = make_frame(rows)
+
+    def time_construct(self, rows):
+        """Time the construction of the accessor."""
+        GeotechDataFrameAccessor(self.df)
+
+    def peakmem_construct(self, rows):
+        """Measure the peak memory of the construction of the accessor."""
+        GeotechDataFrameAccessor(self.df)
+
+
+class Validation:
+    """Individual validation phases of the geotech accessor."""
+
+    params = (ROWS, ["_validate_columns", "_validate_monotony", "_validate_duplicates"])
+    param_names = ("rows", "method")
+    timeout = TIMEOUT
+
+    def setup(self, rows, method):
+        """Create the DataFrame and its accessor."""
+        self.accessor = GeotechDataFrameAccessor(make_frame(rows))
+
+    def time_validate(self, rows, method):
+        """Time the validation phase."""
+        getattr(self.accessor, method)()
+
+    def peakmem_validate(self, rows, method):
+        """Measure the peak memory of the validation phase."""
+        getattr(self.accessor, method)()
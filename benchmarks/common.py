@@ -0,0 +1,22 @@
+"""Common parameters and fixtures for the benchmarks."""
+
+import pandas as pd
+
+from geotech_pandas.testing import make_boreholes
+
+LAYERS_PER_POINT = 20
+ROWS = [10**3, 10**4, 10**5, 10**6, 10**7]
+
+# Long enough for the largest frames, where a single call can take minutes.
+TIMEOUT = 3600
+
+
+def make_frame(rows: int, with_spt: bool = False, with_atterberg: bool = False) -> pd.DataFrame:
+    """Return a synthetic DataFrame of boreholes with the given number of rows."""
+    return make_boreholes(
+        rows // LAYERS_PER_POINT,
+        LAYERS_PER_POINT,
+        with_spt=with_spt,
+        with_atterberg=with_atterberg,
+        seed=0,
+    )
@@ -0,0 +1,29 @@
+"""Benchmarks for the import time of geotech-pandas.
+
+The cost of ``import geotech_pandas``, which registers the ``geotech`` accessor, should stay close
+to the cost of ``import pandas``.
+"""
+
+
+def timeraw_import_pandas():
+    """Time importing pandas in a fresh interpreter, as the baseline."""
+    return "import pandas"
+
+
+def timeraw_import_geotech_pandas():
+    """Time importing geotech-pandas in a fresh interpreter."""
+    return "import geotech_pandas"
+
+
+def timeraw_first_in_situ_access():
+    """Time the first access of the in-situ subaccessor, which imports its subpackage."""
+    return (
+        """
+        df = pd.DataFrame({"point_id": ["BH-1"], "bottom": [1.0]})
+        df.geotech.in_situ
+        """,
+        """
+        import pandas as pd
+        import geotech_pandas
+        """,
+    )
@@ -0,0 +1,155 @@
+"""Benchmarks for the index subaccessor."""
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.common import ROWS, TIMEOUT, make_frame
+
+
+class LiquidLimit:
+    """Liquid limit calculation of the index subaccessor."""
+
+    params = ROWS
+    param_names = ("rows",)
+    timeout = TIMEOUT
+
+    def setup(self, rows):
+        """Create the DataFrame with Atterberg limit data."""
+        self.df = make_frame(rows, with_atterberg=True)
+
+    def time_get_liquid_limit(self, rows):
+        """Time getting the liquid limit."""
+        self.df.geotech.lab.index.get_liquid_limit()
+
+    def peakmem_get_liquid_limit(self, rows):
+        """Measure the peak memory of getting the liquid limit."""
+        self.df.geotech.lab.index.get_liquid_limit()
+
+    def time_get_flow_curve(self, rows):
+        """Time getting the flow curve with its diagnostics."""
+        self.df.geotech.lab.index.get_flow_curve()
+
+
+class SparseLiquidLimit:
+    """Liquid limit calculation where only one in ten layers has a sample."""
+
+    params = ROWS[:4]
+    param_names = ("rows",)
+    timeout = TIMEOUT
+
+    def setup(self, rows):
+        """Create the DataFrame with sparse Atterberg limit columns."""
+        df = make_frame(rows, with_atterberg=True)
+        columns = df.columns.drop(["point_id", "bottom", "top"])
+        df.loc[df.index % 10 != 0, columns] = float("nan")
+        self.df = df.astype({column: pd.SparseDtype(float) for column in columns})
+
+    def time_get_liquid_limit(self, rows):
+        """Time getting the liquid limit."""
+        self.df.geotech.lab.index.get_liquid_limit()
+
+    def peakmem_get_liquid_limit(self, rows):
+        """Measure the peak memory of getting the liquid limit."""
+        self.df.geotech.lab.index.get_liquid_limit()
+
+
+class MoistureContents:
+    """Moisture contents of the natural sample and the Atterberg limit trials."""
+
+    params = ROWS[:4]
+    param_names = ("rows",)
+    timeout = TIMEOUT
+
+    def setup(self, rows):
+        """Create the DataFrame with masses for the natural sample and five trials."""
+        df = make_frame(rows, with_atterberg=True)
+        masses = ["mass_moist", "mass_dry", "mass_container"]
+        self.prefixes = [
+            "moisture_content",
+            *[f"liquid_limit_{n}" for n in range(1, 4)],
+            *[f"plastic_limit_{n}" for n in range(1, 3)],
+        ]
+        self.df = df.assign(
+            **{
+                f"{prefix}_{mass}": df[f"moisture_content_{mass}"]
+                for prefix in self.prefixes[1:]
+                for mass in masses
+            }
+        )
+
+    def time_get_moisture_contents(self, rows):
+        """Time getting every moisture content in one pass."""
+        self.df.geotech.lab.index.get_moisture_contents()
+
+    def time_get_moisture_content_per_prefix(self, rows):
+        """Time getting every moisture content with a call for each prefix."""
+        for prefix in self.prefixes:
+            self.df.geotech.lab.index.get_moisture_content(prefix=prefix)
+
+
+class UscsClassification:
+    """Soil classification from the Atterberg limits and gradation."""
+
+    params = ROWS
+    param_names = ("rows",)
+    timeout = TIMEOUT
+
+    def setup(self, rows):
+        """Create the DataFrame with random Atterberg limits and gradation."""
+        rng = np.random.default_rng(0)
+        df = make_frame(rows, with_atterberg=False)
+        fines = rng.uniform(0, 100, len(df))
+        liquid_limit = rng.uniform(15, 90, len(df))
+        plasticity_index = rng.uniform(0, 50, len(df))
+        self.df = df.assign(
+            liquid_limit=liquid_limit,
+            plastic_limit=liquid_limit - plasticity_index,
+            plasticity_index=plasticity_index,
+            fines_content=fines,
+            gravel_content=rng.uniform(0, 1, len(df)) * (100 - fines),
+            coefficient_of_uniformity=rng.uniform(1, 20, len(df)),
+            coefficient_of_curvature=rng.uniform(0.5, 4, len(df)),
+        )
+
+    def time_get_uscs_classification(self, rows):
+        """Time classifying every sample."""
+        self.df.geotech.lab.index.get_uscs_classification()
+
+
+class Gradation:
+    """Gradation of ten-sieve particle size analyses."""
+
+    params = ROWS[:4]
+    param_names = ("rows",)
+    timeout = TIMEOUT
+
+    def setup(self, rows):
+        """Create the DataFrame with random grain size curves."""
+        rng = np.random.default_rng(0)
+        df = make_frame(rows, with_atterberg=False)
+        sizes = [75.0, 37.5, 19.0, 9.5, 4.75, 2.0, 0.85, 0.425, 0.15, 0.075]
+        passing = np.sort(rng.uniform(0, 100, (len(df), len(sizes))), axis=1)[:, ::-1]
+        self.df = df.assign(
+            **{f"sieve_{n + 1}_size": size for n, size in enumerate(sizes)},
+            **{f"sieve_{n + 1}_passing": passing[:, n] for n in range(len(sizes))},
+        )
+        self.sieve_results = pd.DataFrame(
+            {
+                "point_id": np.repeat(df["point_id"].to_numpy(), len(sizes)),
+                "bottom": np.repeat(df["bottom"].to_numpy(), len(sizes)),
+                "sieve_size": np.tile(sizes, len(df)),
+                "sieve_passing": passing.ravel(),
+            }
+        )
+
+    def time_get_gradation(self, rows):
+        """Time getting the gradation from sieve columns."""
+        self.df.geotech.lab.index.get_gradation()
+
+    def peakmem_get_gradation(self, rows):
+        """Measure the peak memory of getting the gradation from sieve columns."""
+        self.df.geotech.lab.index.get_gradation()
+
+    def time_get_gradation_sieve_results(self, rows):
+        """Time getting the gradation from a long table of sieve results."""
+        self.df.geotech.lab.index.get_gradation(sieve_results=self.sieve_results)
@@ -0,0 +1,32 @@
+"""Benchmarks for the layer subaccessor."""
+
+from benchmarks.common import ROWS, TIMEOUT, make_frame
+
+
+class Layer:
+    """Depth-related methods of the layer subaccessor."""
+
+    params = ROWS
+    param_names = ("rows",)
+    timeout = TIMEOUT
+
+    def setup(self, rows):
+        """Create the DataFrame with a groundwater level that splits a layer in every point."""
+        self.df = make_frame(rows)
+        self.df["water_level"] = 5.0
+
+    def time_get_top(self, rows):
+        """Time getting the top depths."""
+        self.df.geotech.layer.get_top()
+
+    def peakmem_get_top(self, rows):
+        """Measure the peak memory of getting the top depths."""
+        self.df.geotech.layer.get_top()
+
+    def time_split_at(self, rows):
+        """Time splitting the layers at the groundwater level."""
+        self.df.geotech.layer.split_at("water_level")
+
+    def peakmem_split_at(self, rows):
+        """Measure the peak memory of splitting the layers at the groundwater level."""
+        self.df.geotech.layer.split_at("water_level")
@@ -0,0 +1,59 @@
+"""Benchmarks for the SPT subaccessor."""
+
+from benchmarks.common import ROWS, TIMEOUT, make_frame
+from geotech_pandas.in_situ import spt
+
+METHODS = [
+    "get_seating_pen",
+    "get_main_pen",
+    "get_total_pen",
+    "get_seating_drive",
+    "get_main_drive",
+    "get_total_drive",
+    "is_refusal",
+    "is_hammer_weight",
+    "get_n_value",
+    "get_report",
+    "compute_all",
+    "get_typical_hammer_efficiency_factor",
+]
+
+
+class SPT:
+    """Methods of the SPT subaccessor."""
+
+    params = (ROWS, METHODS)
+    param_names = ("rows", "method")
+    timeout = TIMEOUT
+
+    def setup(self, rows, method):
+        """Create the DataFrame with SPT data."""
+        self.df = make_frame(rows, with_spt=True)
+
+    def time_method(self, rows, method):
+        """Time the SPT method."""
+        getattr(self.df.geotech.in_situ.spt, method)()
+
+    def peakmem_method(self, rows, method):
+        """Measure the peak memory of the SPT method."""
+        getattr(self.df.geotech.in_situ.spt, method)()
+
+
+class ParseReport:
+    """Parsing of SPT report strings."""
+
+    params = ROWS
+    param_names = ("rows",)
+    timeout = TIMEOUT
+
+    def setup(self, rows):
+        """Create the SPT report strings."""
+        self.report = make_frame(rows, with_spt=True).geotech.in_situ.spt.get_report()
+
+    def time_parse_report(self, rows):
+        """Time parsing the report strings."""
+        spt.parse_report(self.report)
+
+    def peakmem_parse_report(self, rows):
+        """Measure the peak memory of parsing the report strings."""
+        spt.parse_report(self.report)
@@ -48,6 +48,9 @@ exclude_patterns = ["_build", "Thumbs.db", ".DS_Store"]
 intersphinx_mapping = {
     "python": ("https://docs.python.org/3/", None),
     "pandas": ("https://pandas.pydata.org/docs/", None),
+    "numpy": ("https://numpy.org/doc/stable/", None),
+    "dask": ("https://docs.dask.org/en/stable/", None),
+    "polars": ("https://docs.pola.rs/api/python/stable/", None),
 }
 
 intersphinx_disabled_reftypes = ["*"]
@@ -1,7 +1,25 @@
 """geotech-pandas."""
 
+import importlib
+
 from geotech_pandas.accessor import GeotechDataFrameAccessor
+from geotech_pandas.config import get_option, option_context, reset_option, set_option
+from geotech_pandas.profiling import profile
 
 __all__ = [
     "GeotechDataFrameAccessor",
+    "get_option",
+    "option_context",
+    "profile",
+    "reset_option",
+    "set_option",
 ]
+
+_SUBMODULES = ["in_situ", "lab", "pipeline", "serve", "testing"]
+
+
+def __getattr__(name: str):
+    """Import subpackages and submodules on their first access."""
+    if name in _SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
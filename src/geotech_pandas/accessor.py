@@ -1,14 +1,55 @@
 """General :external:class:`~pandas.DataFrame` accessor for the geotech-pandas package."""
 
+import numpy as np
 import pandas as pd
 
 from geotech_pandas.base import GeotechPandasBase
-from geotech_pandas.in_situ import InSituDataFrameAccessor
-from geotech_pandas.lab import LabDataFrameAccessor
 from geotech_pandas.layer import LayerDataFrameAccessor
 from geotech_pandas.point import PointDataFrameAccessor
 from geotech_pandas.utils import SubAccessor
 
+CATEGORICAL_COLUMNS = [
+    "point_id",
+    "sample_type",
+    "spt_hammer_country_ref",
+    "spt_hammer_type",
+    "spt_hammer_release",
+]
+UNSIGNED_COLUMNS = [
+    "sample_number",
+    "blows_1",
+    "blows_2",
+    "blows_3",
+    "pen_1",
+    "pen_2",
+    "pen_3",
+]
+
+
+def _downcast_unsigned(series: pd.Series) -> pd.Series:
+    """Return `series` as the smallest unsigned integer dtype that fits its values.
+
+    The nullable dtype is used if there are missing values. The series is returned as is if it is
+    not numeric, or if it has negative or non-integer values.
+    """
+    if not pd.api.types.is_numeric_dtype(series.dtype) or pd.api.types.is_bool_dtype(series.dtype):
+        return series
+
+    values = series.to_numpy(dtype="float64", na_value=np.nan)
+    na = np.isnan(values)
+    values = values[~na]
+    if ((values < 0) | (values % 1 != 0)).any():
+        return series
+
+    maximum = values.max(initial=0)
+    dtype = next(
+        dtype
+        for dtype in (np.uint8, np.uint16, np.uint32, np.uint64)
+        if maximum <= np.iinfo(dtype).max
+    )
+    name = np.dtype(dtype).name
+    return series.astype(pd.api.types.pandas_dtype(f"UInt{name[4:]}" if na.any() else name))
+
 
 @pd.api.extensions.register_dataframe_accessor("geotech")
 class GeotechDataFrameAccessor(GeotechPandasBase):
@@ -18,8 +59,8 @@ class GeotechDataFrameAccessor(GeotechPandasBase):
 
     point = SubAccessor(PointDataFrameAccessor)
     layer = SubAccessor(LayerDataFrameAccessor)
-    in_situ = SubAccessor(InSituDataFrameAccessor)
-    lab = SubAccessor(LabDataFrameAccessor)
+    in_situ = SubAccessor("geotech_pandas.in_situ:InSituDataFrameAccessor")
+    lab = SubAccessor("geotech_pandas.lab:LabDataFrameAccessor")
 
     def __init__(self, df: pd.DataFrame):
         self._obj = df
@@ -27,3 +68,73 @@ class GeotechDataFrameAccessor(GeotechPandasBase):
         self._validate_columns()
         self._validate_monotony()
         self._validate_duplicates()
+
+    def optimize(self, report: bool = False) -> pd.DataFrame | tuple[pd.DataFrame, pd.DataFrame]:
+        """Return a copy of the DataFrame with memory-efficient dtypes for the known columns.
+
+        The following columns from the :ref:`column-reference` are converted if present:
+
+        - :term:`point_id`, :term:`sample_type`, :term:`spt_hammer_country_ref`,
+          :term:`spt_hammer_type` and :term:`spt_hammer_release` are converted to ``category``.
+        - :term:`sample_number`, :term:`blows_1`, :term:`blows_2`, :term:`blows_3`, :term:`pen_1`,
+          :term:`pen_2` and :term:`pen_3` are converted to the smallest unsigned integer dtype that
+          fits their values, which is nullable if there are missing values. Columns with negative
+          or non-integer values are left as is.
+
+        Other columns are left as is. The resulting DataFrame is accepted by all accessor methods,
+        where grouping by a categorical ``point_id`` is also faster.
+
+        Parameters
+        ----------
+        report: bool, default False
+            If `True`, also return a report of the memory usage of the converted columns.
+
+        Returns
+        -------
+        :external:class:`~pandas.DataFrame`
+            DataFrame with converted columns.
+        :external:class:`~pandas.DataFrame`
+            Only returned if `report` is `True`. Memory usage in bytes ``before`` and ``after``
+            the conversion, and the memory ``saved``, for each converted column.
+
+        Examples
+        --------
+        >>> df = pd.DataFrame(
+        ...     {
+        ...         "point_id": ["BH-1", "BH-1", "BH-2"],
+        ...         "bottom": [1.0, 2.0, 1.0],
+        ...         "blows_1": [10, 25, None],
+        ...     }
+        ... )
+        >>> df.geotech.optimize().dtypes
+        point_id    category
+        bottom       float64
+        blows_1        UInt8
+        dtype: object
+        """
+        optimized = self._obj.copy()
+        for column in CATEGORICAL_COLUMNS:
+            if column in optimized.columns and not isinstance(
+                optimized[column].dtype, pd.CategoricalDtype
+            ):
+                optimized[column] = optimized[column].astype("category")
+        for column in UNSIGNED_COLUMNS:
+            if column in optimized.columns:
+                optimized[column] = _downcast_unsigned(optimized[column])
+
+        if not report:
+            return optimized
+
+        columns = [
+            column
+            for column in optimized.columns
+            if optimized[column].dtype != self._obj[column].dtype
+        ]
+        memory = pd.DataFrame(
+            {
+                "before": self._obj[columns].memory_usage(index=False, deep=True),
+                "after": optimized[columns].memory_usage(index=False, deep=True),
+            }
+        )
+        memory["saved"] = memory["before"] - memory["after"]
+        return optimized, memory
@@ -1,7 +1,14 @@
 """Common base class used throughout the geotech-pandas package."""
 
+from collections.abc import Callable
+from typing import Any, cast
+
+import numpy as np
 import pandas as pd
 
+from geotech_pandas.kernels import get_groups, group_is_increasing
+from geotech_pandas.profiling import profiled
+
 
 class GeotechPandasBase:
     """Base class with common validation methods for :external:class:`~pandas.DataFrame` objects."""
@@ -14,6 +21,217 @@ class GeotechPandasBase:
         self._validate_monotony()
         self._validate_duplicates()
 
+    def _get_float_array(
+        self, columns: list[str], positions: np.ndarray | None = None
+    ) -> np.ndarray:
+        """Return the values of the columns as a ``float64`` array with `NaN` for missing values.
+
+        This lets the calculations run on raw arrays regardless of the dtype backend of the
+        :external:class:`~pandas.DataFrame`. The columns are gathered one at a time into the
+        array, so no intermediate copy of the selected columns is made.
+
+        Parameters
+        ----------
+        columns : list of str
+            List of column names to get.
+        positions : :external:class:`~numpy.ndarray`, optional
+            Integer positions of the rows to get. If `None`, all rows are returned. Sparse columns
+            are only densified at these rows.
+
+        Returns
+        -------
+        :external:class:`~numpy.ndarray`
+            Array with a column for each of the given columns.
+        """
+        values = np.empty(
+            (len(self._obj) if positions is None else len(positions), len(columns)),
+            dtype="float64",
+        )
+        for i, column in enumerate(columns):
+            series = self._obj[column]
+            if positions is not None:
+                series = series.take(positions)
+            values[:, i] = series.to_numpy(dtype="float64", na_value=np.nan)
+        return values
+
+    def _is_sparse(self, columns: list[str]) -> bool:
+        """Return `True` if any of the columns has a :external:class:`~pandas.SparseDtype`."""
+        return any(isinstance(self._obj[column].dtype, pd.SparseDtype) for column in columns)
+
+    def _get_populated_positions(self, columns: list[str]) -> np.ndarray:
+        """Return the positions of the rows where any of the columns has a value.
+
+        For sparse columns, only the stored values are checked, so sparsely-populated columns like
+        laboratory test results are never densified.
+
+        Parameters
+        ----------
+        columns : list of str
+            List of column names to check.
+
+        Returns
+        -------
+        :external:class:`~numpy.ndarray`
+            Sorted integer positions of the populated rows.
+        """
+        populated = np.zeros(len(self._obj), dtype=bool)
+        for column in columns:
+            series = self._obj[column]
+            if isinstance(series.dtype, pd.SparseDtype) and pd.isna(series.dtype.fill_value):
+                values = cast(pd.arrays.SparseArray, series.array)
+                stored = values.sp_index.to_int_index().indices  # type: ignore[attr-defined]
+                populated[stored[pd.notna(values.sp_values)]] = True
+            else:
+                populated |= series.notna().to_numpy()
+        return np.flatnonzero(populated)
+
+    def _scatter(self, values: np.ndarray, positions: np.ndarray) -> np.ndarray:
+        """Return a ``float64`` array aligned with the DataFrame from the values at `positions`.
+
+        The rows that are not in `positions` are filled with `NaN`.
+
+        Parameters
+        ----------
+        values : :external:class:`~numpy.ndarray`
+            Values at the given positions.
+        positions : :external:class:`~numpy.ndarray`
+            Integer positions of the values.
+
+        Returns
+        -------
+        :external:class:`~numpy.ndarray`
+            Array with the values scattered back to their rows.
+        """
+        data = np.full(len(self._obj), np.nan)
+        data[positions] = values
+        return data
+
+    def _get_numeric_dtype(self, columns: list[str], integer: bool = True) -> str | pd.SparseDtype:
+        """Return the dtype of a numeric result calculated from the columns.
+
+        The result is nullable if any of the columns has an extension dtype, and is sparse if any of
+        the columns is sparse.
+
+        Parameters
+        ----------
+        columns : list of str
+            List of column names used in the calculation.
+        integer : bool, default True
+            If `True`, the result is an integer if all the columns are integers. Otherwise, the
+            result is always a float.
+
+        Returns
+        -------
+        str or :external:class:`~pandas.SparseDtype`
+            One of ``"Int64"``, ``"Float64"``, ``"int64"`` or ``"float64"``, or a sparse ``float64``
+            dtype with `NaN` as the fill value.
+        """
+        dtypes = [self._obj[column].dtype for column in columns]
+        if any(isinstance(dtype, pd.SparseDtype) for dtype in dtypes):
+            return pd.SparseDtype("float64", np.nan)
+
+        nullable = any(isinstance(dtype, pd.api.extensions.ExtensionDtype) for dtype in dtypes)
+        integer = integer and all(pd.api.types.is_integer_dtype(dtype) for dtype in dtypes)
+        if nullable:
+            return "Int64" if integer else "Float64"
+        return "int64" if integer else "float64"
+
+    def _to_series(
+        self, values: np.ndarray, na: np.ndarray, name: str, dtype: str | pd.SparseDtype
+    ) -> pd.Series:
+        """Return a :external:class:`~pandas.Series` aligned with the DataFrame.
+
+        The values and the mask are wrapped without copying where the dtype allows it. A ``"bool"``
+        dtype becomes ``"boolean"`` and an ``"int64"`` dtype becomes ``"float64"`` when there are
+        missing values.
+
+        Parameters
+        ----------
+        values : :external:class:`~numpy.ndarray`
+            ``float64`` or boolean values.
+        na : :external:class:`~numpy.ndarray`
+            Boolean mask of the missing values.
+        name : str
+            Name of the resulting series.
+        dtype : str or :external:class:`~pandas.SparseDtype`
+            One of ``"bool"``, ``"boolean"``, ``"Int64"``, ``"Float64"``, ``"int64"`` or
+            ``"float64"``, or a sparse dtype.
+
+        Returns
+        -------
+        :external:class:`~pandas.Series`
+            Series with `NA` where `na` is `True`.
+        """
+        has_na = na.any()
+        data: Any
+        if isinstance(dtype, pd.SparseDtype):
+            data = pd.arrays.SparseArray(np.where(na, np.nan, values), fill_value=np.nan)
+        elif dtype == "boolean" or (dtype == "bool" and has_na):
+            data = pd.arrays.BooleanArray(values.astype(bool), na)
+        elif dtype == "bool":
+            data = values.astype(bool)
+        elif dtype == "Int64":
+            data = pd.arrays.IntegerArray(np.where(na, 0, values).astype("int64"), na)
+        elif dtype == "Float64":
+            data = pd.arrays.FloatingArray(values.astype("float64"), na)
+        elif dtype == "int64" and not has_na:
+            data = values.astype("int64")
+        else:
+            data = np.where(na, np.nan, values)
+        return pd.Series(data, index=self._obj.index, name=name)
+
+    def _get_result(
+        self,
+        values: np.ndarray,
+        na: np.ndarray,
+        as_array: bool,
+        name: str,
+        dtype: str | pd.SparseDtype,
+    ) -> pd.Series | tuple[np.ndarray, np.ndarray]:
+        """Return the result of an accessor method as arrays or as a Series.
+
+        Parameters
+        ----------
+        values : :external:class:`~numpy.ndarray`
+            ``float64`` or boolean values.
+        na : :external:class:`~numpy.ndarray`
+            Boolean mask of the missing values.
+        as_array : bool
+            If `True`, `values` and `na` are returned as is.
+        name : str
+            Name of the resulting series.
+        dtype : str or :external:class:`~pandas.SparseDtype`
+            Dtype of the resulting series, see :meth:`_to_series`.
+
+        Returns
+        -------
+        :external:class:`~pandas.Series` or tuple of :external:class:`~numpy.ndarray`
+            Series with the result, or the values and the mask if `as_array` is `True`.
+        """
+        if as_array:
+            return values, na
+        return self._to_series(values, na, name, dtype)
+
+    def _get_arrays(
+        self, method: Callable[..., Any], *args, **kwargs
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Call an accessor method with ``as_array=True`` and return its values and mask.
+
+        Parameters
+        ----------
+        method : callable
+            Accessor method that accepts `as_array`.
+        *args, **kwargs
+            Arguments passed to `method`.
+
+        Returns
+        -------
+        tuple of :external:class:`~numpy.ndarray`
+            Values and boolean mask of the missing values.
+        """
+        return method(*args, as_array=True, **kwargs)
+
+    @profiled
     def _validate_columns(self, columns: list[str] | None = None) -> None:
         """
         Validate if the :external:class:`~pandas.DataFrame` contains the columns from a provided
@@ -45,6 +263,7 @@ class GeotechPandasBase:
                 f"column{'s' if len(missing_columns) > 1 else ''}."
             )
 
+    @profiled
     def _validate_monotony(self) -> None:
         """
         Validate if the ``bottom`` of each ``point_id`` group is monotonically increasing.
@@ -54,15 +273,16 @@ class GeotechPandasBase:
         AttributeError
             When ``bottom`` is not monotonically increasing in one or more ``point_id``.
         """
-        g = self._obj.groupby("point_id")
-        check_df = pd.Series(g["bottom"].is_monotonic_increasing).to_frame().reset_index()
-        check_list = check_df[~check_df["bottom"]]["point_id"].to_list()
-        if ~check_df["bottom"].all():
+        order, offsets, labels = get_groups(self._obj["point_id"])
+        bottom = self._get_float_array(["bottom"])[:, 0]
+        increasing = group_is_increasing(bottom[order], offsets)
+        if not increasing.all():
             raise AttributeError(
                 f"Elements in the bottom column must be monotonically increasing for:"
-                f" {', '.join(check_list)}."
+                f" {', '.join(map(str, labels[~increasing]))}."
             )
 
+    @profiled
     def _validate_duplicates(self) -> None:
         """
         Validate the :external:class:`~pandas.DataFrame` for duplicate value pairs in the
@@ -73,8 +293,8 @@ class GeotechPandasBase:
         AttributeError
             When duplicate value pairs in the ``point_id`` and ``bottom`` columns are detected.
         """  # noqa: D205
-        duplicate_list = self._obj[self._obj[["point_id", "bottom"]].duplicated()][
-            "point_id"
+        duplicate_list = self._obj.loc[
+            self._obj.duplicated(subset=["point_id", "bottom"]), "point_id"
         ].to_list()
         if len(duplicate_list) > 0:
             raise AttributeError(
@@ -82,6 +302,7 @@ class GeotechPandasBase:
                 f" {', '.join(duplicate_list)}."
             )
 
+    @profiled
     def _validate_column_values(self, column: str, valid_values: list) -> None:
         """Validate that all non-NA values in a column are within the valid list of values.
 
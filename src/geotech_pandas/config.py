@@ -0,0 +1,185 @@
+"""Global options that control the behavior of geotech-pandas."""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+_DEFAULTS: dict[str, Any] = {
+    "dtype_backend": None,
+    "kernel_backend": "auto",
+    "profile": False,
+    "profile.log": False,
+    "profile.memory": False,
+}
+
+_CHOICES: dict[str, list] = {
+    "dtype_backend": [None, "numpy", "numpy_nullable", "pyarrow"],
+    "kernel_backend": ["auto", "numba", "numpy"],
+}
+
+_options: dict[str, Any] = dict(_DEFAULTS)
+
+
+def _validate_key(key: str) -> None:
+    """Validate if `key` is a known option.
+
+    Parameters
+    ----------
+    key: str
+        Name of the option.
+
+    Raises
+    ------
+    KeyError
+        When `key` is not a known option.
+    """
+    if key not in _DEFAULTS:
+        raise KeyError(
+            f"Unknown option: '{key}'. Valid options are: {', '.join(sorted(_DEFAULTS))}."
+        )
+
+
+def _validate_value(key: str, value: Any) -> None:
+    """Validate if `value` is a valid choice for the option `key`.
+
+    Parameters
+    ----------
+    key: str
+        Name of the option.
+    value: Any
+        Value of the option.
+
+    Raises
+    ------
+    ValueError
+        When `value` is not a valid choice for the option.
+    """
+    if key in _CHOICES and value not in _CHOICES[key]:
+        raise ValueError(
+            f"Invalid value for option '{key}': {value!r}. Valid values are: {_CHOICES[key]}"
+        )
+
+
+def get_option(key: str) -> Any:
+    """Return the current value of an option.
+
+    Parameters
+    ----------
+    key: str
+        Name of the option.
+
+    Returns
+    -------
+    Any
+        Current value of the option.
+
+    Raises
+    ------
+    KeyError
+        When `key` is not a known option.
+
+    Examples
+    --------
+    >>> import geotech_pandas
+    >>> geotech_pandas.get_option("profile")
+    False
+    """
+    _validate_key(key)
+    return _options[key]
+
+
+def set_option(key: str, value: Any) -> None:
+    """Set the value of an option.
+
+    The following options are available:
+
+    - ``dtype_backend``: Dtype backend of the results of the accessor methods. If ``"numpy"``,
+      results use NumPy dtypes where missing values are `NaN`. If ``"numpy_nullable"``, results use
+      the nullable ``Int64``, ``Float64``, ``boolean`` and ``string`` dtypes. If ``"pyarrow"``,
+      results use :external:class:`~pandas.ArrowDtype` dtypes, which requires pyarrow. If `None`,
+      the default, results keep the dtypes of their calculation.
+    - ``kernel_backend``: Backend of the loops over the layers of each point, see
+      :mod:`geotech_pandas.kernels`. If ``"numba"``, the loops are compiled with Numba, which
+      requires numba. If ``"numpy"``, equivalent NumPy implementations are used. If ``"auto"``, the
+      default, Numba is used for large arrays when it is installed.
+    - ``profile``: If `True`, accessor calls and their internal phases are recorded by the session
+      profiler, see :func:`geotech_pandas.profiling.get_profiler`.
+    - ``profile.log``: If `True`, each recorded call is also emitted as a structured log event
+      through the ``geotech_pandas.profiling`` logger.
+    - ``profile.memory``: If `True`, the session profiler also records the peak memory, the
+      allocated memory and the ratio of the peak memory to the memory of the DataFrame of each
+      call.
+
+    Parameters
+    ----------
+    key: str
+        Name of the option.
+    value: Any
+        New value of the option.
+
+    Raises
+    ------
+    KeyError
+        When `key` is not a known option.
+    ValueError
+        When `value` is not a valid choice for the option.
+    """
+    _validate_key(key)
+    _validate_value(key, value)
+    _options[key] = value
+
+
+def reset_option(key: str) -> None:
+    """Reset an option to its default value.
+
+    Parameters
+    ----------
+    key: str
+        Name of the option.
+
+    Raises
+    ------
+    KeyError
+        When `key` is not a known option.
+    """
+    _validate_key(key)
+    _options[key] = _DEFAULTS[key]
+
+
+@contextmanager
+def option_context(**options: Any) -> Iterator[None]:
+    """Temporarily set options inside a ``with`` block.
+
+    Since option names may contain dots, pass them with dictionary unpacking.
+
+    Parameters
+    ----------
+    **options
+        Option names and their temporary values.
+
+    Raises
+    ------
+    KeyError
+        When any of the options is not a known option.
+    ValueError
+        When any of the values is not a valid choice for its option.
+
+    Examples
+    --------
+    >>> import geotech_pandas
+    >>> with geotech_pandas.option_context(**{"profile.log": True}):
+    ...     geotech_pandas.get_option("profile.log")
+    True
+    >>> geotech_pandas.get_option("profile.log")
+    False
+    """
+    for key, value in options.items():
+        _validate_key(key)
+        _validate_value(key, value)
+
+    previous = {key: _options[key] for key in options}
+    _options.update(options)
+    try:
+        yield
+    finally:
+        _options.update(previous)
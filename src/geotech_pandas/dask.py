@@ -0,0 +1,207 @@
+"""Support for the ``geotech`` accessor on :external:class:`dask.dataframe.DataFrame` objects.
+
+Importing this module registers a ``geotech`` accessor on Dask DataFrames that mirrors the
+namespaces and methods of the pandas ``geotech`` accessor. Each method is mapped over the
+partitions with :external:meth:`dask.dataframe.DataFrame.map_partitions`, so calculations run
+out-of-core and in parallel, while the metadata of the result is given by the same method on the
+empty metadata of the DataFrame.
+
+Since pandas results with NumPy dtypes change their dtype when they have missing values, booleans
+become ``boolean`` (or ``object`` with the ``"numpy"`` dtype backend) and integers become
+``float64`` in the metadata, and each partition is cast to the dtypes of the metadata. This way
+the dtypes of the result never depend on which partitions have missing values.
+
+Calculations that group layers by :term:`point_id` require that no point spans two partitions,
+see :func:`align_partitions` and :meth:`DaskGeotechAccessor.validate`.
+"""
+
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+try:
+    import dask.dataframe as dd
+except ImportError as error:
+    raise ImportError("dask[dataframe] is required for geotech_pandas.dask.") from error
+
+from geotech_pandas.accessor import GeotechDataFrameAccessor
+from geotech_pandas.config import get_option
+from geotech_pandas.utils import call_method
+
+_PARTITION = "__geotech_partition"
+_ROW = "__geotech_row"
+
+
+def _call(
+    df: pd.DataFrame,
+    path: tuple[str, ...],
+    args: tuple,
+    kwargs: dict[str, Any],
+    dtypes: Any = None,
+) -> Any:
+    """Call the method at `path` of the ``geotech`` accessor of a partition.
+
+    If `dtypes` is given, the result is cast to them, see :func:`_get_meta`.
+    """
+    result = call_method(df, path, *args, **kwargs)
+    return result if dtypes is None else result.astype(dtypes)
+
+
+def _get_fixed_dtype(dtype: Any) -> Any:
+    """Return the dtype that a result of `dtype` has in any partition, with or without `NA`."""
+    if dtype == np.dtype("bool"):
+        return np.dtype(object) if get_option("dtype_backend") == "numpy" else pd.BooleanDtype()
+    if dtype == np.dtype("int64"):
+        return np.dtype("float64")
+    return dtype
+
+
+def _get_meta(meta: pd.DataFrame | pd.Series) -> tuple[pd.DataFrame | pd.Series, Any]:
+    """Return the metadata with fixed dtypes and the dtypes to cast each partition to."""
+    if isinstance(meta, pd.Series):
+        dtypes: Any = _get_fixed_dtype(meta.dtype)
+    else:
+        dtypes = {column: _get_fixed_dtype(dtype) for column, dtype in meta.dtypes.items()}
+    return meta.astype(dtypes), dtypes
+
+
+def _get_point_ids(df: pd.DataFrame) -> pd.DataFrame:
+    """Validate a partition and return its unique :term:`point_id` values."""
+    df.geotech  # noqa: B018
+    return pd.DataFrame({"point_id": df["point_id"].dropna().unique()})
+
+
+def _add_order(df: pd.DataFrame, partition_info: dict | None = None) -> pd.DataFrame:
+    """Add the partition number and the row number of each layer of a partition."""
+    number = 0 if partition_info is None else partition_info["number"]
+    return df.assign(**{_PARTITION: number, _ROW: np.arange(len(df))})
+
+
+def _restore_order(df: pd.DataFrame) -> pd.DataFrame:
+    """Sort the layers of a partition back to their original order."""
+    return df.sort_values([_PARTITION, _ROW], kind="stable").drop(columns=[_PARTITION, _ROW])
+
+
+def align_partitions(ddf: dd.DataFrame, npartitions: int | None = None) -> dd.DataFrame:
+    """Repartition a Dask DataFrame so that no :term:`point_id` spans two partitions.
+
+    The layers are shuffled by :term:`point_id`, while the layers of each point keep their
+    original order.
+
+    Parameters
+    ----------
+    ddf: :external:class:`dask.dataframe.DataFrame`
+        Dask DataFrame with a :term:`point_id` column.
+    npartitions: int, optional
+        Number of partitions of the result. If `None`, the number of partitions of `ddf` is kept.
+
+    Returns
+    -------
+    :external:class:`dask.dataframe.DataFrame`
+        Dask DataFrame with the layers of each point in a single partition.
+    """
+    ordered = ddf.map_partitions(_add_order, meta=_add_order(ddf._meta))
+    shuffled = ordered.shuffle(on="point_id", npartitions=npartitions)
+    return shuffled.map_partitions(_restore_order, meta=ddf._meta)
+
+
+class _DaskNamespace:
+    """Namespace that maps the methods of a pandas accessor over the partitions of a Dask
+    DataFrame.
+    """  # noqa: D205
+
+    def __init__(self, ddf: dd.DataFrame, accessor: type, path: tuple[str, ...]) -> None:
+        self._obj = ddf
+        self._accessor = accessor
+        self._path = path
+
+    def __dir__(self) -> list[str]:
+        return [name for name in dir(self._accessor) if not name.startswith("_")]
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = None if name.startswith("_") else getattr(self._accessor, name, None)
+        if isinstance(attribute, type):
+            return _DaskNamespace(self._obj, attribute, (*self._path, name))
+        if not callable(attribute):
+            raise AttributeError(f"{self._accessor.__name__!r} object has no attribute {name!r}")
+
+        path = (*self._path, name)
+
+        def method(*args: Any, **kwargs: Any) -> dd.DataFrame | dd.Series:
+            meta = _call(self._obj._meta, path, args, kwargs)
+            if not isinstance(meta, pd.DataFrame | pd.Series):
+                raise TypeError(
+                    f"{'.'.join(path)} must return a Series or DataFrame to be used with Dask."
+                )
+            meta, dtypes = _get_meta(meta)
+            return self._obj.map_partitions(_call, path, args, kwargs, dtypes, meta=meta)
+
+        method.__name__ = name
+        method.__doc__ = attribute.__doc__
+        return method
+
+
+@dd.extensions.register_dataframe_accessor("geotech")
+class DaskGeotechAccessor(_DaskNamespace):
+    """:external:class:`dask.dataframe.DataFrame` accessor that mirrors the pandas ``geotech``
+    accessor.
+
+    Subaccessors are accessed like in pandas, such as ``ddf.geotech.in_situ.spt``, and their
+    methods return lazy Dask collections with the same dtypes as in pandas, except that booleans
+    and integers of NumPy dtypes are widened as described in :mod:`geotech_pandas.dask`. Each
+    partition is validated when it is computed.
+
+    Parameters
+    ----------
+    ddf: :external:class:`dask.dataframe.DataFrame`
+        Dask DataFrame where no :term:`point_id` spans two partitions.
+
+    Raises
+    ------
+    AttributeError
+        When the DataFrame does not have the :term:`point_id` and :term:`bottom` columns.
+
+    Examples
+    --------
+    >>> import dask.dataframe as dd
+    >>> import geotech_pandas.dask
+    >>> df = pd.DataFrame({"point_id": ["BH-1", "BH-1", "BH-2"], "bottom": [1.0, 2.0, 1.5]})
+    >>> ddf = geotech_pandas.dask.align_partitions(dd.from_pandas(df, npartitions=2))
+    >>> ddf.geotech.validate()
+    >>> ddf.geotech.layer.get_top().compute().sort_index()
+    0    0.0
+    1    1.0
+    2    0.0
+    Name: top, dtype: float64
+    """  # noqa: D205
+
+    def __init__(self, ddf: dd.DataFrame) -> None:
+        missing = [column for column in ["point_id", "bottom"] if column not in ddf.columns]
+        if missing:
+            raise AttributeError(
+                f"The DataFrame must have: {', '.join(missing)} "
+                f"column{'s' if len(missing) > 1 else ''}."
+            )
+        super().__init__(ddf, GeotechDataFrameAccessor, ())
+
+    def validate(self) -> None:
+        """Validate every partition and check that no :term:`point_id` spans two partitions.
+
+        This computes the DataFrame.
+
+        Raises
+        ------
+        AttributeError
+            When a partition fails the validation of the pandas ``geotech`` accessor, or when a
+            :term:`point_id` spans two partitions.
+        """
+        point_id = self._obj.map_partitions(
+            _get_point_ids, meta=pd.DataFrame({"point_id": self._obj._meta["point_id"]})
+        ).compute()["point_id"]
+        split = point_id[point_id.duplicated()].unique()
+        if len(split):
+            raise AttributeError(
+                "Points must not span two partitions, use align_partitions first for: "
+                f"{', '.join(map(str, split))}."
+            )
@@ -1,58 +1,110 @@
 """General helper methods."""
 
-import pandas as pd
-import statsmodels.api as sm
+import numpy as np
 
+from geotech_pandas.profiling import profiled
 
-def _get_linear_forecast(
-    group: pd.DataFrame,
-    x_col_name: str,
-    y_col_name: str,
-    x_target: float | int,
-) -> float:
-    """Return a linear regression forecast for a given target value.
 
-    This method fits a linear regression model to the provided data and predicts the target value
-    based on the input target.
+@profiled
+def _get_linear_fits(
+    x: np.ndarray, y: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Return the least-squares lines through the points of each row.
+
+    The lines are solved in closed form with masked sums over the rows, so every row is fitted at
+    once. Points where either `x` or `y` is `NaN` are excluded from the fit of their row.
 
     Parameters
     ----------
-    group : pd.DataFrame
-        The DataFrame group containing the data for the regression.
-    x_col_name : str
-        The name of the column in the DataFrame to be used as the independent variable.
-    y_col_name : str
-        The name of the column in the DataFrame to be used as the dependent variable.
-    x_target : float or int
-        The target value for which the forecast is to be made.
+    x : :external:class:`~numpy.ndarray`
+        ``float64`` independent variables with a row for each line and a column for each point.
+    y : :external:class:`~numpy.ndarray`
+        ``float64`` dependent variables with the same shape as `x`.
 
     Returns
     -------
-    float
-        The predicted value based on the linear regression model.
+    tuple of :external:class:`~numpy.ndarray`
+        Intercept, slope and coefficient of determination of the line of each row, and the number
+        of points of each row. Rows with less than two points or without two different `x` values
+        have a `NaN` line, and rows where all the `y` values are equal have a `NaN` coefficient of
+        determination.
+
+    Examples
+    --------
+    >>> intercept, slope, r_squared, count = _get_linear_fits(
+    ...     np.array([[1.0, 2.0, 3.0, 4.0]]), np.array([[2.0, 3.0, 5.0, 6.0]])
+    ... )
+    >>> intercept + slope * 5
+    array([7.5])
+    """
+    valid = ~(np.isnan(x) | np.isnan(y))
+    count = valid.sum(axis=1)
+    x = np.where(valid, x, 0.0)
+    y = np.where(valid, y, 0.0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x_mean = x.sum(axis=1) / count
+        y_mean = y.sum(axis=1) / count
+        dx = np.where(valid, x - x_mean[:, np.newaxis], 0.0)
+        dy = np.where(valid, y - y_mean[:, np.newaxis], 0.0)
+        sxx = (dx * dx).sum(axis=1)
+        sxy = (dx * dy).sum(axis=1)
+        syy = (dy * dy).sum(axis=1)
+
+        fitted = (count >= 2) & (sxx > 0)  # noqa: PLR2004
+        slope = np.where(fitted, sxy / sxx, np.nan)
+        intercept = y_mean - slope * x_mean
+        r_squared = np.where(fitted, sxy * sxy / (sxx * syy), np.nan)
+
+    return intercept, slope, r_squared, count
+
 
-    Notes
-    -----
-    This method uses the statsmodels library to perform the linear regression. It drops any rows
-    with NaN values in the specified columns before fitting the model.
+@profiled
+def _interpolate_rows(xp: np.ndarray, fp: np.ndarray, x: np.ndarray) -> np.ndarray:
+    """Return the linear interpolations of each row at the same points.
+
+    Each row is a curve of `xp` and `fp` values, where the `xp` values are nondecreasing and any
+    `NaN` values are at the end of the row. The segment of each point is found with a vectorized
+    search over the sorted rows, so every row is interpolated at once.
+
+    Parameters
+    ----------
+    xp : :external:class:`~numpy.ndarray`
+        ``float64`` x-coordinates with a row for each curve and a column for each point.
+    fp : :external:class:`~numpy.ndarray`
+        ``float64`` y-coordinates with the same shape as `xp`.
+    x : :external:class:`~numpy.ndarray`
+        ``float64`` x-coordinates to interpolate each curve at.
+
+    Returns
+    -------
+    :external:class:`~numpy.ndarray`
+        Interpolated values with a row for each curve and a column for each of `x`, which are
+        `NaN` where `x` is outside of the curve. Where a curve has a run of equal `xp` values at
+        `x`, the first of its `fp` values is returned.
 
     Examples
     --------
-    >>> df = pd.DataFrame(
-    ...     {
-    ...         "x": [1, 2, 3, 4],
-    ...         "y": [2, 3, 5, 6],
-    ...     }
+    >>> _interpolate_rows(
+    ...     np.array([[1.0, 2.0, 4.0], [1.0, 3.0, np.nan]]),
+    ...     np.array([[10.0, 20.0, 40.0], [10.0, 30.0, np.nan]]),
+    ...     np.array([1.5, 3.0, 5.0]),
     ... )
-    >>> _get_linear_forecast(df, "x", "y", 5)
-    np.float64(7.499999999999997)
+    array([[15., 30., nan],
+           [15., 30., nan]])
     """
-    group = group.dropna(subset=[x_col_name, y_col_name])
-    x = group[x_col_name].astype(float)
-    y = group[y_col_name].astype(float)
-    x = sm.add_constant(x)
-    model = sm.OLS(y, x).fit()
-    target = [1, x_target]
-    forecast = model.predict(target)
-
-    return forecast[0]
+    count = (~np.isnan(xp)).sum(axis=1)[:, np.newaxis]
+    # The number of points of each row below `x` is where `x` would be inserted in the row.
+    index = (xp[:, np.newaxis, :] < x[np.newaxis, :, np.newaxis]).sum(axis=2)
+    upper = np.minimum(index, xp.shape[1] - 1)
+    lower = np.maximum(index - 1, 0)
+
+    x0 = np.take_along_axis(xp, lower, axis=1)
+    x1 = np.take_along_axis(xp, upper, axis=1)
+    f0 = np.take_along_axis(fp, lower, axis=1)
+    f1 = np.take_along_axis(fp, upper, axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        values = np.where(x1 == x0, f1, f0 + (x - x0) / (x1 - x0) * (f1 - f0))
+
+    inside = (index < count) & ((index > 0) | (xp[:, :1] == x))
+    return np.where(inside, values, np.nan)
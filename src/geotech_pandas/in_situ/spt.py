@@ -1,36 +1,644 @@
 """Subaccessor that contains SPT-related methods."""
 
 import warnings
+from collections.abc import Callable
+from typing import Any, cast
 
+import numpy as np
 import pandas as pd
 
 from geotech_pandas.base import GeotechPandasBase
+from geotech_pandas.kernels import get_groups
+from geotech_pandas.profiling import profiled
+from geotech_pandas.utils import with_dtype_backend
 
 PEN_INC_MIN = 150
 PEN_TOTAL_MIN = 450
 BLOWS_INC_MAX = 50
 BLOWS_TOTAL_MAX = 100
 
+# Columns of the blows and penetrations of the three increments, in the order they are read.
+SPT_COLUMNS = ["blows_1", "blows_2", "blows_3", "pen_1", "pen_2", "pen_3"]
+
+# Values, missing value mask and dtype of each SPT result by name.
+_Results = dict[str, tuple[np.ndarray, np.ndarray, str | pd.SparseDtype]]
+
+# Columns that identify the hammer of a sample.
+HAMMER_COLUMNS = ["spt_hammer_country_ref", "spt_hammer_type", "spt_hammer_release"]
+
+# Typical hammer efficiency factors by country, hammer type and hammer release.
+HAMMER_EFFICIENCY_FACTORS = [
+    # Japan
+    ("jp", "donut hammer", "free fall", 0.78),
+    ("jp", "donut hammer", "rope and pulley", 0.67),
+    # United States
+    ("us", "safety hammer", "rope and pulley", 0.60),
+    ("us", "donut hammer", "rope and pulley", 0.45),
+    # Argentina
+    ("ar", "donut hammer", "rope and pulley", 0.45),
+    # China
+    ("cn", "donut hammer", "free fall", 0.60),
+    ("cn", "donut hammer", "rope and pulley", 0.50),
+]
+
+# Energy ratio that the N-value is normalized to, as a fraction of the theoretical free-fall energy.
+ENERGY_RATIO = 0.60
+
+# Rod length correction factors for rod lengths from each bin edge in meters up to the next, from
+# Youd et al. (2001).
+ROD_LENGTH_BINS = [0.0, 3.0, 4.0, 6.0, 10.0, np.inf]
+ROD_LENGTH_CORRECTION_FACTORS = [0.75, 0.80, 0.85, 0.95, 1.00]
+
+# Borehole diameter correction factors for diameters over each bin edge in millimeters up to the
+# next, from Youd et al. (2001).
+BOREHOLE_DIAMETER_BINS = [0.0, 115.0, 150.0, 200.0]
+BOREHOLE_DIAMETER_CORRECTION_FACTORS = [1.00, 1.05, 1.15]
+
+# Sampler correction factors by sampler type, where samplers without liners use the middle of the
+# range of 1.1 to 1.3 from Youd et al. (2001).
+SAMPLER_CORRECTION_FACTORS = {"standard sampler": 1.00, "sampler without liners": 1.20}
+
+# Pattern of the strings of `get_report`, with groups for the blows and partial penetration of each
+# increment, and for each remark.
+_NUMBER = r"\d+(?:\.\d+)?"
+REPORT_PATTERN = (
+    "^(?P<_report>"
+    + ",".join(rf"(?:(?P<blows_{i}>{_NUMBER})(?:/(?P<pen_{i}>{_NUMBER})mm)?|-)" for i in (1, 2, 3))
+    + rf" N=(?:{_NUMBER}(?:/{_NUMBER}mm)?)?(?P<is_refusal>\(R\))?(?P<is_hammer_weight>\(HW\))?)$"
+)
+
+# Clean-sand corrected N-value from which sands are too dense to liquefy, from Youd et al. (2001).
+N1_60CS_MAX = 30.0
+
+# Depth in meters down to which layers contribute to the liquefaction potential index, from Iwasaki
+# et al. (1978).
+LIQUEFACTION_INDEX_MAX_DEPTH = 20.0
+
+# Registered hammer efficiency factors by country, hammer type and hammer release, which start as
+# the typical factors and may be extended with calibrated factors.
+_hammer_efficiency_factors: dict[tuple[str, str, str], float] = {
+    (country, hammer_type, release): factor
+    for country, hammer_type, release, factor in HAMMER_EFFICIENCY_FACTORS
+}
+
+
+def register_hammer_efficiency_factor(
+    country: str, hammer_type: str, release: str, factor: float
+) -> None:
+    """Register the hammer efficiency factor of a country, hammer type and hammer release.
+
+    Registered factors are used by
+    :meth:`~pandas.DataFrame.geotech.in_situ.spt.get_typical_hammer_efficiency_factor`, where the
+    registered values of each column also become valid values. Registering a known hammer replaces
+    its factor, so calibrated factors can be used instead of the typical factors.
+
+    Parameters
+    ----------
+    country: str
+        Referenced country of the SPT practice, such as ``"jp"``.
+    hammer_type: str
+        Type of the hammer, such as ``"donut hammer"``.
+    release: str
+        Release of the hammer, such as ``"rope and pulley"``.
+    factor: float
+        Hammer efficiency factor, which must be greater than 0 and at most 1.
+
+    Raises
+    ------
+    ValueError
+        When `factor` is not greater than 0 and at most 1.
+
+    Examples
+    --------
+    >>> from geotech_pandas.in_situ import spt
+    >>> spt.register_hammer_efficiency_factor("ph", "safety hammer", "automatic", 0.85)
+    >>> spt.get_hammer_efficiency_factors()["spt_hammer_country_ref"].tolist()
+    ['jp', 'jp', 'us', 'us', 'ar', 'cn', 'cn', 'ph']
+    >>> spt.reset_hammer_efficiency_factors()
+    """
+    if not 0 < factor <= 1:
+        raise ValueError(
+            f"The hammer efficiency factor must be greater than 0 and at most 1, not {factor}."
+        )
+    _hammer_efficiency_factors[(country, hammer_type, release)] = float(factor)
+
+
+def reset_hammer_efficiency_factors() -> None:
+    """Remove the registered hammer efficiency factors and restore the typical factors."""
+    _hammer_efficiency_factors.clear()
+    _hammer_efficiency_factors.update(
+        {
+            (country, hammer_type, release): factor
+            for country, hammer_type, release, factor in HAMMER_EFFICIENCY_FACTORS
+        }
+    )
+
+
+def get_hammer_efficiency_factors() -> pd.DataFrame:
+    """Return the registered hammer efficiency factors.
+
+    Returns
+    -------
+    :external:class:`~pandas.DataFrame`
+        :term:`spt_hammer_country_ref`, :term:`spt_hammer_type`, :term:`spt_hammer_release` and
+        :term:`spt_hammer_efficiency_factor` of each registered hammer.
+    """
+    return pd.DataFrame(
+        [(*hammer, factor) for hammer, factor in _hammer_efficiency_factors.items()],
+        columns=[*HAMMER_COLUMNS, "spt_hammer_efficiency_factor"],
+    )
+
+
+def _get_phi_peck(n1_60: np.ndarray) -> np.ndarray:
+    """Return the friction angle of Peck et al. (1974) as fitted by Wolff (1989)."""
+    return 27.1 + 0.3 * n1_60 - 0.00054 * n1_60**2
+
+
+def _get_phi_hatanaka(n1_60: np.ndarray) -> np.ndarray:
+    """Return the friction angle of Hatanaka and Uchida (1996)."""
+    return np.sqrt(20 * n1_60) + 20
+
+
+def _get_phi_kulhawy(
+    n60: np.ndarray, vertical_effective_stress: np.ndarray, atmospheric_pressure: float
+) -> np.ndarray:
+    """Return the friction angle of Kulhawy and Mayne (1990)."""
+    return np.degrees(
+        np.arctan((n60 / (12.2 + 20.3 * vertical_effective_stress / atmospheric_pressure)) ** 0.34)
+    )
+
+
+def _get_su_stroud(n60: np.ndarray) -> np.ndarray:
+    """Return the undrained shear strength of Stroud (1974) with a factor of 4.4 kPa."""
+    return 4.4 * n60
+
+
+def _get_e_kulhawy(n60: np.ndarray, atmospheric_pressure: float) -> np.ndarray:
+    """Return the Young's modulus of Kulhawy and Mayne (1990) for sands with fines."""
+    return 5 * atmospheric_pressure * n60
+
+
+def _get_dr_skempton(n1_60: np.ndarray) -> np.ndarray:
+    """Return the relative density of Skempton (1986) for normally consolidated sands."""
+    return 100 * np.sqrt(n1_60 / 60)
+
+
+def _get_stress_reduction(depth: np.ndarray) -> np.ndarray:
+    """Return the stress reduction coefficient of Blake (1996) as given by Youd et al. (2001)."""
+    return (1 - 0.4113 * depth**0.5 + 0.04052 * depth + 0.001753 * depth**1.5) / (
+        1 - 0.4177 * depth**0.5 + 0.05729 * depth - 0.006205 * depth**1.5 + 0.001210 * depth**2
+    )
+
+
+# Inputs of the correlations that are calculated from the SPT, instead of being read from a column.
+CORRELATION_INPUTS = ["n_value", "n60", "n1_60", "atmospheric_pressure"]
+
+# Published correlations of soil parameters with their inputs, in the order they are passed.
+CORRELATIONS: list[tuple[str, list[str], Callable[..., Any]]] = [
+    ("phi_peck", ["n1_60"], _get_phi_peck),
+    ("phi_hatanaka", ["n1_60"], _get_phi_hatanaka),
+    (
+        "phi_kulhawy",
+        ["n60", "vertical_effective_stress", "atmospheric_pressure"],
+        _get_phi_kulhawy,
+    ),
+    ("su_stroud", ["n60"], _get_su_stroud),
+    ("e_kulhawy", ["n60", "atmospheric_pressure"], _get_e_kulhawy),
+    ("dr_skempton", ["n1_60"], _get_dr_skempton),
+]
+
+# Registered correlations by name, which start as the published correlations and may be extended
+# with project-specific correlations.
+_correlations: dict[str, tuple[list[str], Callable[..., Any]]] = {
+    name: (inputs, func) for name, inputs, func in CORRELATIONS
+}
+
+
+def register_correlation(name: str, inputs: list[str], func: Callable[..., Any]) -> None:
+    """Register a correlation of a soil parameter with the SPT.
+
+    Registered correlations are used by :meth:`~pandas.DataFrame.geotech.in_situ.spt.correlate`.
+    Registering a known name replaces its correlation.
+
+    Parameters
+    ----------
+    name: str
+        Name of the correlation, which is also the name of its column in the result of
+        :meth:`~pandas.DataFrame.geotech.in_situ.spt.correlate`.
+    inputs: list of str
+        Names of the inputs of the correlation, in the order they are passed to `func`. An input
+        is one of :data:`CORRELATION_INPUTS`, which are calculated from the SPT, or the name of a
+        column of the DataFrame.
+    func: callable
+        Vectorized function that takes a ``float64`` array for each input, except for
+        ``atmospheric_pressure`` which is a float, and returns an array with a value for each
+        row. Missing values are `NaN`.
+
+    Raises
+    ------
+    ValueError
+        When `inputs` is empty.
+    TypeError
+        When `func` is not callable.
+
+    Examples
+    --------
+    >>> from geotech_pandas.in_situ import spt
+    >>> spt.register_correlation("su_hara", ["n_value"], lambda n: 29 * n**0.72)
+    >>> spt.get_correlations()["correlation"].tolist()[-2:]
+    ['dr_skempton', 'su_hara']
+    >>> spt.reset_correlations()
+    """
+    if not inputs:
+        raise ValueError("A correlation must have at least one input.")
+    if not callable(func):
+        raise TypeError(f"The function of a correlation must be callable, not {func!r}.")
+    _correlations[name] = (list(inputs), func)
+
+
+def reset_correlations() -> None:
+    """Remove the registered correlations and restore the published correlations."""
+    _correlations.clear()
+    _correlations.update({name: (inputs, func) for name, inputs, func in CORRELATIONS})
+
+
+def get_correlations() -> pd.DataFrame:
+    """Return the registered correlations.
+
+    Returns
+    -------
+    :external:class:`~pandas.DataFrame`
+        ``correlation`` name and list of ``inputs`` of each registered correlation.
+    """
+    return pd.DataFrame(
+        [(name, inputs) for name, (inputs, _) in _correlations.items()],
+        columns=["correlation", "inputs"],
+    )
+
+
+def _extract_report(strings: np.ndarray) -> pd.DataFrame:
+    """Return the groups of :data:`REPORT_PATTERN` in each string, which are `NA` if not matched.
+
+    The groups are extracted with the regex kernel of Arrow when pyarrow is installed, or with
+    :external:meth:`pandas.Series.str.extract` otherwise.
+    """
+    try:
+        import pyarrow as pa  # noqa: PLC0415
+        import pyarrow.compute as pc  # noqa: PLC0415
+    except ImportError:
+        return pd.Series(strings, dtype="string").str.extract(REPORT_PATTERN)
+
+    groups = pc.extract_regex(pa.array(strings, type=pa.string()), REPORT_PATTERN)
+    # Arrow returns empty strings for optional groups that are not matched.
+    return pd.DataFrame(
+        {
+            field.name: pd.array(
+                pc.if_else(pc.equal(group, ""), None, group).to_pandas(), dtype="string"
+            )
+            for field, group in zip(groups.type, groups.flatten(), strict=True)
+        }
+    )
+
+
+@with_dtype_backend
+def parse_report(series: pd.Series) -> pd.DataFrame:
+    """Return the blows, penetrations and remarks of SPT report strings.
+
+    This is the inverse of :meth:`~pandas.DataFrame.geotech.in_situ.spt.get_report`, which can be
+    used to recover the SPT columns of records that only kept the report strings. Only the unique
+    strings are parsed, with the regex kernel of Arrow when pyarrow is installed.
+
+    The penetration of an increment is 150 mm unless a partial penetration is given, such as
+    ``50/75mm``, while both the blows and penetration of an increment shown as ``-`` are `NA`.
+    Strings that do not follow the format of the report are flagged by the ``is_parsed`` column,
+    where all the other columns are `NA`, instead of raising an error.
+
+    Parameters
+    ----------
+    series: :external:class:`~pandas.Series`
+        :term:`spt_report` strings.
+
+    Returns
+    -------
+    :external:class:`~pandas.DataFrame`
+        :term:`blows_1`, :term:`blows_2`, :term:`blows_3`, :term:`pen_1`, :term:`pen_2`,
+        :term:`pen_3`, :term:`is_refusal` and :term:`is_hammer_weight` columns, and an
+        ``is_parsed`` column that is `False` for strings that could not be parsed. The blows and
+        penetrations are ``Int64`` unless any of them have decimals. All the columns are `NA` for
+        missing strings.
+
+    Examples
+    --------
+    >>> from geotech_pandas.in_situ import spt
+    >>> result = spt.parse_report(
+    ...     pd.Series(["12,25,50/75mm N=75/225mm(R)", "0,0,0 N=0(HW)", "N=12", None])
+    ... )
+    >>> result[["blows_3", "pen_3", "is_refusal", "is_hammer_weight", "is_parsed"]]
+       blows_3  pen_3  is_refusal  is_hammer_weight  is_parsed
+    0       50     75        True             False       True
+    1        0    150       False              True       True
+    2     <NA>   <NA>        <NA>              <NA>      False
+    3     <NA>   <NA>        <NA>              <NA>       <NA>
+    """
+    codes, unique = pd.factorize(series)
+    groups = _extract_report(np.asarray(unique, dtype=object))
+    parsed = groups["_report"].notna()
+
+    columns = {}
+    for i in (1, 2, 3):
+        columns[f"blows_{i}"] = groups[f"blows_{i}"]
+    for i in (1, 2, 3):
+        columns[f"pen_{i}"] = groups[f"pen_{i}"].mask(
+            groups[f"pen_{i}"].isna() & groups[f"blows_{i}"].notna(), str(PEN_INC_MIN)
+        )
+    numbers = pd.DataFrame(columns).astype("float64").convert_dtypes()
+    remarks = groups[["is_refusal", "is_hammer_weight"]].notna().where(parsed).astype("boolean")
+
+    # Missing strings have a code of -1, which is filled with `NA`.
+    return pd.DataFrame(
+        {
+            name: column.array.take(codes, allow_fill=True)
+            for name, column in pd.concat(
+                [numbers, remarks, parsed.astype("boolean").rename("is_parsed")], axis=1
+            ).items()
+        },
+        index=series.index,
+    )
+
+
+def _factorize_strings(series: pd.Series) -> tuple[np.ndarray, list[str | None]]:
+    """Return the codes of the values of `series` and the unique values as strings.
+
+    The unique values are formatted like ``astype("string")`` for the dtype of `series`, so only
+    the unique values are formatted. The strings end with `None`, which is the string of the `NA`
+    values with a code of -1.
+    """
+    codes: np.ndarray
+    codes, unique = pd.factorize(series)
+    strings = pd.Series(unique, dtype=series.dtype).astype("string")
+    return codes, [*(None if pd.isna(string) else str(string) for string in strings), None]
+
+
+def _combine(
+    left: tuple[np.ndarray, list],
+    right: tuple[np.ndarray, list],
+    func: Callable[[Any, Any], Any],
+) -> tuple[np.ndarray, list]:
+    """Return the codes and strings of each unique pair of `left` and `right` strings.
+
+    `func` is only called once for each unique pair of strings that occurs in the rows, which is
+    usually far fewer than the number of rows. The strings end with `None` like in
+    :func:`_factorize_strings`, although every pair has a code.
+    """
+    left_codes, left_strings = left
+    right_codes, right_strings = right
+    size = len(right_strings)
+    codes, unique = pd.factorize(left_codes.astype("int64") * size + right_codes + 1)
+    # Codes of -1 are kept, as they index the trailing `None` of the strings.
+    left_unique, right_unique = np.divmod(unique, size)
+    strings = [
+        func(left_strings[i], right_strings[j - 1])
+        for i, j in zip(left_unique.tolist(), right_unique.tolist(), strict=True)
+    ]
+    return codes, [*strings, None]
+
+
+def _get_bin_factors(
+    values: np.ndarray, bins: list[float], factors: list[float], right: bool = False
+) -> np.ndarray:
+    """Return the factor of the bin of each value, which is `NaN` outside of the bins.
+
+    Parameters
+    ----------
+    values: :external:class:`~numpy.ndarray`
+        ``float64`` values to bin.
+    bins: list of float
+        Increasing edges of the bins, with one more edge than `factors`.
+    factors: list of float
+        Factor of each bin.
+    right: bool, default False
+        If `True`, the bins include their right edge instead of their left edge.
+
+    Returns
+    -------
+    :external:class:`~numpy.ndarray`
+        ``float64`` factors.
+    """
+    table = np.array([np.nan, *factors, np.nan])
+    return table[np.digitize(values, bins, right=right)]
+
+
+def _get_scenarios(magnitudes, pgas) -> tuple[np.ndarray, np.ndarray]:
+    """Return the magnitude and peak ground acceleration of each scenario as flat arrays.
+
+    The magnitudes and peak ground accelerations are broadcast against each other, so a column of
+    magnitudes and a row of accelerations give every combination of the two.
+
+    Raises
+    ------
+    ValueError
+        If the arrays cannot be broadcast together, or if any value is not positive.
+    """
+    magnitude, pga = (
+        np.ravel(values)
+        for values in np.broadcast_arrays(
+            np.asarray(magnitudes, dtype="float64"), np.asarray(pgas, dtype="float64")
+        )
+    )
+    if not ((magnitude > 0).all() and (pga > 0).all()):
+        raise ValueError("Magnitudes and peak ground accelerations must be positive.")
+    return magnitude, pga
+
+
+def _get_scenario_columns(magnitude: np.ndarray, pga: np.ndarray) -> pd.MultiIndex:
+    """Return the columns of the results of each scenario."""
+    return pd.MultiIndex.from_arrays([magnitude, pga], names=["magnitude", "pga"])
+
+
+def _format_remarks(n_value: str | None, remarks: int) -> str | None:
+    """Return the N-value string with the remarks encoded by :meth:`_get_n_value_strings`."""
+    if remarks & 4:
+        n_value = "N="
+    if n_value is None:
+        return None
+    return n_value + "(R)" * bool(remarks & 2) + "(HW)" * bool(remarks & 1)
+
 
 class SPTDataFrameAccessor(GeotechPandasBase):
     """Subaccessor that contains methods related to the Standard Penetration Test (SPT)."""
 
     def __init__(self, accessor) -> None:
         super().__init__(accessor)
-        self._validate_columns(
+        self._validate_columns(["sample_type", "sample_number", *SPT_COLUMNS])
+
+    def _compute(self) -> _Results:
+        """Calculate every SPT result from a single read of the blows and penetrations.
+
+        The results are not kept in the subaccessor, since the DataFrame may change between calls.
+        Methods that depend on several results calculate them once and pass them to the helpers
+        instead.
+
+        Returns
+        -------
+        dict
+            Values, missing value mask and dtype of each result by name.
+        """
+        # Each increment is a contiguous row of the transposed array, so every calculation runs
+        # on whole columns instead of across the rows.
+        values = self._get_float_array(SPT_COLUMNS).T
+        na = np.isnan(values)
+        filled = np.where(na, 0.0, values)
+        blows_1, blows_2, blows_3, pen_1, *_ = values
+        blows_na, pen_na = na[:3], na[3:]
+
+        # Sums are only `NA` if all of the summed increments are `NA`, where the missing
+        # increments are skipped.
+        main_drive = filled[1] + filled[2]
+        main_pen = filled[4] + filled[5]
+        blows_sum = filled[0] + main_drive
+        pen_sum = filled[3] + main_pen
+        main_drive_na = blows_na[1] & blows_na[2]
+        main_pen_na = pen_na[1] & pen_na[2]
+        blows_all_na = blows_na[0] & main_drive_na
+        pen_all_na = pen_na[0] & main_pen_na
+
+        # Only full penetrations of the first increment are part of the seating drive.
+        seating_pen_na = pen_1 != PEN_INC_MIN
+        seating_drive_na = seating_pen_na | blows_na[0]
+        seating_drive = np.where(seating_drive_na, np.nan, blows_1)
+        integer = pd.api.types.is_integer_dtype(self._obj["blows_1"].dtype) or bool(
+            (seating_drive[~seating_drive_na] % 1 == 0).all()
+        )
+
+        max_inc = (
+            (blows_1 >= BLOWS_INC_MAX) | (blows_2 >= BLOWS_INC_MAX) | (blows_3 >= BLOWS_INC_MAX)
+        ) & ~blows_all_na
+        max_total = (blows_sum >= BLOWS_TOTAL_MAX) & ~blows_all_na
+        # Missing penetrations are partial, and `NaN` is never a full penetration.
+        partial = ~(
+            (values[3] >= PEN_INC_MIN) & (values[4] >= PEN_INC_MIN) & (values[5] >= PEN_INC_MIN)
+        )
+        partial &= ~pen_all_na
+        refusal = max_inc | max_total | partial
+
+        # Missing blows of nullable columns are skipped like in `DataFrame.all`, while `NaN`
+        # blows of NumPy columns are never zero like in `DataFrame.eq`.
+        nullable = np.array(
             [
-                "sample_type",
-                "sample_number",
-                "blows_1",
-                "blows_2",
-                "blows_3",
-                "pen_1",
-                "pen_2",
-                "pen_3",
+                isinstance(dtype, pd.api.extensions.ExtensionDtype)
+                and not isinstance(dtype, pd.SparseDtype)
+                for dtype in self._obj[SPT_COLUMNS].dtypes
             ]
         )
+        all_zero = ((values[:3] == 0) | (blows_na & nullable[:3, None])).all(axis=0)
+        # Missing increments leave the booleans unknown, unless all of the columns are NumPy
+        # columns, which have no missing booleans, so the unknown booleans are `False`.
+        if nullable.any():
+            boolean = "boolean"
+            blows_all_na_bool, pen_all_na_bool = blows_all_na, pen_all_na
+        else:
+            boolean = "bool"
+            blows_all_na_bool = pen_all_na_bool = np.zeros(len(all_zero), dtype=bool)
+
+        return {
+            "seating_pen": (
+                np.where(seating_pen_na, np.nan, pen_1),
+                seating_pen_na,
+                "Int64",
+            ),
+            "main_pen": (
+                np.where(main_pen_na, np.nan, main_pen),
+                main_pen_na,
+                self._get_numeric_dtype(["pen_2", "pen_3"]),
+            ),
+            "total_pen": (
+                np.where(pen_all_na, np.nan, pen_sum),
+                pen_all_na,
+                self._get_numeric_dtype(["pen_1", "pen_2", "pen_3"]),
+            ),
+            "seating_drive": (
+                seating_drive,
+                seating_drive_na,
+                "Int64" if integer else "Float64",
+            ),
+            "main_drive": (
+                np.where(main_drive_na, np.nan, main_drive),
+                main_drive_na,
+                self._get_numeric_dtype(["blows_2", "blows_3"]),
+            ),
+            "total_drive": (
+                np.where(blows_all_na, np.nan, blows_sum),
+                blows_all_na,
+                self._get_numeric_dtype(["blows_1", "blows_2", "blows_3"]),
+            ),
+            "_any_blows_max_inc": (max_inc, blows_all_na_bool, boolean),
+            "_any_blows_max_total": (max_total, blows_all_na_bool, boolean),
+            "_any_pen_partial": (partial, pen_all_na_bool, boolean),
+            # Any `True` decides the result, otherwise any `NA` leaves it unknown.
+            "is_refusal": (refusal, ~refusal & (blows_all_na_bool | pen_all_na_bool), boolean),
+            "is_hammer_weight": (
+                all_zero & (pen_sum >= PEN_TOTAL_MIN),
+                all_zero & pen_all_na_bool,
+                boolean,
+            ),
+            # Partial penetrations of each increment, used to format the blows.
+            "_pen_partial": (values[3:] < PEN_INC_MIN, pen_na, "bool"),
+        }
+
+    def _get_computed(
+        self, name: str, as_array: bool = False, results: _Results | None = None
+    ) -> pd.Series | tuple[np.ndarray, np.ndarray]:
+        """Return a copy of a result calculated by :meth:`_compute`."""
+        values, na, dtype = (self._compute() if results is None else results)[name]
+        return self._get_result(values.copy(), na.copy(), as_array, name=name, dtype=dtype)
+
+    @profiled
+    @with_dtype_backend
+    def compute_all(self, refusal=50, limit=False) -> pd.DataFrame:
+        """Return every SPT result of each sample from a single pass over the blows and
+        penetrations.
+
+        The blows and penetrations of the three increments are read once, and every result is
+        calculated from them. This is faster than calling each method separately, which each
+        repeat the same calculation.
+
+        .. admonition:: **Requires:**
+            :class: important
 
-    def get_seating_pen(self) -> pd.Series:
+            | :term:`blows_1`
+            | :term:`blows_2`
+            | :term:`blows_3`
+            | :term:`pen_1`
+            | :term:`pen_2`
+            | :term:`pen_3`
+
+        Parameters
+        ----------
+        refusal: int, default 50
+            Equivalent N-value for samples with total penetration less than 450 mm, see
+            :meth:`get_n_value`.
+        limit: bool, default False
+            If `True`, limits the resulting N-value to `refusal`, see :meth:`get_n_value`.
+
+        Returns
+        -------
+        :external:class:`~pandas.DataFrame`
+            :term:`seating_pen`, :term:`main_pen`, :term:`total_pen`, :term:`seating_drive`,
+            :term:`main_drive`, :term:`total_drive`, :term:`is_refusal`, :term:`is_hammer_weight`
+            and :term:`n_value` columns with the same dtypes as the results of their methods.
+        """  # noqa: D205
+        results = self._compute()
+        columns = {
+            name: self._get_computed(name, results=results)
+            for name in results
+            if not name.startswith("_")
+        }
+        columns["n_value"] = self._get_n_value(refusal, limit, results=results)
+        return pd.DataFrame(columns, index=self._obj.index)
+
+    @profiled
+    @with_dtype_backend
+    def get_seating_pen(self, as_array: bool = False) -> pd.Series | tuple[np.ndarray, np.ndarray]:
         """Return the seating penetration from the first increment of each sample.
 
         Only full penetrations of 150 mm are returned, where partial penetrations are masked with
@@ -41,16 +649,22 @@ class SPTDataFrameAccessor(GeotechPandasBase):
 
             | :term:`pen_1`
 
+        Parameters
+        ----------
+        as_array: bool, default False
+            If `True`, return a ``float64`` array of the values and a boolean mask of the missing
+            values instead of a Series.
+
         Returns
         -------
-        :external:class:`~pandas.Series`
-            :term:`seating_pen`
+        :external:class:`~pandas.Series` or tuple of :external:class:`~numpy.ndarray`
+            :term:`seating_pen`, or its values and missing value mask if `as_array` is `True`.
         """
-        seating_pen = self._obj["pen_1"].convert_dtypes()
-        seating_pen[seating_pen.ne(PEN_INC_MIN)] = pd.NA
-        return pd.Series(seating_pen, name="seating_pen")
+        return self._get_computed("seating_pen", as_array)
 
-    def get_main_pen(self) -> pd.Series:
+    @profiled
+    @with_dtype_backend
+    def get_main_pen(self, as_array: bool = False) -> pd.Series | tuple[np.ndarray, np.ndarray]:
         """Return the total penetration in the second and third 150 mm increment for each sample.
 
         .. admonition:: **Requires:**
@@ -59,17 +673,22 @@ class SPTDataFrameAccessor(GeotechPandasBase):
             | :term:`pen_2`
             | :term:`pen_3`
 
+        Parameters
+        ----------
+        as_array: bool, default False
+            If `True`, return a ``float64`` array of the values and a boolean mask of the missing
+            values instead of a Series.
+
         Returns
         -------
-        :external:class:`~pandas.Series`
-            :term:`main_pen`
+        :external:class:`~pandas.Series` or tuple of :external:class:`~numpy.ndarray`
+            :term:`main_pen`, or its values and missing value mask if `as_array` is `True`.
         """
-        return pd.Series(
-            self._obj[["pen_2", "pen_3"]].sum(axis=1, min_count=1),
-            name="main_pen",
-        )
+        return self._get_computed("main_pen", as_array)
 
-    def get_total_pen(self) -> pd.Series:
+    @profiled
+    @with_dtype_backend
+    def get_total_pen(self, as_array: bool = False) -> pd.Series | tuple[np.ndarray, np.ndarray]:
         """Return the total penetration of each increment.
 
         .. admonition:: **Requires:**
@@ -79,17 +698,24 @@ class SPTDataFrameAccessor(GeotechPandasBase):
             | :term:`pen_2`
             | :term:`pen_3`
 
+        Parameters
+        ----------
+        as_array: bool, default False
+            If `True`, return a ``float64`` array of the values and a boolean mask of the missing
+            values instead of a Series.
+
         Returns
         -------
-        :external:class:`~pandas.Series`
-            :term:`total_pen`
+        :external:class:`~pandas.Series` or tuple of :external:class:`~numpy.ndarray`
+            :term:`total_pen`, or its values and missing value mask if `as_array` is `True`.
         """
-        return pd.Series(
-            self._obj[["pen_1", "pen_2", "pen_3"]].sum(axis=1, min_count=1),
-            name="total_pen",
-        )
+        return self._get_computed("total_pen", as_array)
 
-    def get_seating_drive(self) -> pd.Series:
+    @profiled
+    @with_dtype_backend
+    def get_seating_drive(
+        self, as_array: bool = False
+    ) -> pd.Series | tuple[np.ndarray, np.ndarray]:
         """Return the number of blows in the first 150 mm increment for each sample.
 
         .. admonition:: **Requires:**
@@ -98,21 +724,27 @@ class SPTDataFrameAccessor(GeotechPandasBase):
             | :term:`blows_1`
             | :term:`pen_1`
 
+        Parameters
+        ----------
+        as_array: bool, default False
+            If `True`, return a ``float64`` array of the values and a boolean mask of the missing
+            values instead of a Series.
+
         Returns
         -------
-        :external:class:`~pandas.Series`
-            :term:`seating_drive`
+        :external:class:`~pandas.Series` or tuple of :external:class:`~numpy.ndarray`
+            :term:`seating_drive`, or its values and missing value mask if `as_array` is `True`.
 
         Notes
         -----
         The seating drive is defined as the first 150 mm increment driven by the sampler, therefore,
         only the number of blows of samples with ``pen_1`` equal to 150 mm are taken.
         """
-        seating_drive = self._obj["blows_1"].convert_dtypes()
-        seating_drive[self.get_seating_pen().isna()] = pd.NA
-        return pd.Series(seating_drive, name="seating_drive")
+        return self._get_computed("seating_drive", as_array)
 
-    def get_main_drive(self) -> pd.Series:
+    @profiled
+    @with_dtype_backend
+    def get_main_drive(self, as_array: bool = False) -> pd.Series | tuple[np.ndarray, np.ndarray]:
         """Return the total blows in the second and third 150 mm increment for each sample.
 
         The sum is still returned regardless of the completeness of each increment. Due to this, the
@@ -124,17 +756,22 @@ class SPTDataFrameAccessor(GeotechPandasBase):
             | :term:`blows_2`
             | :term:`blows_3`
 
+        Parameters
+        ----------
+        as_array: bool, default False
+            If `True`, return a ``float64`` array of the values and a boolean mask of the missing
+            values instead of a Series.
+
         Returns
         -------
-        :external:class:`~pandas.Series`
-            :term:`main_drive`
+        :external:class:`~pandas.Series` or tuple of :external:class:`~numpy.ndarray`
+            :term:`main_drive`, or its values and missing value mask if `as_array` is `True`.
         """
-        return pd.Series(
-            self._obj[["blows_2", "blows_3"]].sum(axis=1, min_count=1),
-            name="main_drive",
-        )
+        return self._get_computed("main_drive", as_array)
 
-    def get_total_drive(self) -> pd.Series:
+    @profiled
+    @with_dtype_backend
+    def get_total_drive(self, as_array: bool = False) -> pd.Series | tuple[np.ndarray, np.ndarray]:
         """Return the sum of the number of blows in all three 150 mm increments of each sample.
 
         The sum is still returned regardless of the completeness of each increment.
@@ -146,62 +783,70 @@ class SPTDataFrameAccessor(GeotechPandasBase):
             | :term:`blows_2`
             | :term:`blows_3`
 
+        Parameters
+        ----------
+        as_array: bool, default False
+            If `True`, return a ``float64`` array of the values and a boolean mask of the missing
+            values instead of a Series.
+
         Returns
         -------
-        :external:class:`~pandas.Series`
-            :term:`total_drive`
+        :external:class:`~pandas.Series` or tuple of :external:class:`~numpy.ndarray`
+            :term:`total_drive`, or its values and missing value mask if `as_array` is `True`.
         """
-        return pd.Series(
-            self._obj[["blows_1", "blows_2", "blows_3"]].sum(axis=1, min_count=1),
-            name="total_drive",
-        )
-
-    def _any_with_na_rows(self, values: pd.DataFrame, mask: pd.DataFrame) -> pd.Series:
+        return self._get_computed("total_drive", as_array)
+
+    def _any_with_na_rows(
+        self,
+        values: pd.DataFrame | np.ndarray,
+        mask: pd.DataFrame | np.ndarray,
+        as_array: bool = False,
+    ) -> pd.Series | tuple[np.ndarray, np.ndarray]:
         """Return whether any element is `True` in `mask` while preserving `NA` from `values`.
 
         `NA` will only be preserved if all elements in a row are `NA`.
 
         Parameters
         ----------
-        values: DataFrame
+        values: DataFrame or ndarray
             Values to check for `NA` rows.
-        mask: DataFrame
+        mask: DataFrame or ndarray
             `values` mask where the `NA` rows are applied.
+        as_array: bool, default False
+            If `True`, return a boolean array and a boolean mask of the `NA` rows instead of a
+            Series.
 
         Returns
         -------
-        :external:class:`~pandas.Series`
+        :external:class:`~pandas.Series` or tuple of :external:class:`~numpy.ndarray`
             Series whether any element is `True` in `mask`, with preserved `NA` rows.
         """
         if values.shape != mask.shape:
             raise ValueError("`values` and `mask` must have the same shape.")
 
-        _na = values.isna().all(axis=1)
-        _values = mask.any(axis=1)
-        _values[_na] = pd.NA
-        return _values
-
-    def _any_blows_max_inc(self) -> pd.Series:
-        _values = self._obj[["blows_1", "blows_2", "blows_3"]]
-        return pd.Series(
-            self._any_with_na_rows(_values, (_values >= BLOWS_INC_MAX)),
-            name="_any_blows_max_inc",
+        _na = np.asarray(np.asarray(pd.isna(values)).all(axis=1))
+        _mask = (
+            mask.to_numpy(dtype=bool, na_value=False) if isinstance(mask, pd.DataFrame) else mask
         )
+        _any: np.ndarray = _mask.any(axis=1) & ~_na
+        return self._get_result(_any, _na, as_array, name="_any_with_na_rows", dtype="bool")
 
-    def _any_blows_max_total(self) -> pd.Series:
-        return pd.Series(
-            self.get_total_drive() >= BLOWS_TOTAL_MAX,
-            name="_any_blows_max_total",
-        )
+    def _any_blows_max_inc(
+        self, as_array: bool = False
+    ) -> pd.Series | tuple[np.ndarray, np.ndarray]:
+        return self._get_computed("_any_blows_max_inc", as_array)
 
-    def _any_pen_partial(self) -> pd.Series:
-        _values = self._obj[["pen_1", "pen_2", "pen_3"]]
-        return pd.Series(
-            self._any_with_na_rows(_values, (_values < PEN_INC_MIN) | (_values.isna())),
-            name="_any_pen_partial",
-        )
+    def _any_blows_max_total(
+        self, as_array: bool = False
+    ) -> pd.Series | tuple[np.ndarray, np.ndarray]:
+        return self._get_computed("_any_blows_max_total", as_array)
+
+    def _any_pen_partial(self, as_array: bool = False) -> pd.Series | tuple[np.ndarray, np.ndarray]:
+        return self._get_computed("_any_pen_partial", as_array)
 
-    def is_refusal(self) -> pd.Series:
+    @profiled
+    @with_dtype_backend
+    def is_refusal(self, as_array: bool = False) -> pd.Series | tuple[np.ndarray, np.ndarray]:
         """Return whether or not each sample is a refusal.
 
         A sample is considered a refusal when any of the following is true:
@@ -221,17 +866,22 @@ class SPTDataFrameAccessor(GeotechPandasBase):
             | :term:`pen_2`
             | :term:`pen_3`
 
+        Parameters
+        ----------
+        as_array: bool, default False
+            If `True`, return a boolean array of the values and a boolean mask of the missing
+            values instead of a Series.
+
         Returns
         -------
-        :external:class:`~pandas.Series`
-            :term:`is_refusal`
+        :external:class:`~pandas.Series` or tuple of :external:class:`~numpy.ndarray`
+            :term:`is_refusal`, or its values and missing value mask if `as_array` is `True`.
         """
-        return pd.Series(
-            self._any_blows_max_inc() | self._any_blows_max_total() | self._any_pen_partial(),
-            name="is_refusal",
-        )
+        return self._get_computed("is_refusal", as_array)
 
-    def is_hammer_weight(self) -> pd.Series:
+    @profiled
+    @with_dtype_backend
+    def is_hammer_weight(self, as_array: bool = False) -> pd.Series | tuple[np.ndarray, np.ndarray]:
         """Return whether or not each sample is hammer weight.
 
         A sample is considered hammer weight when all of the following are true:
@@ -249,18 +899,24 @@ class SPTDataFrameAccessor(GeotechPandasBase):
             | :term:`pen_2`
             | :term:`pen_3`
 
+        Parameters
+        ----------
+        as_array: bool, default False
+            If `True`, return a boolean array of the values and a boolean mask of the missing
+            values instead of a Series.
+
         Returns
         -------
-        :external:class:`~pandas.Series`
-            :term:`is_hammer_weight`
+        :external:class:`~pandas.Series` or tuple of :external:class:`~numpy.ndarray`
+            :term:`is_hammer_weight`, or its values and missing value mask if `as_array` is `True`.
         """
-        return pd.Series(
-            (self._obj[["blows_1", "blows_2", "blows_3"]].eq(0)).all(axis=1)
-            & (self.get_total_pen() >= PEN_TOTAL_MIN),
-            name="is_hammer_weight",
-        )
+        return self._get_computed("is_hammer_weight", as_array)
 
-    def get_n_value(self, refusal=50, limit=False) -> pd.Series:
+    @profiled
+    @with_dtype_backend
+    def get_n_value(
+        self, refusal=50, limit=False, as_array: bool = False
+    ) -> pd.Series | tuple[np.ndarray, np.ndarray]:
         """Return the N-value for each sample.
 
         When a sample is a refusal, then the N-value is assumed as the value set in `refusal`. If
@@ -287,14 +943,34 @@ class SPTDataFrameAccessor(GeotechPandasBase):
             Equivalent N-value for samples with total penetration less than 450 mm.
         limit: bool, default False
             If `True`, limits the resulting N-value to `refusal`.
+        as_array: bool, default False
+            If `True`, return a ``float64`` array of the values and a boolean mask of the missing
+            values instead of a Series.
 
         Returns
         -------
-        :external:class:`~pandas.Series`
-            :term:`n_value`
+        :external:class:`~pandas.Series` or tuple of :external:class:`~numpy.ndarray`
+            :term:`n_value`, or its values and missing value mask if `as_array` is `True`.
         """
-        n_value = self.get_main_drive()
-        n_value.loc[self.is_refusal()] = refusal
+        return self._get_n_value(refusal, limit, as_array)
+
+    def _get_n_value(
+        self, refusal, limit, as_array: bool = False, results: _Results | None = None
+    ) -> pd.Series | tuple[np.ndarray, np.ndarray]:
+        """Return the N-value from the main drive and refusals, see :meth:`get_n_value`."""
+        if results is None:
+            results = self._compute()
+        n_value, na, _ = results["main_drive"]
+        _refusal, _refusal_na, _ = results["is_refusal"]
+        _refusal = _refusal & ~_refusal_na
+
+        if pd.isna(refusal):
+            n_value = np.where(_refusal, np.nan, n_value)
+            na = na | _refusal
+        else:
+            n_value = np.where(_refusal, refusal, n_value)
+            na = na & ~_refusal
+
         if limit:
             if refusal is pd.NA:
                 warnings.warn(
@@ -303,50 +979,101 @@ class SPTDataFrameAccessor(GeotechPandasBase):
                     stacklevel=2,
                     category=SyntaxWarning,
                 )
-            n_value.loc[n_value > refusal] = refusal
-        return pd.Series(n_value, name="n_value")
-
-    def _format_blows(self, interval) -> pd.Series:
-        _blows = self._obj[f"blows_{interval}"]
-        _pen = self._obj[f"pen_{interval}"]
-
-        _m = _pen < PEN_INC_MIN
-
-        _blows = _blows.astype("string")
-        _pen = _pen.astype("string")
-
-        _blows[_m] = _blows[_m] + "/" + _pen[_m] + "mm"
-        _blows.name = f"_format_blows_{interval}"
-        return _blows
+            else:
+                n_value = np.where(n_value > refusal, refusal, n_value)
+
+        integer = pd.isna(refusal) or float(refusal).is_integer()
+        return self._get_result(
+            n_value,
+            na,
+            as_array,
+            name="n_value",
+            dtype=self._get_numeric_dtype(["blows_2", "blows_3"], integer),
+        )
 
-    def _cat_blows(self) -> pd.Series:
-        _blows_1 = self._format_blows(1)
-        _blows_2 = self._format_blows(2)
-        _blows_3 = self._format_blows(3)
+    def _get_blows_strings(self, interval, results: _Results) -> tuple[np.ndarray, list]:
+        """Return the codes and strings of the blows of an increment with partial penetrations."""
+        blows = _factorize_strings(self._obj[f"blows_{interval}"])
+        pen_codes, pen_strings = _factorize_strings(self._obj[f"pen_{interval}"])
+        partial = results["_pen_partial"][0][interval - 1]
+        return _combine(
+            blows,
+            (np.where(partial, pen_codes, -1), pen_strings),
+            lambda blows, pen: blows if blows is None or pen is None else f"{blows}/{pen}mm",
+        )
 
-        _blows = _blows_1.str.cat([_blows_2, _blows_3], sep=",", na_rep="-")
-        _blows = _blows.replace("-,-,-", pd.NA)
-        _blows.name = "_cat_blows"
-        return _blows
+    def _get_cat_blows_strings(self, results: _Results) -> tuple[np.ndarray, list]:
+        """Return the codes and strings of the blows of all increments separated by commas."""
+        _blows = _combine(
+            self._get_blows_strings(1, results),
+            self._get_blows_strings(2, results),
+            lambda blows_1, blows_2: f"{blows_1 or '-'},{blows_2 or '-'}",
+        )
+        return _combine(
+            _blows,
+            self._get_blows_strings(3, results),
+            lambda blows, blows_3: (
+                None if blows == "-,-" and blows_3 is None else f"{blows},{blows_3 or '-'}"
+            ),
+        )
 
-    def _format_n_value(self) -> pd.Series:
-        _n_value = "N=" + self.get_main_drive().astype("string")
+    def _get_n_value_strings(self, results: _Results) -> tuple[np.ndarray, list]:
+        """Return the codes and strings of the N-value with partial penetrations and remarks."""
+        main_drive = _factorize_strings(
+            cast(pd.Series, self._get_computed("main_drive", results=results))
+        )
+        main_pen_codes, main_pen_strings = _factorize_strings(
+            cast(pd.Series, self._get_computed("main_pen", results=results))
+        )
+        partial = results["main_pen"][0] < 2 * PEN_INC_MIN
+        _n_value = _combine(
+            main_drive,
+            (np.where(partial, main_pen_codes, -1), main_pen_strings),
+            lambda drive, pen: (
+                drive if drive is None else f"N={drive}" + ("" if pen is None else f"/{pen}mm")
+            ),
+        )
 
-        _m = self.get_main_pen() < 2 * PEN_INC_MIN
-        _n_value[_m] = _n_value[_m] + "/" + self.get_main_pen()[_m].astype("string") + "mm"
+        # Each combination of the remarks is a code from 0 to 7 that formats itself.
+        _refusal, _refusal_na, _ = results["is_refusal"]
+        _hammer_weight, _hammer_weight_na, _ = results["is_hammer_weight"]
+        remarks = (
+            4 * (results["total_pen"][0] <= PEN_INC_MIN)
+            + 2 * (_refusal & ~_refusal_na)
+            + (_hammer_weight & ~_hammer_weight_na)
+        )
+        return _combine(
+            _n_value,
+            (remarks, [*range(8), None]),
+            _format_remarks,
+        )
 
-        _m = self.get_total_pen() <= PEN_INC_MIN
-        _n_value[_m] = "N="
+    def _to_string_series(self, strings: tuple[np.ndarray, list], name: str) -> pd.Series:
+        """Return the strings of each row as a ``string`` Series."""
+        codes, unique = strings
+        values = np.asarray(unique, dtype=object)[codes]
+        return pd.Series(pd.array(values, dtype="string"), index=self._obj.index, name=name)
 
-        _m = self.is_refusal()
-        _n_value[_m] = _n_value[_m] + "(R)"
+    @profiled
+    def _format_blows(self, interval) -> pd.Series:
+        return self._to_string_series(
+            self._get_blows_strings(interval, self._compute()), name=f"_format_blows_{interval}"
+        )
 
-        _m = self.is_hammer_weight()
-        _n_value[_m] = _n_value[_m] + "(HW)"
+    @profiled
+    def _cat_blows(self) -> pd.Series:
+        return self._to_string_series(
+            self._get_cat_blows_strings(self._compute()), name="_cat_blows"
+        )
 
-        _n_value.name = "_format_n_value"
-        return _n_value
+    @profiled
+    def _format_n_value(self) -> pd.Series:
+        return self._to_string_series(
+            self._get_n_value_strings(self._compute()), name="_format_n_value"
+        )
 
+    @profiled
+    @with_dtype_backend
     def get_report(self) -> pd.Series:
         """Return descriptive strings that show the blows per interval and N-value.
 
@@ -372,12 +1099,23 @@ class SPTDataFrameAccessor(GeotechPandasBase):
         :external:class:`~pandas.Series`
             :term:`spt_report`
         """
-        return pd.Series(
-            self._cat_blows().str.cat(self._format_n_value(), sep=" "),
+        results = self._compute()
+        return self._to_string_series(
+            _combine(
+                self._get_cat_blows_strings(results),
+                self._get_n_value_strings(results),
+                lambda blows, n_value: (
+                    None if blows is None or n_value is None else f"{blows} {n_value}"
+                ),
+            ),
             name="spt_report",
-        ).convert_dtypes()
+        )
 
-    def get_typical_hammer_efficiency_factor(self) -> pd.Series:
+    @profiled
+    @with_dtype_backend
+    def get_typical_hammer_efficiency_factor(
+        self, as_array: bool = False
+    ) -> pd.Series | tuple[np.ndarray, np.ndarray]:
         """Return the typical hammer efficiency factor based on country, type, and release.
 
         The efficiency factor is used to convert the N-value to a corrected N-value. The hammer
@@ -424,6 +1162,12 @@ class SPTDataFrameAccessor(GeotechPandasBase):
         location of the test. This is because SPT practice is not standardized worldwide and the
         methodology used in each country causes the variation in the hammer efficiency factor.
 
+        Other hammers, such as hammers with calibrated efficiencies, can be added, and the factors
+        of the hammers above can be replaced, with
+        :func:`~geotech_pandas.in_situ.spt.register_hammer_efficiency_factor`. The values of each
+        required column are validated against the registered hammers, while a combination of valid
+        values that is not registered is `NA`.
+
         If any value in the required columns is `NA`, then the efficiency factor will also be `NA`.
 
         .. admonition:: **Requires:**
@@ -433,10 +1177,22 @@ class SPTDataFrameAccessor(GeotechPandasBase):
             | :term:`spt_hammer_type`
             | :term:`spt_hammer_release`
 
+        Parameters
+        ----------
+        as_array: bool, default False
+            If `True`, return a ``float64`` array of the values and a boolean mask of the missing
+            values instead of a Series.
+
         Returns
         -------
-        :external:class:`~pandas.Series`
-            :term:`spt_hammer_efficiency_factor`
+        :external:class:`~pandas.Series` or tuple of :external:class:`~numpy.ndarray`
+            :term:`spt_hammer_efficiency_factor`, or its values and missing value mask if
+            `as_array` is `True`.
+
+        Raises
+        ------
+        ValueError
+            If any value in the required columns is not a value of the registered hammers.
 
         References
         ----------
@@ -445,75 +1201,712 @@ class SPTDataFrameAccessor(GeotechPandasBase):
            Engineering Division*, 111(12), 1426-1432.
            `<https://doi.org/10.1061/(ASCE)0733-9410(1985)111:12(1425)>`_
         """
-        self._validate_column_values("spt_hammer_country_ref", ["jp", "us", "ar", "cn"])
-        self._validate_column_values("spt_hammer_type", ["donut hammer", "safety hammer"])
-        self._validate_column_values("spt_hammer_release", ["free fall", "rope and pulley"])
-
-        caselist = [
-            # None
-            (
-                (self._obj["spt_hammer_country_ref"].isna())
-                | (self._obj["spt_hammer_type"].isna())
-                | (self._obj["spt_hammer_release"].isna()),
-                pd.NA,
-            ),
-            # Japan
-            (
-                (self._obj["spt_hammer_country_ref"] == "jp")
-                & (self._obj["spt_hammer_type"] == "donut hammer")
-                & (self._obj["spt_hammer_release"] == "free fall"),
-                0.78,
-            ),
-            (
-                (self._obj["spt_hammer_country_ref"] == "jp")
-                & (self._obj["spt_hammer_type"] == "donut hammer")
-                & (self._obj["spt_hammer_release"] == "rope and pulley"),
-                0.67,
-            ),
-            # United States
-            (
-                (self._obj["spt_hammer_country_ref"] == "us")
-                & (self._obj["spt_hammer_type"] == "safety hammer")
-                & (self._obj["spt_hammer_release"] == "rope and pulley"),
-                0.60,
-            ),
-            (
-                (self._obj["spt_hammer_country_ref"] == "us")
-                & (self._obj["spt_hammer_type"] == "donut hammer")
-                & (self._obj["spt_hammer_release"] == "rope and pulley"),
-                0.45,
-            ),
-            # Argentina
-            (
-                (self._obj["spt_hammer_country_ref"] == "ar")
-                & (self._obj["spt_hammer_type"] == "donut hammer")
-                & (self._obj["spt_hammer_release"] == "rope and pulley"),
-                0.45,
-            ),
-            # China
-            (
-                (self._obj["spt_hammer_country_ref"] == "cn")
-                & (self._obj["spt_hammer_type"] == "donut hammer")
-                & (self._obj["spt_hammer_release"] == "free fall"),
-                0.60,
-            ),
-            (
-                (self._obj["spt_hammer_country_ref"] == "cn")
-                & (self._obj["spt_hammer_type"] == "donut hammer")
-                & (self._obj["spt_hammer_release"] == "rope and pulley"),
-                0.50,
-            ),
-        ]
+        self._validate_columns(HAMMER_COLUMNS)
+
+        # The hammer of each row is packed into an integer key from the positions of its values in
+        # the registered hammers, so the factors are gathered from a table in a single pass.
+        hammers = list(_hammer_efficiency_factors)
+        key = np.zeros(len(self._obj), dtype="int64")
+        table_key = np.zeros(len(hammers), dtype="int64")
+        na = np.zeros(len(self._obj), dtype=bool)
+        size = 1
+        for i, column in enumerate(HAMMER_COLUMNS):
+            valid_values = list(dict.fromkeys(hammer[i] for hammer in hammers))
+            positions = {value: position for position, value in enumerate(valid_values)}
+
+            # Only the unique values are validated and mapped to their positions.
+            codes, unique = pd.factorize(self._obj[column])
+            invalid_values = [value for value in unique if value not in positions]
+            if invalid_values:
+                raise ValueError(
+                    f"Invalid value{'s' if len(invalid_values) > 1 else ''} found in '{column}': "
+                    f"{invalid_values}. Valid value{'s are' if len(valid_values) > 1 else ' is'}: "
+                    f"{valid_values}"
+                )
 
-        spt_hammer_efficiency_factor = pd.Series(
-            pd.NA,
-            index=self._obj.index,
+            # Missing values have a code of -1, which takes the trailing position.
+            unique_positions = np.array([*(positions[value] for value in unique), 0])
+            key = key * len(valid_values) + unique_positions[codes]
+            table_key = table_key * len(valid_values) + [positions[hammer[i]] for hammer in hammers]
+            na |= codes == -1
+            size *= len(valid_values)
+
+        # Combinations of valid values that are not registered are left as `NA`.
+        table = np.full(size, np.nan)
+        table[table_key] = list(_hammer_efficiency_factors.values())
+        spt_hammer_efficiency_factor = np.where(na, np.nan, table[key])
+        return self._get_result(
+            spt_hammer_efficiency_factor,
+            np.isnan(spt_hammer_efficiency_factor),
+            as_array,
             name="spt_hammer_efficiency_factor",
+            dtype="Float64",
+        )
+
+    @profiled
+    @with_dtype_backend
+    def get_n60(
+        self, refusal=50, limit=False, as_array: bool = False
+    ) -> pd.Series | tuple[np.ndarray, np.ndarray]:
+        r"""Return the N-value corrected for the hammer energy, borehole, sampler and rod length.
+
+        The N-value is normalized to an energy ratio of 60% of the theoretical free-fall energy
+        [1]_,
+
+        .. math:: N_{60} = N \cdot \frac{E_m}{0.60} \cdot C_B \cdot C_S \cdot C_R
+
+        where :math:`N` is the :term:`n_value`, :math:`E_m` is the
+        :term:`spt_hammer_efficiency_factor`, and the borehole diameter correction :math:`C_B`,
+        sampler correction :math:`C_S` and rod length correction :math:`C_R` are taken from the
+        following tables:
+
+        .. list-table:: Correction Factors [1]_
+            :header-rows: 1
+
+            * - Factor
+              - Equipment Variable
+              - Correction
+            * - Borehole diameter, :math:`C_B`
+              - up to 115 mm
+              - 1.00
+            * -
+              - over 115 mm up to 150 mm
+              - 1.05
+            * -
+              - over 150 mm up to 200 mm
+              - 1.15
+            * - Sampler, :math:`C_S`
+              - standard sampler
+              - 1.00
+            * -
+              - sampler without liners
+              - 1.20
+            * - Rod length, :math:`C_R`
+              - less than 3 m
+              - 0.75
+            * -
+              - 3 m to less than 4 m
+              - 0.80
+            * -
+              - 4 m to less than 6 m
+              - 0.85
+            * -
+              - 6 m to less than 10 m
+              - 0.95
+            * -
+              - 10 m or more
+              - 1.00
+
+        Borehole diameters over 200 mm and negative rod lengths are `NA`. If any of the factors
+        is `NA`, then the corrected N-value will also be `NA`.
+
+        .. admonition:: **Requires:**
+            :class: important
+
+            | :term:`blows_1`
+            | :term:`blows_2`
+            | :term:`blows_3`
+            | :term:`pen_1`
+            | :term:`pen_2`
+            | :term:`pen_3`
+            | :term:`spt_hammer_country_ref`
+            | :term:`spt_hammer_type`
+            | :term:`spt_hammer_release`
+            | :term:`spt_borehole_diameter`
+            | :term:`spt_sampler_type`
+            | :term:`spt_rod_length`
+
+        Parameters
+        ----------
+        refusal: int, default 50
+            Equivalent N-value for samples with total penetration less than 450 mm, see
+            :meth:`get_n_value`.
+        limit: bool, default False
+            If `True`, limits the N-value to `refusal` before the correction, see
+            :meth:`get_n_value`.
+        as_array: bool, default False
+            If `True`, return a ``float64`` array of the values and a boolean mask of the missing
+            values instead of a Series.
+
+        Returns
+        -------
+        :external:class:`~pandas.Series` or tuple of :external:class:`~numpy.ndarray`
+            :term:`n60`, or its values and missing value mask if `as_array` is `True`.
+
+        Raises
+        ------
+        ValueError
+            If any value in the hammer columns is not a registered hammer, see
+            :meth:`get_typical_hammer_efficiency_factor`, or if any value in
+            :term:`spt_sampler_type` is not a known sampler.
+
+        References
+        ----------
+        .. [1] Youd, T. L., Idriss, I. M., Andrus, R. D., Arango, I., Castro, G., Christian, J. T.,
+           Dobry, R., Finn, W. D. L., Harder, L. F., Hynes, M. E., Ishihara, K., Koester, J. P.,
+           Liao, S. S. C., Marcuson, W. F., Martin, G. R., Mitchell, J. K., Moriwaki, Y., Power,
+           M. S., Robertson, P. K., Seed, R. B., Stokoe, K. H. (2001). Liquefaction resistance of
+           soils: Summary report from the 1996 NCEER and 1998 NCEER/NSF workshops on evaluation of
+           liquefaction resistance of soils. *Journal of Geotechnical and Geoenvironmental
+           Engineering*, 127(10), 817-833.
+           `<https://doi.org/10.1061/(ASCE)1090-0241(2001)127:10(817)>`_
+        """
+        n_value, n_value_na = self._get_n_value(refusal, limit, as_array=True)
+        n60 = self._get_n60(np.where(n_value_na, np.nan, n_value))
+        return self._get_result(n60, np.isnan(n60), as_array, name="n60", dtype="Float64")
+
+    def _get_n60(self, n_value: np.ndarray) -> np.ndarray:
+        """Return the corrected N-value of :meth:`get_n60` from N-values with `NaN` for `NA`."""
+        self._validate_columns(["spt_borehole_diameter", "spt_sampler_type", "spt_rod_length"])
+        self._validate_column_values("spt_sampler_type", list(SAMPLER_CORRECTION_FACTORS))
+
+        efficiency, _ = self._get_arrays(self.get_typical_hammer_efficiency_factor)
+        borehole_diameter, rod_length = self._get_float_array(
+            ["spt_borehole_diameter", "spt_rod_length"]
+        ).T
+        codes, unique = pd.factorize(self._obj["spt_sampler_type"])
+        sampler = np.array([*(SAMPLER_CORRECTION_FACTORS[value] for value in unique), np.nan])
+
+        return (
+            n_value
+            * (efficiency / ENERGY_RATIO)
+            * _get_bin_factors(
+                borehole_diameter,
+                BOREHOLE_DIAMETER_BINS,
+                BOREHOLE_DIAMETER_CORRECTION_FACTORS,
+                right=True,
+            )
+            * sampler[codes]
+            * _get_bin_factors(rod_length, ROD_LENGTH_BINS, ROD_LENGTH_CORRECTION_FACTORS)
+        )
+
+    @profiled
+    @with_dtype_backend
+    def get_n1_60(
+        self,
+        refusal=50,
+        limit=False,
+        atmospheric_pressure: float = 100.0,
+        max_overburden_factor: float = 1.7,
+        as_array: bool = False,
+    ) -> pd.Series | tuple[np.ndarray, np.ndarray]:
+        r"""Return the corrected N-value normalized to an effective overburden pressure of 1 atm.
+
+        The corrected N-value from :meth:`get_n60` is normalized with the overburden correction
+        factor :math:`C_N` of Liao and Whitman [1]_,
+
+        .. math:: (N_1)_{60} = N_{60} \cdot C_N
+
+        .. math:: C_N = \left(\frac{P_a}{\sigma'_{v}}\right)^{0.5} \le 1.7
+
+        where :math:`P_a` is the atmospheric pressure and :math:`\sigma'_{v}` is the
+        :term:`vertical_effective_stress`. Samples with negative effective stresses are `NA`.
+
+        .. admonition:: **Requires:**
+            :class: important
+
+            | :term:`blows_1`
+            | :term:`blows_2`
+            | :term:`blows_3`
+            | :term:`pen_1`
+            | :term:`pen_2`
+            | :term:`pen_3`
+            | :term:`spt_hammer_country_ref`
+            | :term:`spt_hammer_type`
+            | :term:`spt_hammer_release`
+            | :term:`spt_borehole_diameter`
+            | :term:`spt_sampler_type`
+            | :term:`spt_rod_length`
+            | :term:`vertical_effective_stress`
+
+        Parameters
+        ----------
+        refusal: int, default 50
+            Equivalent N-value for samples with total penetration less than 450 mm, see
+            :meth:`get_n_value`.
+        limit: bool, default False
+            If `True`, limits the N-value to `refusal` before the correction, see
+            :meth:`get_n_value`.
+        atmospheric_pressure: float, default 100.0
+            Atmospheric pressure in the units of :term:`vertical_effective_stress`, which is in
+            kilopascals (kPa) by default.
+        max_overburden_factor: float, default 1.7
+            Upper limit of the overburden correction factor :math:`C_N`.
+        as_array: bool, default False
+            If `True`, return a ``float64`` array of the values and a boolean mask of the missing
+            values instead of a Series.
+
+        Returns
+        -------
+        :external:class:`~pandas.Series` or tuple of :external:class:`~numpy.ndarray`
+            :term:`n1_60`, or its values and missing value mask if `as_array` is `True`.
+
+        Raises
+        ------
+        ValueError
+            If any value in the hammer or sampler columns is not known, see :meth:`get_n60`.
+
+        References
+        ----------
+        .. [1] Liao, S. S. C., Whitman, R. V. (1986). Overburden correction factors for SPT in sand.
+           *Journal of Geotechnical Engineering*, 112(3), 373-377.
+           `<https://doi.org/10.1061/(ASCE)0733-9410(1986)112:3(373)>`_
+        """
+        n60, _ = self._get_arrays(self.get_n60, refusal, limit)
+        n1_60 = n60 * self._get_overburden_factor(atmospheric_pressure, max_overburden_factor)
+        return self._get_result(n1_60, np.isnan(n1_60), as_array, name="n1_60", dtype="Float64")
+
+    def _get_overburden_factor(
+        self, atmospheric_pressure: float, max_overburden_factor: float
+    ) -> np.ndarray:
+        """Return the overburden correction factor of :meth:`get_n1_60`."""
+        self._validate_columns(["vertical_effective_stress"])
+
+        stress = self._get_float_array(["vertical_effective_stress"])[:, 0]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.minimum(np.sqrt(atmospheric_pressure / stress), max_overburden_factor)
+
+    @profiled
+    @with_dtype_backend
+    def correlate(
+        self,
+        names: list[str] | None = None,
+        refusal=50,
+        limit=False,
+        *,
+        atmospheric_pressure: float = 100.0,
+    ) -> pd.DataFrame:
+        """Return soil parameters from registered correlations with the SPT.
+
+        All the correlations are evaluated in a single pass, where each input that is shared by
+        the correlations, such as the corrected N-values or the effective stress, is calculated or
+        read only once. The published correlations are the following:
+
+        .. list-table:: Correlations
+            :header-rows: 1
+
+            * - Name
+              - Parameter
+              - Correlation
+            * - ``phi_peck``
+              - friction angle (degrees)
+              - Peck et al. (1974) as fitted by Wolff (1989), from :term:`n1_60`
+            * - ``phi_hatanaka``
+              - friction angle (degrees)
+              - Hatanaka and Uchida (1996), from :term:`n1_60`
+            * - ``phi_kulhawy``
+              - friction angle (degrees)
+              - Kulhawy and Mayne (1990), from :term:`n60` and
+                :term:`vertical_effective_stress`
+            * - ``su_stroud``
+              - undrained shear strength (kPa)
+              - Stroud (1974) with a factor of 4.4 kPa, from :term:`n60`
+            * - ``e_kulhawy``
+              - Young's modulus (kPa)
+              - Kulhawy and Mayne (1990) for sands with fines with a factor of 5 times the
+                atmospheric pressure, from :term:`n60`
+            * - ``dr_skempton``
+              - relative density (%)
+              - Skempton (1986) for normally consolidated sands, from :term:`n1_60`
+
+        Other correlations can be registered with
+        :func:`~geotech_pandas.in_situ.spt.register_correlation`.
+
+        .. admonition:: **Requires:**
+            :class: important
+
+            | the columns required by :meth:`get_n_value`, :meth:`get_n60` or
+              :meth:`get_n1_60`, and any other input column of the correlations
+
+        Parameters
+        ----------
+        names: list of str, optional
+            Names of the correlations to evaluate. If `None`, all the registered correlations are
+            evaluated.
+        refusal: int, default 50
+            Equivalent N-value for samples with total penetration less than 450 mm, see
+            :meth:`get_n_value`.
+        limit: bool, default False
+            If `True`, limits the N-value to `refusal` before the corrections, see
+            :meth:`get_n_value`.
+        atmospheric_pressure: float, default 100.0
+            Atmospheric pressure in the units of :term:`vertical_effective_stress`, see
+            :meth:`get_n1_60`.
+
+        Returns
+        -------
+        :external:class:`~pandas.DataFrame`
+            ``Float64`` column of each correlation, named after the correlation.
+
+        Raises
+        ------
+        ValueError
+            If any of `names` is not a registered correlation, or if any value in the hammer or
+            sampler columns is not known, see :meth:`get_n60`.
+
+        Examples
+        --------
+        >>> df = pd.DataFrame(
+        ...     {
+        ...         "point_id": ["BH-1", "BH-1"],
+        ...         "bottom": [1.5, 3.0],
+        ...         "sample_type": "spt",
+        ...         "sample_number": [1, 2],
+        ...         "blows_1": [2, 6],
+        ...         "blows_2": [3, 7],
+        ...         "blows_3": [3, 8],
+        ...         "pen_1": 150,
+        ...         "pen_2": 150,
+        ...         "pen_3": 150,
+        ...         "spt_hammer_country_ref": "us",
+        ...         "spt_hammer_type": "safety hammer",
+        ...         "spt_hammer_release": "rope and pulley",
+        ...         "spt_borehole_diameter": 100.0,
+        ...         "spt_sampler_type": "standard sampler",
+        ...         "spt_rod_length": [2.5, 4.0],
+        ...         "vertical_effective_stress": [25.0, 50.0],
+        ...     }
+        ... )
+        >>> df.geotech.in_situ.spt.correlate(["phi_peck", "su_stroud"]).round(1)
+           phi_peck  su_stroud
+        0      29.4       19.8
+        1      32.3       56.1
+        """
+        names = list(_correlations) if names is None else names
+        unknown = [name for name in names if name not in _correlations]
+        if unknown:
+            raise ValueError(
+                f"Unknown correlation{'s' if len(unknown) > 1 else ''}: {unknown}. "
+                f"Valid correlations are: {list(_correlations)}"
+            )
+
+        inputs = {input_ for name in names for input_ in _correlations[name][0]}
+        self._validate_columns(sorted(inputs - set(CORRELATION_INPUTS)))
+
+        values: dict[str, Any] = {"atmospheric_pressure": atmospheric_pressure}
+        if inputs & {"n_value", "n60", "n1_60"}:
+            n_value, n_value_na = self._get_n_value(refusal, limit, as_array=True)
+            values["n_value"] = np.where(n_value_na, np.nan, n_value)
+        if inputs & {"n60", "n1_60"}:
+            values["n60"] = self._get_n60(values["n_value"])
+        if "n1_60" in inputs:
+            values["n1_60"] = values["n60"] * self._get_overburden_factor(atmospheric_pressure, 1.7)
+        columns = sorted(inputs - set(values))
+        if columns:
+            values.update(zip(columns, self._get_float_array(columns).T, strict=True))
+
+        result = {}
+        with np.errstate(divide="ignore", invalid="ignore"):
+            for name in names:
+                correlation_inputs, func = _correlations[name]
+                result[name] = pd.array(
+                    np.asarray(func(*(values[input_] for input_ in correlation_inputs)), "float64"),
+                    dtype="Float64",
+                )
+        return pd.DataFrame(result, index=self._obj.index)
+
+    def _get_cyclic_resistance_ratio(
+        self, refusal, limit, atmospheric_pressure: float
+    ) -> np.ndarray:
+        """Return the ratio of the cyclic resistance to the cyclic stress of each layer.
+
+        The cyclic resistance is for a magnitude of 7.5, and the cyclic stress is for a peak ground
+        acceleration of 1 g, so the factor of safety of a scenario is this ratio multiplied by the
+        magnitude scaling factor and divided by the peak ground acceleration of the scenario.
+        """
+        self._validate_columns(
+            ["top", "bottom", "vertical_total_stress", "vertical_effective_stress", "fines_content"]
         )
 
-        # Ignore mypy error which detects incompatible type "list[tuple[Series[bool], object]]" for
-        # the caselist arg of the case_when method. Possibly raise an issue in pandas.
-        spt_hammer_efficiency_factor = spt_hammer_efficiency_factor.case_when(caselist)  # type: ignore[arg-type]
-        spt_hammer_efficiency_factor = spt_hammer_efficiency_factor.astype("Float64")
+        n1_60, _ = self._get_arrays(self.get_n1_60, refusal, limit, atmospheric_pressure)
+        top, bottom, total_stress, effective_stress, fines_content = self._get_float_array(
+            ["top", "bottom", "vertical_total_stress", "vertical_effective_stress", "fines_content"]
+        ).T
+        depth = (top + bottom) / 2
+
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            alpha = np.where(
+                fines_content <= 5,  # noqa: PLR2004
+                0.0,
+                np.where(
+                    fines_content >= 35,  # noqa: PLR2004
+                    5.0,
+                    np.exp(1.76 - 190 / fines_content**2),
+                ),
+            )
+            beta = np.where(
+                fines_content <= 5,  # noqa: PLR2004
+                1.0,
+                np.where(fines_content >= 35, 1.2, 0.99 + fines_content**1.5 / 1000),  # noqa: PLR2004
+            )
+            n1_60cs = np.where(np.isnan(fines_content), np.nan, alpha + beta * n1_60)
+            crr = np.where(
+                n1_60cs < N1_60CS_MAX,
+                1 / (34 - n1_60cs) + n1_60cs / 135 + 50 / (10 * n1_60cs + 45) ** 2 - 1 / 200,
+                np.where(np.isnan(n1_60cs), np.nan, np.inf),
+            )
+            stress_reduction = _get_stress_reduction(depth)
+            return crr / (0.65 * total_stress / effective_stress * stress_reduction)
+
+    @profiled
+    @with_dtype_backend
+    def get_liquefaction_factor_of_safety(  # noqa: PLR0913
+        self,
+        magnitudes,
+        pgas,
+        refusal=50,
+        limit=False,
+        *,
+        atmospheric_pressure: float = 100.0,
+        as_array: bool = False,
+    ) -> pd.DataFrame | tuple[np.ndarray, np.ndarray]:
+        r"""Return the factor of safety against liquefaction of each layer for each scenario.
+
+        The simplified procedure of Youd et al. [1]_ compares the cyclic resistance ratio
+        :math:`CRR` of each layer with the cyclic stress ratio :math:`CSR` induced by each
+        scenario,
+
+        .. math:: FS = \frac{CRR_{7.5} \cdot MSF}{CSR}
+
+        .. math:: CSR = 0.65 \cdot \frac{a_{max}}{g} \cdot \frac{\sigma_v}{\sigma'_v} \cdot r_d
+
+        .. math:: MSF = \frac{10^{2.24}}{M_w^{2.56}}
+
+        where :math:`a_{max}/g` is the peak ground acceleration, :math:`M_w` is the moment
+        magnitude, :math:`\sigma_v` and :math:`\sigma'_v` are the :term:`vertical_total_stress`
+        and :term:`vertical_effective_stress`, and :math:`r_d` is the stress reduction coefficient
+        of Blake (1996) at the center depth :math:`z` of the layer in meters, as given by Youd et
+        al.,
+
+        .. math:: r_d = \frac{1 - 0.4113 z^{0.5} + 0.04052 z + 0.001753 z^{1.5}}
+            {1 - 0.4177 z^{0.5} + 0.05729 z - 0.006205 z^{1.5} + 0.001210 z^2}
+
+        :math:`CRR_{7.5}` is given by the clean-sand corrected N-value,
+
+        .. math:: CRR_{7.5} = \frac{1}{34 - (N_1)_{60cs}} + \frac{(N_1)_{60cs}}{135}
+            + \frac{50}{\left[10 \cdot (N_1)_{60cs} + 45\right]^2} - \frac{1}{200}
+
+        .. math:: (N_1)_{60cs} = \alpha + \beta \cdot (N_1)_{60}
+
+        where :math:`(N_1)_{60}` is given by :meth:`get_n1_60`, and :math:`\alpha` and
+        :math:`\beta` are given by the :term:`fines_content`. Layers with a :math:`(N_1)_{60cs}`
+        of 30 or more are too dense to liquefy and have an infinite factor of safety. The
+        overburden and sloping ground corrections, :math:`K_\sigma` and :math:`K_\alpha`, are not
+        applied.
+
+        The factor of safety is the outer product of a ratio for each layer and a ratio for each
+        scenario, so every scenario is evaluated without repeating the calculations of the layers.
 
-        return spt_hammer_efficiency_factor
+        .. admonition:: **Requires:**
+            :class: important
+
+            | :term:`top`
+            | :term:`bottom`
+            | :term:`vertical_total_stress`
+            | :term:`fines_content`
+            | and the columns required by :meth:`get_n1_60`
+
+        Parameters
+        ----------
+        magnitudes: float or array-like
+            Moment magnitude of each scenario.
+        pgas: float or array-like
+            Peak ground acceleration of each scenario as a fraction of the acceleration of gravity.
+            The scenarios are given by broadcasting `magnitudes` and `pgas` together, so a column
+            of magnitudes and a row of accelerations give every combination of the two.
+        refusal: int, default 50
+            Equivalent N-value for samples with total penetration less than 450 mm, see
+            :meth:`get_n_value`.
+        limit: bool, default False
+            If `True`, limits the N-value to `refusal` before the corrections, see
+            :meth:`get_n_value`.
+        atmospheric_pressure: float, default 100.0
+            Atmospheric pressure in the units of the stresses, see :meth:`get_n1_60`.
+        as_array: bool, default False
+            If `True`, return a ``float64`` array of the values with a column for each scenario
+            and a boolean mask of the missing values instead of a DataFrame.
+
+        Returns
+        -------
+        :external:class:`~pandas.DataFrame` or tuple of :external:class:`~numpy.ndarray`
+            :term:`liquefaction_factor_of_safety` of each layer with a column for each scenario,
+            labeled by its ``magnitude`` and ``pga``, or its values and missing value mask if
+            `as_array` is `True`.
+
+        Raises
+        ------
+        ValueError
+            If the scenarios cannot be broadcast together or are not positive, or if any value in
+            the hammer or sampler columns is not known, see :meth:`get_n60`.
+
+        See Also
+        --------
+        get_liquefaction_potential_index: Liquefaction potential index of each point for each
+            scenario.
+
+        References
+        ----------
+        .. [1] Youd, T. L., Idriss, I. M., Andrus, R. D., Arango, I., Castro, G., Christian, J. T.,
+           Dobry, R., Finn, W. D. L., Harder, L. F., Hynes, M. E., Ishihara, K., Koester, J. P.,
+           Liao, S. S. C., Marcuson, W. F., Martin, G. R., Mitchell, J. K., Moriwaki, Y., Power,
+           M. S., Robertson, P. K., Seed, R. B., Stokoe, K. H. (2001). Liquefaction resistance of
+           soils: Summary report from the 1996 NCEER and 1998 NCEER/NSF workshops on evaluation of
+           liquefaction resistance of soils. *Journal of Geotechnical and Geoenvironmental
+           Engineering*, 127(10), 817-833.
+           `<https://doi.org/10.1061/(ASCE)1090-0241(2001)127:10(817)>`_
+        """
+        magnitude, pga = _get_scenarios(magnitudes, pgas)
+        ratio = self._get_cyclic_resistance_ratio(refusal, limit, atmospheric_pressure)
+
+        factor_of_safety = np.multiply.outer(ratio, 10**2.24 / magnitude**2.56 / pga)
+        if as_array:
+            return factor_of_safety, np.isnan(factor_of_safety)
+        return pd.DataFrame(
+            factor_of_safety,
+            index=self._obj.index,
+            columns=_get_scenario_columns(magnitude, pga),
+        ).astype("Float64")
+
+    @profiled
+    @with_dtype_backend
+    def get_liquefaction_potential_index(  # noqa: PLR0913
+        self,
+        magnitudes,
+        pgas,
+        refusal=50,
+        limit=False,
+        *,
+        atmospheric_pressure: float = 100.0,
+        memory_budget: int = 64 * 2**20,
+    ) -> pd.DataFrame:
+        r"""Return the liquefaction potential index of each point for each earthquake scenario.
+
+        The factors of safety of :meth:`get_liquefaction_factor_of_safety` are integrated over the
+        top 20 m of each point with the weights of Iwasaki et al. [1]_,
+
+        .. math:: LPI = \sum_i F_i \cdot w(z_i) \cdot H_i
+
+        .. math:: F = \max(1 - FS, 0), \quad w(z) = 10 - 0.5 \cdot z
+
+        where :math:`z_i` and :math:`H_i` are the center depth and thickness of the part of each
+        layer above 20 m. Layers with a missing factor of safety or depth do not contribute to the
+        index. An index of 0 indicates a very low liquefaction potential, while an index over 15
+        indicates a very high liquefaction potential.
+
+        The layers are processed in chunks of rows, where the factors of safety of each chunk for
+        every scenario fit in `memory_budget`, and the indices of the points in each chunk are
+        summed with a segment reduction. As such, the factors of safety of all the layers and
+        scenarios are never held in memory at the same time.
+
+        .. admonition:: **Requires:**
+            :class: important
+
+            | :term:`point_id`
+            | and the columns required by :meth:`get_liquefaction_factor_of_safety`
+
+        Parameters
+        ----------
+        magnitudes: float or array-like
+            Moment magnitude of each scenario, see :meth:`get_liquefaction_factor_of_safety`.
+        pgas: float or array-like
+            Peak ground acceleration of each scenario, see
+            :meth:`get_liquefaction_factor_of_safety`.
+        refusal: int, default 50
+            Equivalent N-value for samples with total penetration less than 450 mm, see
+            :meth:`get_n_value`.
+        limit: bool, default False
+            If `True`, limits the N-value to `refusal` before the corrections, see
+            :meth:`get_n_value`.
+        atmospheric_pressure: float, default 100.0
+            Atmospheric pressure in the units of the stresses, see :meth:`get_n1_60`.
+        memory_budget: int, default 64 * 2**20
+            Maximum size in bytes of the factors of safety that are held at a time.
+
+        Returns
+        -------
+        :external:class:`~pandas.DataFrame`
+            :term:`liquefaction_potential_index` of each :term:`point_id` with a column for each
+            scenario, labeled by its ``magnitude`` and ``pga``.
+
+        Raises
+        ------
+        ValueError
+            If the scenarios cannot be broadcast together or are not positive, or if any value in
+            the hammer or sampler columns is not known, see :meth:`get_n60`.
+
+        References
+        ----------
+        .. [1] Iwasaki, T., Tatsuoka, F., Tokida, K., Yasuda, S. (1978). A practical method for
+           assessing soil liquefaction potential based on case studies at various sites in Japan.
+           *Proceedings of the 2nd International Conference on Microzonation*, San Francisco,
+           885-896.
+
+        Examples
+        --------
+        >>> df = pd.DataFrame(
+        ...     {
+        ...         "point_id": ["BH-1", "BH-1", "BH-2"],
+        ...         "top": [0.0, 1.5, 0.0],
+        ...         "bottom": [1.5, 3.0, 3.0],
+        ...         "sample_type": "spt",
+        ...         "sample_number": [1, 2, 1],
+        ...         "blows_1": [2, 6, 12],
+        ...         "blows_2": [3, 7, 15],
+        ...         "blows_3": [3, 8, 18],
+        ...         "pen_1": 150,
+        ...         "pen_2": 150,
+        ...         "pen_3": 150,
+        ...         "spt_hammer_country_ref": "us",
+        ...         "spt_hammer_type": "safety hammer",
+        ...         "spt_hammer_release": "rope and pulley",
+        ...         "spt_borehole_diameter": 100.0,
+        ...         "spt_sampler_type": "standard sampler",
+        ...         "spt_rod_length": [2.0, 4.0, 4.0],
+        ...         "vertical_total_stress": [14.0, 42.0, 28.0],
+        ...         "vertical_effective_stress": [9.0, 22.0, 15.0],
+        ...         "fines_content": [10.0, 10.0, 5.0],
+        ...     }
+        ... )
+        >>> lpi = df.geotech.in_situ.spt.get_liquefaction_potential_index(
+        ...     magnitudes=7.5, pgas=[0.1, 0.3]
+        ... )
+        >>> lpi.columns.tolist()
+        [(7.5, 0.1), (7.5, 0.3)]
+        >>> lpi[(7.5, 0.3)].round(2)
+        point_id
+        BH-1    13.56
+        BH-2      0.0
+        Name: (7.5, 0.3), dtype: Float64
+        """
+        magnitude, pga = _get_scenarios(magnitudes, pgas)
+        ratio = self._get_cyclic_resistance_ratio(refusal, limit, atmospheric_pressure)
+        scenario_ratio = 10**2.24 / magnitude**2.56 / pga
+
+        top, bottom = np.clip(
+            self._get_float_array(["top", "bottom"]), 0.0, LIQUEFACTION_INDEX_MAX_DEPTH
+        ).T
+        weight = np.nan_to_num((10 - 0.25 * (top + bottom)) * (bottom - top))
+
+        order, offsets, labels = get_groups(self._obj["point_id"])
+        index = np.zeros((len(labels), len(magnitude)))
+        chunksize = max(1, memory_budget // (8 * max(len(magnitude), 1)))
+        for start in range(0, len(order), chunksize):
+            stop = min(start + chunksize, len(order))
+            rows = order[start:stop]
+            severity = np.multiply.outer(ratio[rows], scenario_ratio)
+            np.subtract(1.0, severity, out=severity)
+            np.fmax(severity, 0.0, out=severity)
+            severity *= weight[rows, np.newaxis]
+
+            # Sum the rows of each point in the chunk, where the first point may have started in
+            # an earlier chunk and the last point may continue in a later chunk.
+            first = np.searchsorted(offsets, start, side="right") - 1
+            last = np.searchsorted(offsets, stop, side="left")
+            starts = np.maximum(offsets[first:last], start) - start
+            index[first:last] += np.add.reduceat(severity, starts, axis=0)
+
+        return pd.DataFrame(
+            index,
+            index=pd.Index(labels, name="point_id"),
+            columns=_get_scenario_columns(magnitude, pga),
+        ).astype("Float64")
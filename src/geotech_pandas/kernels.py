@@ -0,0 +1,188 @@
+"""Kernels for loops over the layers of each point.
+
+Operations that are sequential within a point are written as loops over the layers of each point,
+where the layers are sorted by point and the points are delimited by offsets. When Numba is
+installed, the loops are compiled on their first call. Otherwise, or when the ``kernel_backend``
+option is set to ``"numpy"``, an equivalent NumPy implementation that gives identical results is
+used instead.
+
+With the default ``"auto"`` backend, Numba is only used for arrays with at least
+:data:`NUMBA_MIN_SIZE` elements, where the time saved outweighs the cost of importing Numba and
+loading the compiled loops.
+"""
+
+import functools
+import importlib.util
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from geotech_pandas.config import get_option
+
+NUMBA_MIN_SIZE = 100_000
+
+_compiled: dict[str, Callable[..., Any]] = {}
+
+
+@functools.cache
+def _is_numba_installed() -> bool:
+    return importlib.util.find_spec("numba") is not None
+
+
+def get_backend(size: int = NUMBA_MIN_SIZE) -> str:
+    """Return the kernel backend that is used for arrays of the given size.
+
+    Parameters
+    ----------
+    size: int, default NUMBA_MIN_SIZE
+        Number of elements processed by the kernel.
+
+    Returns
+    -------
+    str
+        ``"numba"`` or ``"numpy"``. If the ``kernel_backend`` option is ``"auto"``, Numba is used
+        when it is installed and `size` is at least :data:`NUMBA_MIN_SIZE`.
+
+    Raises
+    ------
+    ImportError
+        When the ``kernel_backend`` option is ``"numba"`` and Numba is not installed.
+    """
+    backend = get_option("kernel_backend")
+    if backend == "numba" and not _is_numba_installed():
+        raise ImportError("numba is required for the 'numba' kernel backend.")
+    if backend == "auto":
+        return "numba" if _is_numba_installed() and size >= NUMBA_MIN_SIZE else "numpy"
+    return backend
+
+
+def _get_compiled(loop: Callable[..., Any]) -> Callable[..., Any]:
+    """Compile and cache a loop with Numba."""
+    name = loop.__name__
+    if name not in _compiled:
+        import numba  # noqa: PLC0415
+
+        _compiled[name] = numba.njit(cache=True)(loop)
+    return _compiled[name]
+
+
+def get_groups(point_id: pd.Series) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return the order, offsets and labels that group the layers by point.
+
+    Layers with a missing ``point_id`` are excluded, like in
+    :external:meth:`pandas.DataFrame.groupby`.
+
+    Parameters
+    ----------
+    point_id: :external:class:`~pandas.Series`
+        :term:`point_id` of each layer.
+
+    Returns
+    -------
+    tuple of :external:class:`~numpy.ndarray`
+        Positions that stably sort the layers by point, the offsets where the layers of each point
+        start in that order, with the total number of layers as the last offset, and the sorted
+        labels of the points.
+    """
+    codes, labels = pd.factorize(point_id, sort=True)
+    order = np.argsort(codes, kind="stable")
+    order = order[codes[order] >= 0]
+    offsets = np.zeros(len(labels) + 1, dtype=np.int64)
+    np.cumsum(np.bincount(codes[order], minlength=len(labels)), out=offsets[1:])
+    return order, offsets, np.asarray(labels)
+
+
+def _group_shift_loop(
+    values: np.ndarray, offsets: np.ndarray, fill_value: float, out: np.ndarray
+) -> None:
+    for group in range(len(offsets) - 1):
+        start = offsets[group]
+        end = offsets[group + 1]
+        if start < end:
+            out[start] = fill_value
+        for i in range(start + 1, end):
+            out[i] = values[i - 1]
+
+
+def _group_shift_numpy(
+    values: np.ndarray, offsets: np.ndarray, fill_value: float, out: np.ndarray
+) -> None:
+    out[1:] = values[:-1]
+    out[offsets[:-1][np.diff(offsets) > 0]] = fill_value
+
+
+def group_shift(values: np.ndarray, offsets: np.ndarray, fill_value: float) -> np.ndarray:
+    """Shift the values down by one layer within each point.
+
+    Parameters
+    ----------
+    values: :external:class:`~numpy.ndarray`
+        ``float64`` values sorted by point.
+    offsets: :external:class:`~numpy.ndarray`
+        Offsets where the layers of each point start, see :func:`get_groups`.
+    fill_value: float
+        Value of the first layer of each point.
+
+    Returns
+    -------
+    :external:class:`~numpy.ndarray`
+        Shifted values.
+    """
+    out = np.empty(len(values))
+    loop = (
+        _get_compiled(_group_shift_loop)
+        if get_backend(len(values)) == "numba"
+        else _group_shift_numpy
+    )
+    loop(values, offsets, fill_value, out)
+    return out
+
+
+def _group_is_increasing_loop(values: np.ndarray, offsets: np.ndarray, out: np.ndarray) -> None:
+    for group in range(len(offsets) - 1):
+        increasing = True
+        for i in range(offsets[group], offsets[group + 1]):
+            if np.isnan(values[i]) or (i > offsets[group] and values[i] < values[i - 1]):
+                increasing = False
+                break
+        out[group] = increasing
+
+
+def _group_is_increasing_numpy(values: np.ndarray, offsets: np.ndarray, out: np.ndarray) -> None:
+    bad = np.isnan(values)
+    bad[1:] |= values[1:] < values[:-1]
+    starts = offsets[:-1]
+    if len(values) > 0:
+        # The first layer of each point is not compared with the last layer of the previous point.
+        bad[starts] = np.isnan(values[starts])
+        out[:] = ~np.logical_or.reduceat(bad, starts)
+
+
+def group_is_increasing(values: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """Return whether the values are monotonically increasing within each point.
+
+    Like :external:attr:`pandas.Series.is_monotonic_increasing`, a point with any `NaN` value is
+    not increasing.
+
+    Parameters
+    ----------
+    values: :external:class:`~numpy.ndarray`
+        ``float64`` values sorted by point.
+    offsets: :external:class:`~numpy.ndarray`
+        Offsets where the layers of each point start, see :func:`get_groups`.
+
+    Returns
+    -------
+    :external:class:`~numpy.ndarray`
+        Boolean array with a value for each point.
+    """
+    out = np.ones(len(offsets) - 1, dtype=bool)
+    loop = (
+        _get_compiled(_group_is_increasing_loop)
+        if get_backend(len(values)) == "numba"
+        else _group_is_increasing_numpy
+    )
+    loop(values, offsets, out)
+    return out
@@ -1,10 +1,81 @@
 """Subaccessor that contains methods related to index property tests."""
 
+from typing import cast
+
 import numpy as np
 import pandas as pd
 
 from geotech_pandas.base import GeotechPandasBase
-from geotech_pandas.helpers import _get_linear_forecast
+from geotech_pandas.helpers import _get_linear_fits, _interpolate_rows
+from geotech_pandas.profiling import profiled
+from geotech_pandas.utils import with_dtype_backend
+
+# Group symbols of the Unified Soil Classification System, in the order of their category codes.
+USCS_SYMBOLS = [
+    "GW", "GP", "GW-GM", "GW-GC", "GP-GM", "GP-GC", "GM", "GC", "GC-GM",
+    "SW", "SP", "SW-SM", "SW-SC", "SP-SM", "SP-SC", "SM", "SC", "SC-SM",
+    "ML", "CL-ML", "CL", "MH", "CH",
+]  # fmt: skip
+
+# Plasticity chart zones of the fines, in the order of their zone codes.
+USCS_FINES_ZONES = ["ML", "CL-ML", "CL", "MH", "CH"]
+
+# Group symbols of coarse-grained soils by gravel or sand, well or poorly graded, and fines zone,
+# with a table for each range of fines content: less than 5%, from 5% to 12%, and more than 12%.
+_COARSE_SYMBOLS = {
+    "clean": [[["GW"] * 5, ["GP"] * 5], [["SW"] * 5, ["SP"] * 5]],
+    "dual": [
+        [
+            ["GW-GM", "GW-GC", "GW-GC", "GW-GM", "GW-GC"],
+            ["GP-GM", "GP-GC", "GP-GC", "GP-GM", "GP-GC"],
+        ],
+        [
+            ["SW-SM", "SW-SC", "SW-SC", "SW-SM", "SW-SC"],
+            ["SP-SM", "SP-SC", "SP-SC", "SP-SM", "SP-SC"],
+        ],
+    ],
+    "fines": [[["GM", "GC-GM", "GC", "GM", "GC"]] * 2, [["SM", "SC-SM", "SC", "SM", "SC"]] * 2],
+}
+
+# Category codes indexed by range of fines content, gravel or sand, grading and fines zone, where
+# fine-grained soils with 50% fines or more only depend on the fines zone.
+USCS_CODE_TABLE = np.array(
+    [
+        [
+            [[USCS_SYMBOLS.index(symbol) for symbol in zones] for zones in gradings]
+            for gradings in kinds
+        ]
+        for kinds in [
+            _COARSE_SYMBOLS["clean"],
+            _COARSE_SYMBOLS["dual"],
+            _COARSE_SYMBOLS["fines"],
+            [[USCS_FINES_ZONES] * 2] * 2,
+        ]
+    ]
+)
+
+# Sieve sizes that separate the gravel from the sand and the sand from the fines, mm.
+GRAVEL_SIZE_MIN = 4.75
+SAND_SIZE_MIN = 0.075
+
+# Percentages passing of the characteristic grain sizes, in the order of their columns.
+GRAIN_SIZES = {"d10": 10.0, "d30": 30.0, "d60": 60.0}
+
+# Limits of the ranges of fines content, %.
+FINES_CONTENT_CLEAN_MAX = 5.0
+FINES_CONTENT_DUAL_MAX = 12.0
+FINES_CONTENT_FINE_GRAINED_MIN = 50.0
+
+# Limits of the zones of the plasticity chart.
+LIQUID_LIMIT_HIGH_MIN = 50.0
+PLASTICITY_INDEX_CL_ML_MIN = 4.0
+PLASTICITY_INDEX_CL_ML_MAX = 7.0
+
+# Gradation criteria of well-graded gravels and sands.
+GRAVEL_UNIFORMITY_MIN = 4.0
+SAND_UNIFORMITY_MIN = 6.0
+CURVATURE_MIN = 1.0
+CURVATURE_MAX = 3.0
 
 
 class IndexDataFrameAccessor(GeotechPandasBase):
@@ -36,7 +107,48 @@ class IndexDataFrameAccessor(GeotechPandasBase):
            https://doi.org/10.1520/D4318-17E01
     """
 
-    def get_moisture_content(self, prefix="moisture_content") -> pd.Series:
+    def _join_samples(
+        self, samples: pd.DataFrame, method: str, as_array: bool, **kwargs
+    ) -> pd.Series | tuple[np.ndarray, np.ndarray]:
+        """Calculate the results of `method` on a sample table and join them back to the layers.
+
+        Parameters
+        ----------
+        samples: :external:class:`~pandas.DataFrame`
+            Table of laboratory samples with :term:`point_id` and :term:`bottom` columns.
+        method: str
+            Name of the method to call on the sample table.
+        as_array: bool
+            If `True`, return a ``float64`` array of the values and a boolean mask of the missing
+            values instead of a Series.
+        **kwargs
+            Keyword arguments passed to `method`.
+
+        Returns
+        -------
+        :external:class:`~pandas.Series` or tuple of :external:class:`~numpy.ndarray`
+            Results aligned with the layers, where layers without a sample are `NA`.
+        """
+        result = getattr(samples.geotech.lab.index, method)(**kwargs)
+        sample_keys = pd.MultiIndex.from_frame(samples[["point_id", "bottom"]])
+        layer_keys = pd.MultiIndex.from_frame(self._obj[["point_id", "bottom"]])
+        result = result.set_axis(sample_keys).reindex(layer_keys).set_axis(self._obj.index)
+        if as_array:
+            return result.to_numpy(dtype="float64", na_value=np.nan), result.isna().to_numpy()
+        return result
+
+    def _get_lab_dtype(self, columns: list[str]) -> str | pd.SparseDtype:
+        """Return a sparse dtype if any of the columns is sparse, otherwise ``"Float64"``."""
+        return self._get_numeric_dtype(columns) if self._is_sparse(columns) else "Float64"
+
+    @profiled
+    @with_dtype_backend
+    def get_moisture_content(
+        self,
+        prefix="moisture_content",
+        samples: pd.DataFrame | None = None,
+        as_array: bool = False,
+    ) -> pd.Series | tuple[np.ndarray, np.ndarray]:
         r"""Calculate and return the moisture content according to ASTM D2216.
 
         This method allows the use of `prefix` where it is possible to specify the prefix and name
@@ -55,11 +167,20 @@ class IndexDataFrameAccessor(GeotechPandasBase):
         prefix: string, default "moisture_content"
             Prefix to use for looking up the relevant columns. This is also used as the prefix of
             the name of the resulting series if using a non-default value.
+        samples: :external:class:`~pandas.DataFrame`, optional
+            Separate table of laboratory samples with :term:`point_id` and :term:`bottom` columns,
+            where the required columns are looked up instead. The results are joined back to the
+            layers with the same :term:`point_id` and :term:`bottom`, and layers without a sample
+            are `NA`.
+        as_array: bool, default False
+            If `True`, return a ``float64`` array of the values and a boolean mask of the missing
+            values instead of a Series.
 
         Returns
         -------
-        :external:class:`~pandas.Series`
-            Series with moisture content values.
+        :external:class:`~pandas.Series` or tuple of :external:class:`~numpy.ndarray`
+            Series with moisture content values, or its values and missing value mask if
+            `as_array` is `True`.
 
         Notes
         -----
@@ -118,16 +239,165 @@ class IndexDataFrameAccessor(GeotechPandasBase):
         0    38.900344
         Name: liquid_limit_1_moisture_content, dtype: float64
         """
-        columns = [f"{prefix}_mass_moist", f"{prefix}_mass_dry", f"{prefix}_mass_container"]
+        if samples is not None:
+            return self._join_samples(samples, "get_moisture_content", as_array, prefix=prefix)
+
+        columns, moisture_content = self._calculate_moisture_contents([prefix])
+        return self._get_result(
+            moisture_content[:, 0],
+            np.isnan(moisture_content[:, 0]),
+            as_array,
+            name=self._get_moisture_content_name(prefix),
+            dtype=self._get_numeric_dtype(columns, integer=False),
+        )
+
+    @staticmethod
+    def _get_moisture_content_name(prefix: str) -> str:
+        """Return the name of the moisture content calculated from the columns of `prefix`."""
+        return f"{prefix}_moisture_content" if prefix != "moisture_content" else prefix
+
+    def _find_moisture_content_prefixes(self) -> list[str]:
+        """Return the prefixes of every complete set of moisture content columns.
+
+        A prefix is found when the DataFrame has its :term:`{prefix}_mass_moist`,
+        :term:`{prefix}_mass_dry` and :term:`{prefix}_mass_container` columns. The prefixes are
+        returned in the order of their :term:`{prefix}_mass_moist` columns.
+        """
+        columns = set(self._obj.columns)
+        return [
+            column.removesuffix("_mass_moist")
+            for column in self._obj.columns
+            if isinstance(column, str)
+            and column.endswith("_mass_moist")
+            and {
+                column.replace("_mass_moist", "_mass_dry"),
+                column.replace("_mass_moist", "_mass_container"),
+            }
+            <= columns
+        ]
+
+    @profiled
+    def _calculate_moisture_contents(self, prefixes: list[str]) -> tuple[list[str], np.ndarray]:
+        """Calculate the moisture content of each prefix in one vectorized operation.
+
+        The masses of every prefix are stacked into a single ``float64`` array with a row for each
+        layer, a slice for each prefix and a column for each mass, so all the moisture contents are
+        calculated at once.
+
+        Parameters
+        ----------
+        prefixes: list of str
+            Prefixes of the :term:`{prefix}_mass_moist`, :term:`{prefix}_mass_dry` and
+            :term:`{prefix}_mass_container` columns.
+
+        Returns
+        -------
+        tuple
+            The required columns, and a ``float64`` array of the moisture contents with a row for
+            each layer and a column for each prefix, which is `NaN` where it is missing.
+        """
+        columns = [
+            f"{prefix}_{mass}"
+            for prefix in prefixes
+            for mass in ["mass_moist", "mass_dry", "mass_container"]
+        ]
         self._validate_columns(columns)
 
-        moist = self._obj[columns[0]]
-        dry = self._obj[columns[1]]
-        container = self._obj[columns[2]]
-        prefix = f"{prefix}_moisture_content" if prefix != "moisture_content" else prefix
-        moisture_content = pd.Series((moist - dry) / (dry - container) * 100, name=prefix)
+        positions = self._get_populated_positions(columns) if self._is_sparse(columns) else None
+        masses = self._get_float_array(columns, positions).reshape(-1, len(prefixes), 3)
+        moist, dry, container = masses[..., 0], masses[..., 1], masses[..., 2]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            moisture_content = (moist - dry) / (dry - container) * 100
+        if positions is not None:
+            moisture_content = np.column_stack(
+                [self._scatter(values, positions) for values in moisture_content.T]
+            )
+        return columns, moisture_content
+
+    @profiled
+    @with_dtype_backend
+    def get_moisture_contents(
+        self, prefixes: list[str] | None = None, samples: pd.DataFrame | None = None
+    ) -> pd.DataFrame:
+        """Calculate and return the moisture content of many prefixes according to ASTM D2216.
 
-        return moisture_content
+        This is the batch version of :meth:`get_moisture_content`, which validates the columns and
+        calculates the moisture contents of every prefix in one pass, such as the natural moisture
+        content and the moisture contents of the trials of the Atterberg limits.
+
+        .. admonition:: **Requires:**
+            :class: important
+
+            | :term:`{prefix}_mass_moist`
+            | :term:`{prefix}_mass_dry`
+            | :term:`{prefix}_mass_container`
+
+        Parameters
+        ----------
+        prefixes: list of str, optional
+            Prefixes to use for looking up the relevant columns, see :meth:`get_moisture_content`.
+            If `None`, every prefix with all three mass columns is used.
+        samples: :external:class:`~pandas.DataFrame`, optional
+            Separate table of laboratory samples with :term:`point_id` and :term:`bottom` columns,
+            where the required columns are looked up instead, see :meth:`get_moisture_content`.
+
+        Returns
+        -------
+        :external:class:`~pandas.DataFrame`
+            Moisture content of each prefix, named like the results of
+            :meth:`get_moisture_content`.
+
+        Raises
+        ------
+        ValueError
+            When `prefixes` is empty, or when it is `None` and no prefix is found.
+
+        Examples
+        --------
+        >>> df = pd.DataFrame(
+        ...     {
+        ...         "point_id": ["BH-1"],
+        ...         "bottom": [1.0],
+        ...         "moisture_content_mass_moist": [236.44],
+        ...         "moisture_content_mass_dry": [174.40],
+        ...         "moisture_content_mass_container": [22.20],
+        ...         "liquid_limit_1_mass_moist": [23.51],
+        ...         "liquid_limit_1_mass_dry": [17.85],
+        ...         "liquid_limit_1_mass_container": [3.30],
+        ...     }
+        ... )
+        >>> df.geotech.lab.index.get_moisture_contents()["liquid_limit_1_moisture_content"]
+        0    38.900344
+        Name: liquid_limit_1_moisture_content, dtype: float64
+        """
+        if samples is not None:
+            return cast(
+                pd.DataFrame,
+                self._join_samples(samples, "get_moisture_contents", False, prefixes=prefixes),
+            )
+
+        if prefixes is None:
+            prefixes = self._find_moisture_content_prefixes()
+            if not prefixes:
+                raise ValueError(
+                    "No columns ending with _mass_moist, _mass_dry and _mass_container were found."
+                )
+        elif not prefixes:
+            raise ValueError("At least one prefix must be given.")
+
+        columns, moisture_content = self._calculate_moisture_contents(prefixes)
+        return pd.concat(
+            [
+                self._to_series(
+                    values,
+                    np.isnan(values),
+                    self._get_moisture_content_name(prefix),
+                    self._get_numeric_dtype(columns[3 * i : 3 * i + 3], integer=False),
+                )
+                for i, (prefix, values) in enumerate(zip(prefixes, moisture_content.T, strict=True))
+            ],
+            axis=1,
+        )
 
     def _prepare_liquid_limit_data(self, trials: int) -> list[str]:
         """Prepare and validate the required columns for liquid limit calculations.
@@ -162,11 +432,16 @@ class IndexDataFrameAccessor(GeotechPandasBase):
         self._validate_columns(columns)
         return columns
 
-    def _transform_liquid_limit_data(self, columns: list[str]) -> pd.DataFrame:
-        """Transform liquid limit data into a format suitable for analysis.
+    @profiled
+    def _transform_liquid_limit_data(
+        self, columns: list[str], positions: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Transform liquid limit data into a row for each sample and a column for each trial.
 
-        This method melts and pivots the DataFrame to organize the liquid limit data by trial,
-        including the logarithm of the number of drops for interpolation.
+        The trial columns are gathered by position straight into a single ``float64`` array, so
+        the data is never reshaped through a long table. Only the rows at `positions` are
+        gathered, so the size of the array follows the number of tested samples instead of the
+        number of layers.
 
         .. admonition:: **Requires:**
             :class: important
@@ -177,43 +452,76 @@ class IndexDataFrameAccessor(GeotechPandasBase):
         Parameters
         ----------
         columns: list of str
-            A list of column names to include in the transformation.
+            A list of column names to include in the transformation, as returned by
+            :meth:`_prepare_liquid_limit_data`.
+        positions: :external:class:`~numpy.ndarray`
+            Integer positions of the rows with liquid limit data.
 
         Returns
         -------
-        :external:class:`~pandas.DataFrame`
-            A transformed DataFrame with trial-specific liquid limit data, including a column
-            for the logarithm of the number of drops.
+        tuple of :external:class:`~numpy.ndarray`
+            ``float64`` arrays of the number of drops and moisture content with a row for each
+            position and a column for each trial.
         """
-        melted_df = pd.melt(
-            self._obj[columns],
-            id_vars=["point_id", "bottom"],
-            value_vars=[col for col in columns if "drops" in col or "moisture_content" in col],
-            var_name="variable",
-            value_name="value",
-        )
-        melted_df["type"] = (
-            melted_df["variable"].str.extract(r"(drops|moisture_content)").fillna("")
-        )
-        melted_df["trial_id"] = melted_df["variable"].str.extract(r"(\d+)").astype(int)
+        values = self._get_float_array(columns[2:], positions)
+        return values[:, 0::2], values[:, 1::2]
 
-        df = melted_df.pivot_table(
-            index=["point_id", "bottom", "trial_id"],
-            columns="type",
-            values="value",
-            aggfunc="first",
-        ).reset_index()
+    def _fit_flow_curve(self, trials: int) -> tuple[list[str], dict[str, np.ndarray]]:
+        """Fit the flow curve of each sample and return the required columns and the results.
 
-        df["drops_log"] = np.log(df["drops"])
-        df = df.sort_values(["point_id", "bottom", "drops_log"])
+        The flow curve is a least-squares line through the moisture content against the natural
+        logarithm of the number of drops of the trials of each sample, where the trials without
+        both a number of drops and a moisture content are excluded. The lines of all the samples
+        are solved at once in closed form.
 
-        return df
+        Parameters
+        ----------
+        trials: int
+            The number of trials to include in the fit.
 
-    def get_liquid_limit(self, trials: int = 3) -> pd.Series:
+        Returns
+        -------
+        tuple
+            The required columns, and a dictionary of ``float64`` arrays aligned with the layers
+            of the ``liquid_limit``, ``flow_index``, ``r_squared`` and number of ``trials`` used
+            in the fit of each sample, which are `NaN` for layers without a sample.
+        """
+        columns = self._prepare_liquid_limit_data(trials)
+        positions = self._get_populated_positions(columns[2:])
+        fit = {
+            name: np.full(len(self._obj), np.nan)
+            for name in ["liquid_limit", "flow_index", "r_squared", "trials"]
+        }
+
+        if len(positions) > 0:
+            drops, moisture_content = self._transform_liquid_limit_data(columns, positions)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                drops_log = np.log(np.where(drops > 0, drops, np.nan))
+            intercept, slope, r_squared, count = _get_linear_fits(drops_log, moisture_content)
+
+            values = {
+                "liquid_limit": intercept + slope * np.log(25),
+                # The flow index is the decrease of the moisture content over a log cycle.
+                "flow_index": -slope * np.log(10),
+                "r_squared": r_squared,
+                "trials": count.astype("float64"),
+            }
+            fit = {name: self._scatter(value, positions) for name, value in values.items()}
+
+        return columns, fit
+
+    @profiled
+    @with_dtype_backend
+    def get_liquid_limit(
+        self, trials: int = 3, samples: pd.DataFrame | None = None, as_array: bool = False
+    ) -> pd.Series | tuple[np.ndarray, np.ndarray]:
         """Calculate and return the liquid limit according to ASTM D4318 Method A Multipoint Method.
 
         This method computes the liquid limit by interpolating the moisture content at 25 drops
         using the logarithm of the number of drops and the corresponding moisture content values.
+        The least-squares lines of all the samples are solved at once in closed form, see
+        :meth:`get_flow_curve`. Samples with less than two trials with both a number of drops and
+        a moisture content, or where all the trials have the same number of drops, are `NA`.
 
         .. admonition:: **Requires:**
             :class: important
@@ -225,12 +533,20 @@ class IndexDataFrameAccessor(GeotechPandasBase):
         ----------
         trials: int, default 3
             The number of trials to be considered for interpolation.
+        samples: :external:class:`~pandas.DataFrame`, optional
+            Separate table of laboratory samples with :term:`point_id` and :term:`bottom` columns,
+            where the required columns are looked up instead. The results are joined back to the
+            layers with the same :term:`point_id` and :term:`bottom`, and layers without a sample
+            are `NA`.
+        as_array: bool, default False
+            If `True`, return a ``float64`` array of the values and a boolean mask of the missing
+            values instead of a Series.
 
         Returns
         -------
-        :external:class:`~pandas.Series`
+        :external:class:`~pandas.Series` or tuple of :external:class:`~numpy.ndarray`
             Series with liquid limit values, calculated by interpolating the moisture content
-            at 25 drops.
+            at 25 drops, or its values and missing value mask if `as_array` is `True`.
 
         References
         ----------
@@ -256,31 +572,110 @@ class IndexDataFrameAccessor(GeotechPandasBase):
         0    47.539917
         Name: liquid_limit, dtype: Float64
         """
-        columns = self._prepare_liquid_limit_data(trials)
-        df = self._transform_liquid_limit_data(columns)
-
-        liquid_limit = df.groupby(["point_id", "bottom"]).apply(
-            lambda group: _get_linear_forecast(
-                group=group,
-                x_col_name="drops_log",
-                y_col_name="moisture_content",
-                x_target=np.log(25),
-            ),
-            include_groups=False,
-        )
-        liquid_limit.name = "liquid_limit"
-        df = liquid_limit.reset_index()
-        df = pd.merge(
-            self._obj[["point_id", "bottom"]],
-            df,
-            on=["point_id", "bottom"],
-            how="left",
+        if samples is not None:
+            return self._join_samples(samples, "get_liquid_limit", as_array, trials=trials)
+
+        columns, fit = self._fit_flow_curve(trials)
+        liquid_limit = fit["liquid_limit"]
+        return self._get_result(
+            liquid_limit,
+            np.isnan(liquid_limit),
+            as_array,
+            name="liquid_limit",
+            dtype=self._get_lab_dtype(columns[2:]),
         )
-        liquid_limit = df["liquid_limit"].astype("Float64")
 
-        return liquid_limit
+    @profiled
+    @with_dtype_backend
+    def get_flow_curve(self, trials: int = 3, samples: pd.DataFrame | None = None) -> pd.DataFrame:
+        r"""Calculate and return the flow curve of the liquid limit test with fit diagnostics.
+
+        The flow curve of each sample is the least-squares line of the moisture content against
+        the logarithm of the number of drops of its trials,
+
+        .. math:: w = a + b \cdot \ln N
+
+        which is solved in closed form for all the samples at once. The liquid limit is the
+        moisture content of the line at 25 drops, like in :meth:`get_liquid_limit`, and the flow
+        index is the decrease of the moisture content over one log cycle of the number of drops,
+
+        .. math:: I_F = -b \cdot \ln 10
+
+        Trials without both a number of drops and a moisture content are excluded. Samples with
+        less than two trials, or where all the trials have the same number of drops, are `NA`.
+
+        .. admonition:: **Requires:**
+            :class: important
+
+            | :term:`liquid_limit_{n}_drops`
+            | :term:`liquid_limit_{n}_moisture_content`
+
+        Parameters
+        ----------
+        trials: int, default 3
+            The number of trials to be considered for the fit.
+        samples: :external:class:`~pandas.DataFrame`, optional
+            Separate table of laboratory samples with :term:`point_id` and :term:`bottom` columns,
+            where the required columns are looked up instead, see :meth:`get_liquid_limit`.
+
+        Returns
+        -------
+        :external:class:`~pandas.DataFrame`
+            :term:`liquid_limit`, :term:`flow_index`, :term:`flow_curve_r_squared` and
+            :term:`flow_curve_trials` columns. The coefficient of determination is `NA` for
+            samples where all the trials have the same moisture content.
 
-    def get_plastic_limit(self) -> pd.Series:
+        References
+        ----------
+        .. [1] ASTM International. (2018). *Standard test methods for liquid limit, plastic limit,
+           and plasticity index of soils* (ASTM D4318-17e1).
+           https://doi.org/10.1520/D4318-17E01
+
+        Examples
+        --------
+        >>> df = pd.DataFrame(
+        ...     {
+        ...         "point_id": ["BH-1"],
+        ...         "bottom": [1.0],
+        ...         "liquid_limit_1_drops": [23],
+        ...         "liquid_limit_1_moisture_content": [48.1],
+        ...         "liquid_limit_2_drops": [28],
+        ...         "liquid_limit_2_moisture_content": [46.7],
+        ...         "liquid_limit_3_drops": [33],
+        ...         "liquid_limit_3_moisture_content": [46.1],
+        ...     }
+        ... )
+        >>> df.geotech.lab.index.get_flow_curve().round(3)
+           liquid_limit  flow_index  flow_curve_r_squared  flow_curve_trials
+        0         47.54      12.874                  0.97                  3
+        """
+        if samples is not None:
+            return cast(
+                pd.DataFrame, self._join_samples(samples, "get_flow_curve", False, trials=trials)
+            )
+
+        columns, fit = self._fit_flow_curve(trials)
+        dtype = self._get_lab_dtype(columns[2:])
+        return pd.concat(
+            [
+                self._to_series(
+                    fit[key], np.isnan(fit[key]), name, dtype if key != "trials" else "Int64"
+                )
+                for key, name in [
+                    ("liquid_limit", "liquid_limit"),
+                    ("flow_index", "flow_index"),
+                    ("r_squared", "flow_curve_r_squared"),
+                    ("trials", "flow_curve_trials"),
+                ]
+            ],
+            axis=1,
+        )
+
+    @profiled
+    @with_dtype_backend
+    def get_plastic_limit(
+        self, samples: pd.DataFrame | None = None, as_array: bool = False
+    ) -> pd.Series | tuple[np.ndarray, np.ndarray]:
         """Calculate and return the plastic limit according to ASTM D4318.
 
         The plastic limit is calculated as the average of two moisture content measurements
@@ -292,10 +687,22 @@ class IndexDataFrameAccessor(GeotechPandasBase):
             | :term:`plastic_limit_1_moisture_content`
             | :term:`plastic_limit_2_moisture_content`
 
+        Parameters
+        ----------
+        samples: :external:class:`~pandas.DataFrame`, optional
+            Separate table of laboratory samples with :term:`point_id` and :term:`bottom` columns,
+            where the required columns are looked up instead. The results are joined back to the
+            layers with the same :term:`point_id` and :term:`bottom`, and layers without a sample
+            are `NA`.
+        as_array: bool, default False
+            If `True`, return a ``float64`` array of the values and a boolean mask of the missing
+            values instead of a Series.
+
         Returns
         -------
-        :external:class:`~pandas.Series`
-            Series with plastic limit values.
+        :external:class:`~pandas.Series` or tuple of :external:class:`~numpy.ndarray`
+            Series with plastic limit values, or its values and missing value mask if `as_array`
+            is `True`.
 
         References
         ----------
@@ -317,21 +724,31 @@ class IndexDataFrameAccessor(GeotechPandasBase):
         0    29.4
         Name: plastic_limit, dtype: Float64
         """
-        self._validate_columns(
-            ["plastic_limit_1_moisture_content", "plastic_limit_2_moisture_content"]
-        )
+        if samples is not None:
+            return self._join_samples(samples, "get_plastic_limit", as_array)
+
+        columns = ["plastic_limit_1_moisture_content", "plastic_limit_2_moisture_content"]
+        self._validate_columns(columns)
 
-        plastic_limit = pd.Series(
-            self._obj[
-                ["plastic_limit_1_moisture_content", "plastic_limit_2_moisture_content"]
-            ].mean(axis=1),
+        positions = self._get_populated_positions(columns) if self._is_sparse(columns) else None
+        values = self._get_float_array(columns, positions)
+        count = (~np.isnan(values)).sum(axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            plastic_limit = np.nansum(values, axis=1) / count
+        if positions is not None:
+            plastic_limit = self._scatter(plastic_limit, positions)
+
+        return self._get_result(
+            plastic_limit,
+            np.isnan(plastic_limit),
+            as_array,
             name="plastic_limit",
+            dtype=self._get_lab_dtype(columns),
         )
-        plastic_limit = plastic_limit.astype("Float64")
-
-        return plastic_limit
 
-    def is_nonplastic(self) -> pd.Series:
+    @profiled
+    @with_dtype_backend
+    def is_nonplastic(self, as_array: bool = False) -> pd.Series | tuple[np.ndarray, np.ndarray]:
         """Check if a layer is nonplastic.
 
         A layer is considered nonplastic if the plastic limit is greater than or equal to the
@@ -343,10 +760,17 @@ class IndexDataFrameAccessor(GeotechPandasBase):
             | :term:`liquid_limit`
             | :term:`plastic_limit`
 
+        Parameters
+        ----------
+        as_array: bool, default False
+            If `True`, return a boolean array of the values and a boolean mask of the missing
+            values instead of a Series.
+
         Returns
         -------
-        :external:class:`~pandas.Series`
-            Boolean series indicating whether each layer is nonplastic.
+        :external:class:`~pandas.Series` or tuple of :external:class:`~numpy.ndarray`
+            Boolean series indicating whether each layer is nonplastic, or its values and missing
+            value mask if `as_array` is `True`.
 
         References
         ----------
@@ -372,14 +796,26 @@ class IndexDataFrameAccessor(GeotechPandasBase):
         """
         self._validate_columns(["liquid_limit", "plastic_limit"])
 
-        liquid_limit = self._obj["liquid_limit"]
-        plastic_limit = self._obj["plastic_limit"]
-        is_nonplastic = (plastic_limit >= liquid_limit) | liquid_limit.isna() | plastic_limit.isna()
-        is_nonplastic.name = "is_nonplastic"
+        columns = ["liquid_limit", "plastic_limit"]
+        liquid_limit, plastic_limit = self._get_float_array(columns).T
+        is_nonplastic = (
+            (plastic_limit >= liquid_limit) | np.isnan(liquid_limit) | np.isnan(plastic_limit)
+        )
 
-        return is_nonplastic
+        nullable = self._get_numeric_dtype(columns) in {"Int64", "Float64"}
+        return self._get_result(
+            is_nonplastic,
+            np.zeros(len(is_nonplastic), dtype=bool),
+            as_array,
+            name="is_nonplastic",
+            dtype="boolean" if nullable else "bool",
+        )
 
-    def get_plasticity_index(self) -> pd.Series:
+    @profiled
+    @with_dtype_backend
+    def get_plasticity_index(
+        self, as_array: bool = False
+    ) -> pd.Series | tuple[np.ndarray, np.ndarray]:
         """Calculate and return the plasticity index.
 
         The plasticity index is calculated as the difference between the liquid limit and the
@@ -391,10 +827,17 @@ class IndexDataFrameAccessor(GeotechPandasBase):
             | :term:`liquid_limit`
             | :term:`plastic_limit`
 
+        Parameters
+        ----------
+        as_array: bool, default False
+            If `True`, return a ``float64`` array of the values and a boolean mask of the missing
+            values instead of a Series.
+
         Returns
         -------
-        :external:class:`~pandas.Series`
-            Series with plasticity index values.
+        :external:class:`~pandas.Series` or tuple of :external:class:`~numpy.ndarray`
+            Series with plasticity index values, or its values and missing value mask if
+            `as_array` is `True`.
 
         Notes
         -----
@@ -430,17 +873,24 @@ class IndexDataFrameAccessor(GeotechPandasBase):
         """
         self._validate_columns(["liquid_limit", "plastic_limit"])
 
-        liquid_limit = self._obj["liquid_limit"]
-        plastic_limit = self._obj["plastic_limit"]
-        nonplastic_mask = self.is_nonplastic()
+        liquid_limit, plastic_limit = self._get_float_array(["liquid_limit", "plastic_limit"]).T
+        nonplastic_mask, _ = self._get_arrays(self.is_nonplastic)
 
-        plasticity_index = pd.Series(liquid_limit - plastic_limit, name="plasticity_index")
-        plasticity_index[nonplastic_mask] = pd.NA
-        plasticity_index = plasticity_index.astype("Float64")
+        plasticity_index = np.where(nonplastic_mask, np.nan, liquid_limit - plastic_limit)
 
-        return plasticity_index
+        return self._get_result(
+            plasticity_index,
+            nonplastic_mask,
+            as_array,
+            name="plasticity_index",
+            dtype="Float64",
+        )
 
-    def get_liquidity_index(self) -> pd.Series:
+    @profiled
+    @with_dtype_backend
+    def get_liquidity_index(
+        self, as_array: bool = False
+    ) -> pd.Series | tuple[np.ndarray, np.ndarray]:
         r"""Calculate and return the liquidity index.
 
         The liquidity index is calculated as the ratio of the natural moisture content minus the
@@ -453,10 +903,17 @@ class IndexDataFrameAccessor(GeotechPandasBase):
             | :term:`plastic_limit`
             | :term:`plasticity_index`
 
+        Parameters
+        ----------
+        as_array: bool, default False
+            If `True`, return a ``float64`` array of the values and a boolean mask of the missing
+            values instead of a Series.
+
         Returns
         -------
-        :external:class:`~pandas.Series`
-            Series with liquidity index values.
+        :external:class:`~pandas.Series` or tuple of :external:class:`~numpy.ndarray`
+            Series with liquidity index values, or its values and missing value mask if
+            `as_array` is `True`.
 
         Notes
         -----
@@ -494,14 +951,425 @@ class IndexDataFrameAccessor(GeotechPandasBase):
         """
         self._validate_columns(["moisture_content", "plastic_limit", "plasticity_index"])
 
-        moisture_content = self._obj["moisture_content"]
-        plastic_limit = self._obj["plastic_limit"]
-        plasticity_index = self._obj["plasticity_index"]
+        moisture_content, plastic_limit, plasticity_index = self._get_float_array(
+            ["moisture_content", "plastic_limit", "plasticity_index"]
+        ).T
+        with np.errstate(divide="ignore", invalid="ignore"):
+            liquidity_index = (moisture_content - plastic_limit) / plasticity_index
 
-        liquidity_index = pd.Series(
-            (moisture_content - plastic_limit) / plasticity_index,
+        return self._get_result(
+            liquidity_index,
+            np.isnan(liquidity_index),
+            as_array,
             name="liquidity_index",
+            dtype="Float64",
+        )
+
+    @profiled
+    @with_dtype_backend
+    def get_uscs_classification(self) -> pd.Series:
+        r"""Classify the soil according to the Unified Soil Classification System of ASTM D2487.
+
+        Every sample is classified at once: the zones of the plasticity chart and the gradation
+        criteria are evaluated as masks over all the samples, and the group symbol of each
+        combination is looked up in a code table.
+
+        .. admonition:: **Requires:**
+            :class: important
+
+            | :term:`liquid_limit`
+            | :term:`plastic_limit`
+            | :term:`plasticity_index`
+            | :term:`fines_content`
+            | :term:`gravel_content`
+            | :term:`coefficient_of_uniformity`
+            | :term:`coefficient_of_curvature`
+
+        Returns
+        -------
+        :external:class:`~pandas.Series`
+            Categorical series of group symbols, with every symbol as a category. Samples are `NA`
+            when an input that their classification depends on is missing, such as the Atterberg
+            limits of samples with 5% or more fines, or when their Atterberg limits plot above the
+            U-line.
+
+        Notes
+        -----
+        A sample is fine-grained if its fines content is 50% or more, and its group symbol is the
+        zone of the fines in the plasticity chart, which is divided by the A-line and the U-line:
+
+        .. math:: PI_A = 0.73 \cdot (LL - 20) \qquad PI_U = 0.9 \cdot (LL - 8)
+
+        - ``CL`` or ``CH`` on or above the A-line with :math:`PI > 7`, where the ``H`` is for
+          :math:`LL \geq 50`,
+        - ``CL-ML`` on or above the A-line with :math:`4 \leq PI \leq 7` and :math:`LL < 50`,
+        - ``ML`` or ``MH`` below the A-line, where ``ML`` also covers :math:`PI < 4`.
+
+        Nonplastic fines are ``ML``, where nonplastic samples are given by :meth:`is_nonplastic`,
+        so their :term:`plasticity_index` from :meth:`get_plasticity_index` may be `NA`. However,
+        samples without both limits are not taken as nonplastic, since they cannot be told apart
+        from samples that were not tested.
+
+        Otherwise, the sample is coarse-grained, and it is a gravel (``G``) if its
+        :term:`gravel_content` is more than its sand content, which is the rest after the fines and
+        the gravel, or a sand (``S``) otherwise. Then, its group symbol depends on the fines
+        content:
+
+        - less than 5%: well graded (``W``) if :math:`C_u \geq 4` for gravels or
+          :math:`C_u \geq 6` for sands, and :math:`1 \leq C_c \leq 3`, otherwise poorly graded
+          (``P``),
+        - 5% to 12%: a dual symbol of the grading and the fines, such as ``GW-GM`` or ``SP-SC``,
+          where ``CL-ML`` fines count as clay,
+        - more than 12%: the fines, such as ``GM``, ``SC`` or ``SC-SM`` for ``CL-ML`` fines.
+
+        Organic soils and peat are not classified, since they require the liquid limit of an oven
+        dried sample or a visual examination.
+
+        References
+        ----------
+        .. [1] ASTM International. (2017). *Standard practice for classification of soils for
+           engineering purposes (Unified Soil Classification System)* (ASTM D2487-17).
+           https://doi.org/10.1520/D2487-17
+
+        Examples
+        --------
+        >>> df = pd.DataFrame(
+        ...     {
+        ...         "point_id": ["BH-1", "BH-1", "BH-1", "BH-1"],
+        ...         "bottom": [1.0, 2.0, 3.0, 4.0],
+        ...         "liquid_limit": [45.0, 65.0, None, 30.0],
+        ...         "plastic_limit": [23.0, 45.0, None, 18.0],
+        ...         "plasticity_index": [22.0, 20.0, None, 12.0],
+        ...         "fines_content": [85.0, 70.0, 3.0, 8.0],
+        ...         "gravel_content": [0.0, 5.0, 60.0, 20.0],
+        ...         "coefficient_of_uniformity": [None, None, 12.0, 3.0],
+        ...         "coefficient_of_curvature": [None, None, 1.5, 0.8],
+        ...     }
+        ... )
+        >>> df.geotech.lab.index.get_uscs_classification().tolist()
+        ['CL', 'MH', 'GW', 'SP-SC']
+        """
+        columns = [
+            "liquid_limit",
+            "plastic_limit",
+            "plasticity_index",
+            "fines_content",
+            "gravel_content",
+            "coefficient_of_uniformity",
+            "coefficient_of_curvature",
+        ]
+        self._validate_columns(columns)
+        liquid_limit, plastic_limit, plasticity_index, fines, gravel, uniformity, curvature = (
+            self._get_float_array(columns).T
+        )
+        # Samples without any limit are unknown instead of nonplastic like in `is_nonplastic`.
+        nonplastic, _ = self._get_arrays(self.is_nonplastic)
+        nonplastic = nonplastic & ~(np.isnan(liquid_limit) & np.isnan(plastic_limit))
+
+        with np.errstate(invalid="ignore"):
+            above_a_line = plasticity_index >= 0.73 * (liquid_limit - 20)
+            below_u_line = plasticity_index <= 0.9 * (liquid_limit - 8)
+            # Zones are the positions in USCS_FINES_ZONES: ML, CL-ML, CL, MH and CH.
+            zone = np.select(
+                [
+                    nonplastic,
+                    liquid_limit >= LIQUID_LIMIT_HIGH_MIN,
+                    ~above_a_line | (plasticity_index < PLASTICITY_INDEX_CL_ML_MIN),
+                    plasticity_index <= PLASTICITY_INDEX_CL_ML_MAX,
+                ],
+                [0, np.where(above_a_line, 4, 3), 0, 1],
+                default=2,
+            )
+
+            # Ranges are the first axis of USCS_CODE_TABLE, where 3 is fine-grained.
+            fines_range = (
+                (fines >= FINES_CONTENT_CLEAN_MAX).astype(int)
+                + (fines > FINES_CONTENT_DUAL_MAX)
+                + (fines >= FINES_CONTENT_FINE_GRAINED_MIN)
+            )
+            is_sand = ~(gravel > 100 - fines - gravel)
+            is_well_graded = (
+                (uniformity >= np.where(is_sand, SAND_UNIFORMITY_MIN, GRAVEL_UNIFORMITY_MIN))
+                & (curvature >= CURVATURE_MIN)
+                & (curvature <= CURVATURE_MAX)
+            )
+
+        fine_grained = fines_range == 3  # noqa: PLR2004
+        valid = (
+            ~np.isnan(fines)
+            & (fine_grained | ~np.isnan(gravel))
+            & ((fines_range >= 2) | ~(np.isnan(uniformity) | np.isnan(curvature)))  # noqa: PLR2004
+            & ((fines_range == 0) | nonplastic | below_u_line)
         )
-        liquidity_index = liquidity_index.astype("Float64")
+        codes = USCS_CODE_TABLE[
+            fines_range, is_sand.astype(int), (~is_well_graded).astype(int), zone
+        ]
+
+        return pd.Series(
+            pd.Categorical.from_codes(
+                np.where(valid, codes, -1).astype(np.int8),
+                dtype=pd.CategoricalDtype(USCS_SYMBOLS),
+            ),
+            index=self._obj.index,
+            name="uscs_classification",
+        )
+
+    def _find_sieves(self) -> int:
+        """Return the number of consecutive :term:`sieve_{n}_size` columns from the first."""
+        sieves = 0
+        while f"sieve_{sieves + 1}_size" in self._obj.columns:
+            sieves += 1
+        return sieves
+
+    @profiled
+    def _stack_sieve_results(
+        self, sieve_results: pd.DataFrame
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Stack a long table of sieve results into a row for each sample.
+
+        The samples are identified by factorizing the :term:`point_id` and :term:`bottom` of the
+        layers and of the table together, so the results are aligned with the layers by position
+        instead of by joining on the keys.
+
+        Parameters
+        ----------
+        sieve_results: :external:class:`~pandas.DataFrame`
+            Long table with :term:`point_id`, :term:`bottom`, ``sieve_size`` and
+            ``sieve_passing`` columns.
+
+        Returns
+        -------
+        tuple of :external:class:`~numpy.ndarray`
+            The row of the sample of each layer, which is -1 for layers with a missing key, and
+            ``float64`` arrays of the sieve sizes and percentages passing with a row for each
+            sample and a column for each sieve, padded with `NaN`.
+
+        Raises
+        ------
+        AttributeError
+            When the table does not have the required columns.
+        """
+        columns = ["point_id", "bottom", "sieve_size", "sieve_passing"]
+        missing_columns = [column for column in columns if column not in sieve_results.columns]
+        if len(missing_columns) > 0:
+            raise AttributeError(
+                f"The sieve results must have: {', '.join(missing_columns)} "
+                f"column{'s' if len(missing_columns) > 1 else ''}."
+            )
+
+        (point_codes, _), (bottom_codes, bottoms) = (
+            pd.factorize(pd.concat([self._obj[key], sieve_results[key]], ignore_index=True))
+            for key in columns[:2]
+        )
+        missing = (point_codes < 0) | (bottom_codes < 0)
+        codes, samples = pd.factorize(
+            np.where(missing, -1, point_codes.astype(np.int64) * len(bottoms) + bottom_codes)
+        )
+        codes = np.where(missing, -1, codes)
+        layer_codes, codes = codes[: len(self._obj)], codes[len(self._obj) :]
+
+        values = sieve_results[columns[2:]].to_numpy(dtype="float64", na_value=np.nan)
+        values, codes = values[codes >= 0], codes[codes >= 0]
+        order = np.argsort(codes, kind="stable")
+        codes = codes[order]
+        counts = np.bincount(codes, minlength=len(samples))
+        column = np.arange(len(codes)) - (np.cumsum(counts) - counts)[codes]
+
+        sizes = np.full((len(samples), counts.max(initial=0)), np.nan)
+        passing = np.full_like(sizes, np.nan)
+        sizes[codes, column] = values[order, 0]
+        passing[codes, column] = values[order, 1]
+        return layer_codes, sizes, passing
+
+    @profiled
+    def _calculate_gradation(self, sizes: np.ndarray, passing: np.ndarray) -> dict[str, np.ndarray]:
+        """Calculate the gradation parameters of each sample from its sieve results.
+
+        The sieves of each sample are sorted by size, and the percentages passing are made
+        nondecreasing with the size, so the grain size curves of all the samples are interpolated
+        at once by :func:`~geotech_pandas.helpers._interpolate_rows`.
+
+        Parameters
+        ----------
+        sizes: :external:class:`~numpy.ndarray`
+            ``float64`` sieve sizes with a row for each sample and a column for each sieve.
+        passing: :external:class:`~numpy.ndarray`
+            ``float64`` percentages passing with the same shape as `sizes`.
+
+        Returns
+        -------
+        dict
+            ``float64`` arrays of the results named like the columns of :meth:`get_gradation`,
+            which are `NaN` where the curve of a sample does not reach the required percentage
+            passing or size.
+        """
+        with np.errstate(divide="ignore", invalid="ignore"):
+            log_sizes = np.log10(np.where((sizes > 0) & ~np.isnan(passing), sizes, np.nan))
+        order = np.argsort(log_sizes, axis=1)
+        log_sizes = np.take_along_axis(log_sizes, order, axis=1)
+        valid = ~np.isnan(log_sizes)
+        passing = np.take_along_axis(passing, order, axis=1)
+        passing = np.where(
+            valid, np.fmax.accumulate(np.where(valid, passing, -np.inf), axis=1), np.nan
+        )
+
+        grain_sizes = 10 ** _interpolate_rows(passing, log_sizes, np.array([*GRAIN_SIZES.values()]))
+        split_sizes = np.log10([SAND_SIZE_MIN, GRAVEL_SIZE_MIN])
+        passing_at = _interpolate_rows(log_sizes, passing, split_sizes)
+        # Sizes above the largest sieve pass entirely if the largest sieve does.
+        last = np.maximum(valid.sum(axis=1) - 1, 0)[:, np.newaxis]
+        passing_at = np.where(
+            (np.take_along_axis(passing, last, axis=1) >= 100)  # noqa: PLR2004
+            & (split_sizes > np.take_along_axis(log_sizes, last, axis=1)),
+            100.0,
+            passing_at,
+        )
+
+        d10, d30, d60 = grain_sizes.T
+        fines, gravel_passing = passing_at.T
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return {
+                "d10": d10,
+                "d30": d30,
+                "d60": d60,
+                "coefficient_of_uniformity": d60 / d10,
+                "coefficient_of_curvature": d30**2 / (d10 * d60),
+                "gravel_content": 100 - gravel_passing,
+                "sand_content": gravel_passing - fines,
+                "fines_content": fines,
+            }
+
+    @profiled
+    @with_dtype_backend
+    def get_gradation(
+        self,
+        sieves: int | None = None,
+        samples: pd.DataFrame | None = None,
+        sieve_results: pd.DataFrame | None = None,
+    ) -> pd.DataFrame:
+        r"""Calculate and return the gradation of the particle size distribution of each sample.
+
+        The characteristic grain sizes are interpolated on the grain size curve of each sample,
+        which is linear in the logarithm of the sieve size. The sieves of every sample are stacked
+        into a single array, so all the curves are interpolated at once.
+
+        .. admonition:: **Requires:**
+            :class: important
+
+            | :term:`sieve_{n}_size`
+            | :term:`sieve_{n}_passing`
 
-        return liquidity_index
+        Parameters
+        ----------
+        sieves: int, optional
+            The number of sieves of each sample. If `None`, every :term:`sieve_{n}_size` column
+            from the first is used.
+        samples: :external:class:`~pandas.DataFrame`, optional
+            Separate table of laboratory samples with :term:`point_id` and :term:`bottom` columns,
+            where the required columns are looked up instead, see :meth:`get_liquid_limit`.
+        sieve_results: :external:class:`~pandas.DataFrame`, optional
+            Long table of sieve results with :term:`point_id`, :term:`bottom`, ``sieve_size`` and
+            ``sieve_passing`` columns and a row for each sieve of each sample, which is used
+            instead of the required columns. The results are joined back to the layers with the
+            same :term:`point_id` and :term:`bottom`, and layers without a sample are `NA`.
+
+        Returns
+        -------
+        :external:class:`~pandas.DataFrame`
+            :term:`d10 <d{n}>`, :term:`d30 <d{n}>`, :term:`d60 <d{n}>`,
+            :term:`coefficient_of_uniformity`, :term:`coefficient_of_curvature`,
+            :term:`gravel_content`, :term:`sand_content` and :term:`fines_content` columns. Grain
+            sizes outside of the sieves of a sample, and the results that depend on them, are
+            `NA`.
+
+        Raises
+        ------
+        ValueError
+            When `sieves` is `None` and no :term:`sieve_{n}_size` column is found.
+
+        Notes
+        -----
+        The grain size :math:`D_x` at a percentage passing :math:`x` is interpolated between the
+        sieves :math:`i` and :math:`i + 1` that bound it:
+
+        .. math:: \log D_x = \log D_i + \frac{x - P_i}{P_{i+1} - P_i} (\log D_{i+1} - \log D_i)
+
+        and the coefficients of uniformity and curvature are:
+
+        .. math:: C_u = \frac{D_{60}}{D_{10}} \qquad C_c = \frac{D_{30}^2}{D_{10} \cdot D_{60}}
+
+        The percentages passing the 4.75 mm and 0.075 mm sieves are interpolated likewise, and
+        split the sample into gravel, sand and fines. A percentage passing that decreases with the
+        size is raised to the percentage passing of the smaller sieve.
+
+        References
+        ----------
+        .. [1] ASTM International. (2017). *Standard practice for classification of soils for
+           engineering purposes (Unified Soil Classification System)* (ASTM D2487-17).
+           https://doi.org/10.1520/D2487-17
+
+        Examples
+        --------
+        >>> df = pd.DataFrame(
+        ...     {
+        ...         "point_id": ["BH-1"],
+        ...         "bottom": [1.0],
+        ...         "sieve_1_size": [9.5],
+        ...         "sieve_1_passing": [100.0],
+        ...         "sieve_2_size": [2.0],
+        ...         "sieve_2_passing": [80.0],
+        ...         "sieve_3_size": [0.425],
+        ...         "sieve_3_passing": [40.0],
+        ...         "sieve_4_size": [0.075],
+        ...         "sieve_4_passing": [5.0],
+        ...     }
+        ... )
+        >>> df.geotech.lab.index.get_gradation().iloc[0].round(3)
+        d10                           0.096
+        d30                           0.259
+        d60                           0.922
+        coefficient_of_uniformity     9.595
+        coefficient_of_curvature      0.757
+        gravel_content                8.897
+        sand_content                 86.103
+        fines_content                   5.0
+        Name: 0, dtype: Float64
+        """
+        if samples is not None:
+            return cast(
+                pd.DataFrame, self._join_samples(samples, "get_gradation", False, sieves=sieves)
+            )
+
+        if sieve_results is not None:
+            layer_codes, sizes, passing = self._stack_sieve_results(sieve_results)
+            gradation = {
+                name: np.where(layer_codes >= 0, values[layer_codes], np.nan)
+                for name, values in self._calculate_gradation(sizes, passing).items()
+            }
+            dtype: str | pd.SparseDtype = "Float64"
+        else:
+            if sieves is None:
+                sieves = self._find_sieves()
+                if sieves == 0:
+                    raise ValueError("No sieve_{n}_size columns were found.")
+            columns = [
+                f"sieve_{n + 1}_{value}" for value in ["size", "passing"] for n in range(sieves)
+            ]
+            self._validate_columns(columns)
+            positions = self._get_populated_positions(columns[sieves:])
+            values = self._get_float_array(columns, positions)
+            gradation = {
+                name: self._scatter(values, positions)
+                for name, values in self._calculate_gradation(
+                    values[:, :sieves], values[:, sieves:]
+                ).items()
+            }
+            dtype = self._get_lab_dtype(columns)
+
+        return pd.concat(
+            [
+                self._to_series(values, np.isnan(values), name, dtype)
+                for name, values in gradation.items()
+            ],
+            axis=1,
+        )
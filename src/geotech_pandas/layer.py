@@ -1,8 +1,12 @@
 """Subaccessor that contains depth-related methods."""
 
+import numpy as np
 import pandas as pd
 
 from geotech_pandas.base import GeotechPandasBase
+from geotech_pandas.kernels import get_groups, group_shift
+from geotech_pandas.profiling import profiled
+from geotech_pandas.utils import with_dtype_backend
 
 
 class LayerDataFrameAccessor(GeotechPandasBase):
@@ -13,7 +17,11 @@ class LayerDataFrameAccessor(GeotechPandasBase):
     ``point_id`` would signify what group the ``bottom`` depths and other related data belong to.
     """
 
-    def get_top(self, fill_value: float = 0.0) -> pd.Series:
+    @profiled
+    @with_dtype_backend
+    def get_top(
+        self, fill_value: float = 0.0, as_array: bool = False
+    ) -> pd.Series | tuple[np.ndarray, np.ndarray]:
         """Return shifted ``bottom`` depth values that can be used as ``top`` depth values.
 
         .. admonition:: **Requires:**
@@ -25,19 +33,32 @@ class LayerDataFrameAccessor(GeotechPandasBase):
         ----------
         fill_value: float, optional
             Float value to use for newly introduced missing values.
+        as_array: bool, default False
+            If `True`, return a ``float64`` array of the values and a boolean mask of the missing
+            values instead of a Series.
 
         Returns
         -------
-        :external:class:`~pandas.Series`
-            :term:`top`
+        :external:class:`~pandas.Series` or tuple of :external:class:`~numpy.ndarray`
+            :term:`top`, or its values and missing value mask if `as_array` is `True`.
         """
-        top = pd.Series(
-            self._obj.geotech.point.groups["bottom"].shift(1, fill_value=fill_value), name="top"
+        order, offsets, _ = get_groups(self._obj["point_id"])
+        bottom = self._get_float_array(["bottom"])[:, 0]
+
+        top = np.full(len(self._obj), np.nan)
+        top[order] = group_shift(
+            bottom[order], offsets, np.nan if pd.isna(fill_value) else fill_value
         )
+        na = np.isnan(top)
 
-        return top
+        integer = pd.isna(fill_value) or float(fill_value).is_integer()
+        return self._get_result(
+            top, na, as_array, name="top", dtype=self._get_numeric_dtype(["bottom"], integer)
+        )
 
-    def get_center(self) -> pd.Series:
+    @profiled
+    @with_dtype_backend
+    def get_center(self, as_array: bool = False) -> pd.Series | tuple[np.ndarray, np.ndarray]:
         """Return ``center`` depth values from ``top`` and ``bottom`` depth values.
 
         .. admonition:: **Requires:**
@@ -46,16 +67,34 @@ class LayerDataFrameAccessor(GeotechPandasBase):
             | :term:`top`
             | :term:`bottom`
 
+        Parameters
+        ----------
+        as_array: bool, default False
+            If `True`, return a ``float64`` array of the values and a boolean mask of the missing
+            values instead of a Series.
+
         Returns
         -------
-        :external:class:`~pandas.Series`
-            :term:`center`
+        :external:class:`~pandas.Series` or tuple of :external:class:`~numpy.ndarray`
+            :term:`center`, or its values and missing value mask if `as_array` is `True`.
         """
         self._validate_columns(["top", "bottom"])
 
-        return pd.Series(self._obj[["top", "bottom"]].mean(axis=1), name="center")
+        top, bottom = self._get_float_array(["top", "bottom"]).T
+        center = np.where(
+            np.isnan(top), bottom, np.where(np.isnan(bottom), top, (top + bottom) / 2)
+        )
+        return self._get_result(
+            center,
+            np.isnan(center),
+            as_array,
+            name="center",
+            dtype=self._get_numeric_dtype(["top", "bottom"], integer=False),
+        )
 
-    def get_thickness(self) -> pd.Series:
+    @profiled
+    @with_dtype_backend
+    def get_thickness(self, as_array: bool = False) -> pd.Series | tuple[np.ndarray, np.ndarray]:
         """Return ``thickness`` values of ``top`` and ``bottom`` depth values.
 
         .. admonition:: **Requires:**
@@ -64,15 +103,30 @@ class LayerDataFrameAccessor(GeotechPandasBase):
             | :term:`top`
             | :term:`bottom`
 
+        Parameters
+        ----------
+        as_array: bool, default False
+            If `True`, return a ``float64`` array of the values and a boolean mask of the missing
+            values instead of a Series.
+
         Returns
         -------
-        :external:class:`~pandas.Series`
-            :term:`thickness`
+        :external:class:`~pandas.Series` or tuple of :external:class:`~numpy.ndarray`
+            :term:`thickness`, or its values and missing value mask if `as_array` is `True`.
         """
         self._validate_columns(["top", "bottom"])
 
-        return pd.Series((self._obj["bottom"] - self._obj["top"]).abs(), name="thickness")
+        top, bottom = self._get_float_array(["top", "bottom"]).T
+        thickness = np.abs(bottom - top)
+        return self._get_result(
+            thickness,
+            np.isnan(thickness),
+            as_array,
+            name="thickness",
+            dtype=self._get_numeric_dtype(["top", "bottom"]),
+        )
 
+    @profiled
     def split_at(
         self, depth: pd.Series | float | int | str, reset_index: bool = True
     ) -> pd.DataFrame:
@@ -116,17 +170,30 @@ class LayerDataFrameAccessor(GeotechPandasBase):
             validation_list = ["top"]
 
         self._validate_columns(validation_list)
+        if isinstance(depth, pd.Series):
+            # Depths are taken by the labels of the layers, so they are aligned before positions
+            # are used below.
+            depth = depth.reindex(self._obj.index)
 
-        temp = self._obj.loc[(self._obj["top"] < depth) & (depth < self._obj["bottom"])].copy(
-            deep=True
+        split = ((self._obj["top"] < depth) & (depth < self._obj["bottom"])).to_numpy(
+            dtype=bool, na_value=False
         )
 
-        if temp.empty:
+        if not split.any():
             return self._obj
 
-        temp["bottom"] = depth
-        temp = pd.concat([self._obj, temp])
-        temp = temp.sort_values(["point_id", "bottom"])
+        # Take each split layer twice in a single copy, where the first of the pair becomes the
+        # upper layer that ends at the split depth.
+        positions = np.repeat(np.arange(len(self._obj)), np.where(split, 2, 1))
+        upper = np.zeros(len(positions), dtype=bool)
+        upper[np.flatnonzero(split) + np.arange(split.sum())] = True
+
+        temp = self._obj.take(positions)
+        split_depth = depth.to_numpy()[positions] if isinstance(depth, pd.Series) else depth
+        temp["bottom"] = temp["bottom"].mask(upper, split_depth)
+
+        if not temp["point_id"].is_monotonic_increasing:
+            temp = temp.sort_values(["point_id", "bottom"])
 
         if reset_index:
             temp = temp.reset_index(drop=True)
@@ -0,0 +1,313 @@
+"""Out-of-core runner that applies accessor methods to a file chunk by chunk.
+
+:func:`run` streams the layers of a CSV or Parquet file in chunks that never split a point,
+applies a list of steps to each chunk, optionally in a pool of worker processes, and appends the
+results to a Parquet file in the order of the source. Only a few chunks are held in memory at a
+time, so the size of the files is not limited by the available memory.
+
+Each step is one of the following:
+
+- the dotted path of a method under the ``geotech`` accessor, such as ``"layer.get_top"``;
+- a tuple of a dotted path and a dictionary of keyword arguments, such as
+  ``("in_situ.spt.get_n_value", {"refusal": 100})``; or
+- a callable that takes and returns a :external:class:`~pandas.DataFrame`, which must be defined
+  at the top level of a module to be used with worker processes.
+
+A step that returns a :external:class:`~pandas.Series` adds the Series as a column named after
+the Series, and a step that returns a :external:class:`~pandas.DataFrame` adds each of its columns,
+so later steps may use the results of earlier steps. Columns with the same name as an existing
+column replace it.
+"""
+
+import collections
+import concurrent.futures
+import multiprocessing
+import os
+import time
+from collections.abc import Callable, Iterator
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from geotech_pandas.utils import call_method, resolve_method
+
+Step = str | tuple[str, dict[str, Any]] | Callable[[pd.DataFrame], pd.DataFrame]
+
+PARQUET_SUFFIXES = (".parquet", ".pq")
+
+
+def _prepare_steps(steps: list[Step]) -> list[tuple[Any, dict[str, Any]]]:
+    """Validate the steps and return them as pairs of a method path or callable and kwargs.
+
+    Raises
+    ------
+    ValueError
+        When a step is not a known accessor method or a callable.
+    """
+    prepared: list[tuple[Any, dict[str, Any]]] = []
+    for step in steps:
+        if callable(step):
+            prepared.append((step, {}))
+        else:
+            method, kwargs = (step, {}) if isinstance(step, str) else step
+            prepared.append((resolve_method(method), dict(kwargs)))
+    return prepared
+
+
+def _apply_steps(chunk: pd.DataFrame, steps: list[tuple[Any, dict[str, Any]]]) -> pd.DataFrame:
+    """Apply the prepared steps to a chunk of layers.
+
+    Parameters
+    ----------
+    chunk: :external:class:`~pandas.DataFrame`
+        Layers of one or more whole points.
+    steps: list of tuple
+        Method paths or callables and their keyword arguments, see :func:`_prepare_steps`.
+
+    Returns
+    -------
+    :external:class:`~pandas.DataFrame`
+        Chunk with the results of the steps.
+    """
+    for step, kwargs in steps:
+        result = step(chunk) if callable(step) else call_method(chunk, step, **kwargs)
+        if isinstance(result, pd.Series):
+            chunk = chunk.assign(**{str(result.name): result})
+        elif isinstance(result, pd.DataFrame):
+            chunk = chunk.assign(**{str(name): column for name, column in result.items()})
+        else:
+            raise TypeError(
+                f"Steps must return a Series or DataFrame, not {type(result).__name__}."
+            )
+    return chunk
+
+
+def _read_chunks(
+    source: str | os.PathLike, chunksize: int, read_options: dict[str, Any]
+) -> Iterator[pd.DataFrame]:
+    """Read a CSV or Parquet file in chunks of up to `chunksize` layers."""
+    if os.fspath(source).lower().endswith(PARQUET_SUFFIXES):
+        import pyarrow.parquet as pq  # noqa: PLC0415
+
+        for batch in pq.ParquetFile(source).iter_batches(batch_size=chunksize, **read_options):
+            yield batch.to_pandas()
+    else:
+        options = {"dtype_backend": "numpy_nullable", **read_options}
+        with pd.read_csv(source, chunksize=chunksize, **options) as reader:
+            yield from reader
+
+
+def iter_point_chunks(chunks: Iterator[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+    """Regroup chunks of layers so that no point is split between two chunks.
+
+    The layers of the last point of each chunk are carried over to the next chunk, so the layers
+    of each point must be contiguous in the source.
+
+    Parameters
+    ----------
+    chunks: iterator of :external:class:`~pandas.DataFrame`
+        Chunks of layers with a :term:`point_id` column.
+
+    Yields
+    ------
+    :external:class:`~pandas.DataFrame`
+        Chunks with the layers of whole points and a default index.
+
+    Raises
+    ------
+    ValueError
+        When the layers of a point are not contiguous in the source.
+    """
+    carry: pd.DataFrame | None = None
+    seen: set = set()
+    for chunk in chunks:
+        if carry is not None:
+            chunk = pd.concat([carry, chunk], ignore_index=True)  # noqa: PLW2901
+        if len(chunk) == 0:
+            continue
+
+        point_id = chunk["point_id"]
+        other = np.flatnonzero(point_id.ne(point_id.iloc[-1]).to_numpy(dtype=bool, na_value=True))
+        cut = other[-1] + 1 if len(other) else 0
+        carry = chunk.iloc[cut:]
+        ready = chunk.iloc[:cut]
+        if len(ready) == 0:
+            continue
+
+        points = set(ready["point_id"].dropna().unique())
+        repeated = points & seen
+        if repeated:
+            raise ValueError(
+                "The layers of each point must be contiguous in the source for: "
+                f"{', '.join(map(str, sorted(repeated)))}."
+            )
+        seen |= points
+        yield ready.reset_index(drop=True)
+
+    if carry is not None and len(carry) > 0:
+        repeated = set(carry["point_id"].dropna().unique()) & seen
+        if repeated:
+            raise ValueError(
+                "The layers of each point must be contiguous in the source for: "
+                f"{', '.join(map(str, sorted(repeated)))}."
+            )
+        yield carry.reset_index(drop=True)
+
+
+class _ParquetSink:
+    """Parquet file that chunks are appended to with the schema of the first chunk."""
+
+    def __init__(self, sink: str | os.PathLike) -> None:
+        try:
+            import pyarrow as pa  # noqa: PLC0415
+            import pyarrow.parquet as pq  # noqa: PLC0415
+        except ImportError as error:
+            raise ImportError("pyarrow is required for writing Parquet files.") from error
+
+        self._pa = pa
+        self._pq = pq
+        self._sink = sink
+        self._writer: Any = None
+
+    def write(self, chunk: pd.DataFrame) -> None:
+        if self._writer is None:
+            table = self._pa.Table.from_pandas(chunk, preserve_index=False)
+            self._writer = self._pq.ParquetWriter(self._sink, table.schema)
+        else:
+            table = self._pa.Table.from_pandas(
+                chunk, schema=self._writer.schema, preserve_index=False
+            )
+        self._writer.write_table(table)
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+
+
+def run(  # noqa: PLR0913
+    source: str | os.PathLike,
+    sink: str | os.PathLike,
+    steps: list[Step],
+    *,
+    chunksize: int = 100_000,
+    n_workers: int | None = None,
+    read_options: dict[str, Any] | None = None,
+    progress: Callable[[dict[str, float]], None] | None = None,
+) -> dict[str, float]:
+    """Apply a list of steps to a CSV or Parquet file chunk by chunk and write a Parquet file.
+
+    The layers of each point must be contiguous in the source, which is the case for files that
+    are sorted by :term:`point_id`. At most two chunks per worker are processed at a time, so the
+    memory used depends on `chunksize` and `n_workers` instead of the size of the source.
+
+    Parameters
+    ----------
+    source: str or path-like
+        Path of the source file. Files ending with ``.parquet`` or ``.pq`` are read as Parquet
+        files, and any other file is read as a CSV file with the ``numpy_nullable`` dtype backend.
+    sink: str or path-like
+        Path of the Parquet file to write, which is overwritten if it exists. The schema of the
+        file is given by the first chunk.
+    steps: list
+        Accessor method paths, tuples of a method path and keyword arguments, or callables to
+        apply to each chunk in order, see :mod:`geotech_pandas.pipeline`.
+    chunksize: int, default 100_000
+        Number of layers to read at a time. A chunk may hold more layers to keep the layers of its
+        last point together.
+    n_workers: int, optional
+        Number of worker processes. If `None` or 0, the chunks are processed in the current
+        process.
+    read_options: dict, optional
+        Keyword arguments passed to :external:func:`pandas.read_csv`, or to
+        ``pyarrow.parquet.ParquetFile.iter_batches`` for Parquet files, such as the ``columns``
+        to read.
+    progress: callable, optional
+        Function called with the counters after each chunk is written.
+
+    Returns
+    -------
+    dict
+        Counters of the run, with the number of ``chunks``, ``rows`` and ``points`` written, the
+        ``elapsed`` time in seconds, and the throughput in ``rows_per_second``.
+
+    Raises
+    ------
+    ValueError
+        When a step is not a known accessor method or a callable, or when the layers of a point
+        are not contiguous in the source.
+
+    Examples
+    --------
+    >>> import tempfile
+    >>> from pathlib import Path
+    >>> from geotech_pandas import pipeline
+    >>> from geotech_pandas.testing import make_boreholes
+    >>> directory = Path(tempfile.mkdtemp())
+    >>> make_boreholes(10, 5, seed=0).to_csv(directory / "boreholes.csv", index=False)
+    >>> counters = pipeline.run(
+    ...     directory / "boreholes.csv",
+    ...     directory / "boreholes.parquet",
+    ...     steps=["layer.get_top", "in_situ.spt.get_n_value", "in_situ.spt.get_report"],
+    ...     chunksize=12,
+    ... )
+    >>> counters["rows"], counters["points"]
+    (50, 10)
+    >>> pd.read_parquet(directory / "boreholes.parquet")[
+    ...     ["point_id", "n_value", "spt_report"]
+    ... ].head(3)
+      point_id  n_value    spt_report
+    0    BH-01        9     3,5,4 N=9
+    1    BH-01       27  7,15,12 N=27
+    2    BH-01       16    9,7,9 N=16
+    """
+    prepared = _prepare_steps(steps)
+    chunks = iter_point_chunks(_read_chunks(source, chunksize, read_options or {}))
+    counters: dict[str, float] = {
+        "chunks": 0,
+        "rows": 0,
+        "points": 0,
+        "elapsed": 0.0,
+        "rows_per_second": 0.0,
+    }
+    start = time.perf_counter()
+    writer = _ParquetSink(sink)
+
+    def write(result: pd.DataFrame, points: int) -> None:
+        writer.write(result)
+        counters["chunks"] += 1
+        counters["rows"] += len(result)
+        counters["points"] += points
+        counters["elapsed"] = time.perf_counter() - start
+        counters["rows_per_second"] = (
+            counters["rows"] / counters["elapsed"] if counters["elapsed"] else 0.0
+        )
+        if progress is not None:
+            progress(dict(counters))
+
+    try:
+        if not n_workers:
+            for chunk in chunks:
+                write(_apply_steps(chunk, prepared), chunk["point_id"].nunique())
+        else:
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=n_workers, mp_context=multiprocessing.get_context("spawn")
+            ) as executor:
+                # Points are counted from the source chunks, since steps may not keep the
+                # point_id column.
+                pending: collections.deque[tuple[concurrent.futures.Future, int]] = (
+                    collections.deque()
+                )
+                for chunk in chunks:
+                    future = executor.submit(_apply_steps, chunk, prepared)
+                    pending.append((future, chunk["point_id"].nunique()))
+                    if len(pending) >= 2 * n_workers:
+                        future, points = pending.popleft()
+                        write(future.result(), points)
+                while pending:
+                    future, points = pending.popleft()
+                    write(future.result(), points)
+    finally:
+        writer.close()
+
+    return counters
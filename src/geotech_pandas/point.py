@@ -3,6 +3,7 @@
 from pandas.core.groupby.generic import DataFrameGroupBy
 
 from geotech_pandas.base import GeotechPandasBase
+from geotech_pandas.profiling import profiled
 
 
 class PointDataFrameAccessor(GeotechPandasBase):
@@ -39,8 +40,9 @@ class PointDataFrameAccessor(GeotechPandasBase):
         ``pandas.api.typing.DataFrameGroupBy``
             GroupBy object that contains the grouped DataFrame objects.
         """
-        return self._obj.groupby("point_id")
+        return self._obj.groupby("point_id", observed=True)
 
+    @profiled
     def get_group(self, point_id: str):
         """
         Return a :external:class:`~pandas.DataFrame` from the point groups with matching
@@ -0,0 +1,647 @@
+"""Support for a ``geotech`` namespace on :external:class:`polars.DataFrame` and
+:external:class:`polars.LazyFrame` objects.
+
+Importing this module registers a ``geotech`` namespace on Polars DataFrames and LazyFrames that
+follows the column contract and the methods of the ``layer``, ``in_situ.spt`` and ``lab.index``
+subaccessors of the pandas ``geotech`` accessor. Instead of calculating the results, each method
+returns a :external:class:`polars.Expr` named after the resulting column, so that several results
+are combined into a single query that Polars optimizes and runs in parallel,
+
+.. code-block:: python
+
+    import geotech_pandas.polars
+
+    lf = pl.scan_parquet("boreholes.parquet")
+    spt = lf.geotech.in_situ.spt
+    lf.with_columns(lf.geotech.layer.get_top(), spt.get_n_value(), spt.get_report()).collect()
+
+The required columns are checked against the schema of the frame when a method is called, while
+the ``bottom`` column is only validated by :meth:`GeotechNamespace.validate`, which runs a query.
+Missing values are represented by ``null``, where `NaN` values of pandas become ``null`` with
+:external:func:`polars.from_pandas`.
+"""  # noqa: D205
+
+import math
+import warnings
+from typing import Any
+
+import pandas as pd
+
+try:
+    import polars as pl
+except ImportError as error:
+    raise ImportError("polars is required for geotech_pandas.polars.") from error
+
+from geotech_pandas.in_situ.spt import (
+    BLOWS_INC_MAX,
+    BLOWS_TOTAL_MAX,
+    HAMMER_COLUMNS,
+    PEN_INC_MIN,
+    PEN_TOTAL_MIN,
+    _hammer_efficiency_factors,
+)
+
+Frame = pl.DataFrame | pl.LazyFrame
+
+
+def _all_null(*columns: str) -> pl.Expr:
+    """Return whether all of the columns are ``null``."""
+    return pl.all_horizontal(pl.col(column).is_null() for column in columns)
+
+
+def _sum(*columns: str) -> pl.Expr:
+    """Return the sum of the columns, which is only ``null`` if all of the columns are ``null``."""
+    return pl.when(_all_null(*columns)).then(None).otherwise(pl.sum_horizontal(*columns))
+
+
+class _Namespace:
+    """Base of the namespaces that check the column contract against the schema of a frame."""
+
+    def __init__(self, frame: Frame) -> None:
+        self._obj = frame
+
+    def _validate_columns(self, columns: list[str] | None = None) -> None:
+        """Validate if the columns exist in the schema of the frame.
+
+        Parameters
+        ----------
+        columns: list of str, optional
+            Columns to validate. If `None`, :term:`point_id` and :term:`bottom` are validated.
+
+        Raises
+        ------
+        AttributeError
+            When any of the columns is not found in the frame.
+        """
+        if columns is None:
+            columns = ["point_id", "bottom"]
+
+        names = self._obj.collect_schema().names()
+        missing_columns = [column for column in columns if column not in names]
+
+        if len(missing_columns) > 0:
+            raise AttributeError(
+                f"The DataFrame must have: {', '.join(missing_columns)} "
+                f"column{'s' if len(missing_columns) > 1 else ''}."
+            )
+
+
+class LayerNamespace(_Namespace):
+    """Namespace that contains depth-related expressions.
+
+    See :class:`geotech_pandas.layer.LayerDataFrameAccessor` for the pandas equivalent.
+    """
+
+    def get_top(self, fill_value: float = 0.0) -> pl.Expr:
+        """Return shifted ``bottom`` depth values that can be used as ``top`` depth values.
+
+        Parameters
+        ----------
+        fill_value: float, optional
+            Float value to use for newly introduced missing values.
+
+        Returns
+        -------
+        :external:class:`polars.Expr`
+            :term:`top`
+        """
+        self._validate_columns()
+        fill = None if pd.isna(fill_value) else fill_value
+        top = pl.col("bottom").cast(pl.Float64).shift(1, fill_value=fill).over("point_id")
+        return pl.when(pl.col("point_id").is_not_null()).then(top).alias("top")
+
+    def get_center(self) -> pl.Expr:
+        """Return ``center`` depth values from ``top`` and ``bottom`` depth values.
+
+        Returns
+        -------
+        :external:class:`polars.Expr`
+            :term:`center`
+        """
+        self._validate_columns(["top", "bottom"])
+        return pl.mean_horizontal("top", "bottom").alias("center")
+
+    def get_thickness(self) -> pl.Expr:
+        """Return ``thickness`` values of ``top`` and ``bottom`` depth values.
+
+        Returns
+        -------
+        :external:class:`polars.Expr`
+            :term:`thickness`
+        """
+        self._validate_columns(["top", "bottom"])
+        return (pl.col("bottom") - pl.col("top")).abs().alias("thickness")
+
+
+class SPTNamespace(_Namespace):
+    """Namespace that contains expressions related to the Standard Penetration Test (SPT).
+
+    See :class:`geotech_pandas.in_situ.spt.SPTDataFrameAccessor` for the pandas equivalent.
+    """
+
+    def __init__(self, frame: Frame) -> None:
+        super().__init__(frame)
+        self._validate_columns(
+            [
+                "sample_type",
+                "sample_number",
+                "blows_1",
+                "blows_2",
+                "blows_3",
+                "pen_1",
+                "pen_2",
+                "pen_3",
+            ]
+        )
+
+    def get_seating_pen(self) -> pl.Expr:
+        """Return the seating penetration from the first increment of each sample.
+
+        Returns
+        -------
+        :external:class:`polars.Expr`
+            :term:`seating_pen`
+        """
+        return (
+            pl.when(pl.col("pen_1") == PEN_INC_MIN)
+            .then(pl.lit(PEN_INC_MIN, dtype=pl.Int64))
+            .alias("seating_pen")
+        )
+
+    def get_main_pen(self) -> pl.Expr:
+        """Return the total penetration in the second and third 150 mm increment for each sample.
+
+        Returns
+        -------
+        :external:class:`polars.Expr`
+            :term:`main_pen`
+        """
+        return _sum("pen_2", "pen_3").alias("main_pen")
+
+    def get_total_pen(self) -> pl.Expr:
+        """Return the total penetration of each increment.
+
+        Returns
+        -------
+        :external:class:`polars.Expr`
+            :term:`total_pen`
+        """
+        return _sum("pen_1", "pen_2", "pen_3").alias("total_pen")
+
+    def get_seating_drive(self) -> pl.Expr:
+        """Return the number of blows in the first 150 mm increment for each sample.
+
+        Returns
+        -------
+        :external:class:`polars.Expr`
+            :term:`seating_drive`
+        """
+        return (
+            pl.when(pl.col("pen_1") == PEN_INC_MIN).then(pl.col("blows_1")).alias("seating_drive")
+        )
+
+    def get_main_drive(self) -> pl.Expr:
+        """Return the total blows in the second and third 150 mm increment for each sample.
+
+        Returns
+        -------
+        :external:class:`polars.Expr`
+            :term:`main_drive`
+        """
+        return _sum("blows_2", "blows_3").alias("main_drive")
+
+    def get_total_drive(self) -> pl.Expr:
+        """Return the sum of the number of blows in all three 150 mm increments of each sample.
+
+        Returns
+        -------
+        :external:class:`polars.Expr`
+            :term:`total_drive`
+        """
+        return _sum("blows_1", "blows_2", "blows_3").alias("total_drive")
+
+    def is_refusal(self) -> pl.Expr:
+        """Return whether or not each sample is a refusal.
+
+        Returns
+        -------
+        :external:class:`polars.Expr`
+            :term:`is_refusal`
+        """
+        blows = ["blows_1", "blows_2", "blows_3"]
+        pen = ["pen_1", "pen_2", "pen_3"]
+
+        # Each condition is only `null` if all of its increments are `null`, and the conditions
+        # are combined with the Kleene OR, where any `true` decides the result.
+        max_inc = (
+            pl.when(_all_null(*blows))
+            .then(None)
+            .otherwise(
+                pl.any_horizontal((pl.col(c) >= BLOWS_INC_MAX).fill_null(False) for c in blows)
+            )
+        )
+        max_total = _sum(*blows) >= BLOWS_TOTAL_MAX
+        partial = (
+            pl.when(_all_null(*pen))
+            .then(None)
+            .otherwise(pl.any_horizontal((pl.col(c) < PEN_INC_MIN).fill_null(True) for c in pen))
+        )
+        return (max_inc | max_total | partial).alias("is_refusal")
+
+    def is_hammer_weight(self) -> pl.Expr:
+        """Return whether or not each sample is hammer weight.
+
+        Missing blows are never zero, like the `NaN` blows of NumPy columns in pandas, since the
+        `NaN` values of pandas become ``null``. The result is only ``null`` if all of the blows,
+        or all of the penetrations of zero blows, are ``null``.
+
+        Returns
+        -------
+        :external:class:`polars.Expr`
+            :term:`is_hammer_weight`
+        """
+        all_zero = pl.all_horizontal(
+            (pl.col(c) == 0).fill_null(False) for c in ["blows_1", "blows_2", "blows_3"]
+        )
+        pen = ["pen_1", "pen_2", "pen_3"]
+        return (
+            pl.when(_all_null("blows_1", "blows_2", "blows_3") | (all_zero & _all_null(*pen)))
+            .then(None)
+            .otherwise(all_zero & (pl.sum_horizontal(*pen) >= PEN_TOTAL_MIN))
+            .alias("is_hammer_weight")
+        )
+
+    def get_n_value(self, refusal: Any = 50, limit: bool = False) -> pl.Expr:
+        """Return the N-value for each sample.
+
+        Parameters
+        ----------
+        refusal: int, default 50
+            Equivalent N-value for samples with total penetration less than 450 mm. If `None` or
+            `NaN`, refusals are ``null``.
+        limit: bool, default False
+            If `True`, limits the resulting N-value to `refusal`.
+
+        Returns
+        -------
+        :external:class:`polars.Expr`
+            :term:`n_value`
+        """
+        n_value = self.get_main_drive()
+        is_refusal = self.is_refusal().fill_null(False)
+        missing = pd.isna(refusal)
+
+        if missing:
+            n_value = pl.when(is_refusal).then(None).otherwise(n_value)
+        else:
+            if not float(refusal).is_integer():
+                n_value = n_value.cast(pl.Float64)
+            n_value = pl.when(is_refusal).then(pl.lit(refusal)).otherwise(n_value)
+
+        if limit:
+            if missing:
+                warnings.warn(
+                    f"Limiting the N-value with {refusal} will not do anything. "
+                    f"If you want to limit the N-value, make sure that `refusal` is set correctly.",
+                    stacklevel=2,
+                    category=SyntaxWarning,
+                )
+            else:
+                n_value = pl.when(n_value > refusal).then(pl.lit(refusal)).otherwise(n_value)
+
+        return n_value.alias("n_value")
+
+    def get_report(self) -> pl.Expr:
+        """Return descriptive strings that show the blows per interval and N-value.
+
+        Returns
+        -------
+        :external:class:`polars.Expr`
+            :term:`spt_report`
+        """
+        blows = []
+        for interval in (1, 2, 3):
+            _blows = pl.col(f"blows_{interval}").cast(pl.String)
+            _pen = pl.col(f"pen_{interval}")
+            blows.append(
+                pl.when(_pen < PEN_INC_MIN)
+                .then(pl.concat_str(_blows, pl.lit("/"), _pen.cast(pl.String), pl.lit("mm")))
+                .otherwise(_blows)
+                .fill_null("-")
+            )
+        cat_blows = pl.concat_str(blows, separator=",")
+        cat_blows = pl.when(cat_blows != "-,-,-").then(cat_blows)
+
+        main_pen = self.get_main_pen()
+        n_value = pl.concat_str(pl.lit("N="), self.get_main_drive().cast(pl.String))
+        n_value = (
+            pl.when((main_pen < 2 * PEN_INC_MIN).fill_null(False))
+            .then(pl.concat_str(n_value, pl.lit("/"), main_pen.cast(pl.String), pl.lit("mm")))
+            .otherwise(n_value)
+        )
+        n_value = (
+            pl.when((self.get_total_pen() <= PEN_INC_MIN).fill_null(False))
+            .then(pl.lit("N="))
+            .otherwise(n_value)
+        )
+        n_value = (
+            pl.when(self.is_refusal().fill_null(False))
+            .then(pl.concat_str(n_value, pl.lit("(R)")))
+            .otherwise(n_value)
+        )
+        n_value = (
+            pl.when(self.is_hammer_weight().fill_null(False))
+            .then(pl.concat_str(n_value, pl.lit("(HW)")))
+            .otherwise(n_value)
+        )
+
+        return pl.concat_str(cat_blows, n_value, separator=" ").alias("spt_report")
+
+    def get_typical_hammer_efficiency_factor(self) -> pl.Expr:
+        """Return the typical hammer efficiency factor based on country, type, and release.
+
+        For :external:class:`polars.DataFrame` objects, the values of the required columns are
+        validated like in pandas, while for :external:class:`polars.LazyFrame` objects, unknown
+        values are left as ``null`` without running a query.
+
+        Returns
+        -------
+        :external:class:`polars.Expr`
+            :term:`spt_hammer_efficiency_factor`
+
+        Raises
+        ------
+        ValueError
+            If any value in the required columns of a :external:class:`polars.DataFrame` is not a
+            known hammer.
+        """
+        self._validate_columns(HAMMER_COLUMNS)
+        hammers = dict(_hammer_efficiency_factors)
+        if isinstance(self._obj, pl.DataFrame):
+            for i, column in enumerate(HAMMER_COLUMNS):
+                valid_values = list(dict.fromkeys(hammer[i] for hammer in hammers))
+                values = self._obj[column].drop_nulls().unique(maintain_order=True)
+                invalid_values = values.filter(~values.is_in(valid_values)).to_list()
+                if invalid_values:
+                    raise ValueError(
+                        f"Invalid value{'s' if len(invalid_values) > 1 else ''} found in "
+                        f"'{column}': {invalid_values}. Valid values are: {valid_values}"
+                    )
+
+        # The hammer of each row is joined into a single key that is looked up in the registered
+        # hammers, where any `null` value makes the key `null`.
+        factor = pl.concat_str([pl.col(column) for column in HAMMER_COLUMNS], separator="\x1f")
+        factor = factor.replace_strict(
+            {"\x1f".join(hammer): value for hammer, value in hammers.items()},
+            default=None,
+            return_dtype=pl.Float64,
+        )
+        return factor.alias("spt_hammer_efficiency_factor")
+
+
+class IndexNamespace(_Namespace):
+    """Namespace that contains expressions related to index property tests.
+
+    See :class:`geotech_pandas.lab.index.IndexDataFrameAccessor` for the pandas equivalent.
+    """
+
+    def get_moisture_content(self, prefix: str = "moisture_content") -> pl.Expr:
+        """Return the moisture content according to ASTM D2216.
+
+        Parameters
+        ----------
+        prefix: string, default "moisture_content"
+            Prefix to use for looking up the relevant columns. This is also used as the prefix of
+            the name of the result if using a non-default value.
+
+        Returns
+        -------
+        :external:class:`polars.Expr`
+            Moisture content.
+        """
+        moist, dry, container = (
+            f"{prefix}_mass_moist",
+            f"{prefix}_mass_dry",
+            f"{prefix}_mass_container",
+        )
+        self._validate_columns([moist, dry, container])
+        name = f"{prefix}_moisture_content" if prefix != "moisture_content" else prefix
+        moisture_content = (
+            (pl.col(moist) - pl.col(dry)) / (pl.col(dry) - pl.col(container)) * 100
+        ).cast(pl.Float64)
+        return moisture_content.fill_nan(None).alias(name)
+
+    def get_liquid_limit(self, trials: int = 3) -> pl.Expr:
+        """Return the liquid limit according to ASTM D4318 Method A Multipoint Method.
+
+        The moisture content at 25 drops is interpolated with a least-squares line through the
+        trials with both a number of drops and a moisture content, against the logarithm of the
+        number of drops. The line is solved in closed form, so samples with less than two trials
+        of different number of drops are ``null``.
+
+        Parameters
+        ----------
+        trials: int, default 3
+            The number of trials to be considered for interpolation.
+
+        Returns
+        -------
+        :external:class:`polars.Expr`
+            :term:`liquid_limit`
+        """
+        drops = [f"liquid_limit_{n + 1}_drops" for n in range(trials)]
+        moisture_content = [f"liquid_limit_{n + 1}_moisture_content" for n in range(trials)]
+        self._validate_columns(["point_id", "bottom", *drops, *moisture_content])
+
+        valid = [
+            pl.col(d).is_not_null() & pl.col(w).is_not_null()
+            for d, w in zip(drops, moisture_content, strict=True)
+        ]
+        x = [
+            pl.when(v).then(pl.col(d).cast(pl.Float64).log())
+            for v, d in zip(valid, drops, strict=True)
+        ]
+        y = [
+            pl.when(v).then(pl.col(w).cast(pl.Float64))
+            for v, w in zip(valid, moisture_content, strict=True)
+        ]
+
+        n = pl.sum_horizontal(v.cast(pl.Float64) for v in valid)
+        x_mean = pl.sum_horizontal(x) / n
+        y_mean = pl.sum_horizontal(y) / n
+        sxx = pl.sum_horizontal((xi - x_mean) ** 2 for xi in x)
+        sxy = pl.sum_horizontal((xi - x_mean) * (yi - y_mean) for xi, yi in zip(x, y, strict=True))
+        forecast = y_mean + sxy / sxx * (math.log(25) - x_mean)
+        return pl.when((n >= 2) & (sxx > 0)).then(forecast).alias("liquid_limit")  # noqa: PLR2004
+
+    def get_plastic_limit(self) -> pl.Expr:
+        """Return the plastic limit according to ASTM D4318.
+
+        Returns
+        -------
+        :external:class:`polars.Expr`
+            :term:`plastic_limit`
+        """
+        columns = ["plastic_limit_1_moisture_content", "plastic_limit_2_moisture_content"]
+        self._validate_columns(columns)
+        return pl.mean_horizontal(columns).alias("plastic_limit")
+
+    def is_nonplastic(self) -> pl.Expr:
+        """Return whether a layer is nonplastic.
+
+        Returns
+        -------
+        :external:class:`polars.Expr`
+            :term:`is_nonplastic`
+        """
+        self._validate_columns(["liquid_limit", "plastic_limit"])
+        # Comparisons with `null` are `null`, so layers without either limit are nonplastic.
+        return (
+            (pl.col("plastic_limit") >= pl.col("liquid_limit"))
+            .fill_null(True)
+            .alias("is_nonplastic")
+        )
+
+    def get_plasticity_index(self) -> pl.Expr:
+        """Return the plasticity index.
+
+        Returns
+        -------
+        :external:class:`polars.Expr`
+            :term:`plasticity_index`
+        """
+        return (
+            pl.when(~self.is_nonplastic())
+            .then(pl.col("liquid_limit") - pl.col("plastic_limit"))
+            .alias("plasticity_index")
+        )
+
+    def get_liquidity_index(self) -> pl.Expr:
+        """Return the liquidity index.
+
+        Returns
+        -------
+        :external:class:`polars.Expr`
+            :term:`liquidity_index`
+        """
+        self._validate_columns(["moisture_content", "plastic_limit", "plasticity_index"])
+        liquidity_index = (pl.col("moisture_content") - pl.col("plastic_limit")) / pl.col(
+            "plasticity_index"
+        )
+        return liquidity_index.cast(pl.Float64).fill_nan(None).alias("liquidity_index")
+
+
+class _InSituNamespace(_Namespace):
+    """Namespace of the in-situ tests."""
+
+    @property
+    def spt(self) -> SPTNamespace:
+        """Namespace of the Standard Penetration Test (SPT)."""
+        return SPTNamespace(self._obj)
+
+
+class _LabNamespace(_Namespace):
+    """Namespace of the laboratory tests."""
+
+    @property
+    def index(self) -> IndexNamespace:
+        """Namespace of the index property tests."""
+        return IndexNamespace(self._obj)
+
+
+@pl.api.register_dataframe_namespace("geotech")
+@pl.api.register_lazyframe_namespace("geotech")
+class GeotechNamespace(_Namespace):
+    """Polars namespace that mirrors the pandas ``geotech`` accessor with expressions.
+
+    Parameters
+    ----------
+    frame: :external:class:`polars.DataFrame` or :external:class:`polars.LazyFrame`
+        Frame with :term:`point_id` and :term:`bottom` columns.
+
+    Raises
+    ------
+    AttributeError
+        When the frame does not have the :term:`point_id` and :term:`bottom` columns.
+
+    Examples
+    --------
+    >>> import polars as pl
+    >>> import geotech_pandas.polars
+    >>> lf = pl.LazyFrame({"point_id": ["BH-1", "BH-1", "BH-2"], "bottom": [1.0, 2.0, 1.5]})
+    >>> lf.with_columns(lf.geotech.layer.get_top()).collect()
+    shape: (3, 3)
+    ┌──────────┬────────┬─────┐
+    │ point_id ┆ bottom ┆ top │
+    │ ---      ┆ ---    ┆ --- │
+    │ str      ┆ f64    ┆ f64 │
+    ╞══════════╪════════╪═════╡
+    │ BH-1     ┆ 1.0    ┆ 0.0 │
+    │ BH-1     ┆ 2.0    ┆ 1.0 │
+    │ BH-2     ┆ 1.5    ┆ 0.0 │
+    └──────────┴────────┴─────┘
+    """
+
+    def __init__(self, frame: Frame) -> None:
+        super().__init__(frame)
+        self._validate_columns()
+
+    @property
+    def layer(self) -> LayerNamespace:
+        """Namespace of the depth-related expressions."""
+        return LayerNamespace(self._obj)
+
+    @property
+    def in_situ(self) -> _InSituNamespace:
+        """Namespace of the in-situ tests."""
+        return _InSituNamespace(self._obj)
+
+    @property
+    def lab(self) -> _LabNamespace:
+        """Namespace of the laboratory tests."""
+        return _LabNamespace(self._obj)
+
+    def validate(self) -> None:
+        """Validate the ``bottom`` column like the pandas ``geotech`` accessor.
+
+        This runs a query on the frame.
+
+        Raises
+        ------
+        AttributeError
+            When ``bottom`` is not monotonically increasing in one or more ``point_id``, or when
+            duplicate value pairs in the ``point_id`` and ``bottom`` columns are detected.
+        """
+        bottom = pl.col("bottom").cast(pl.Float64)
+        result = (
+            self._obj.lazy()
+            .select(
+                not_increasing=pl.col("point_id")
+                .filter(
+                    pl.col("point_id").is_not_null()
+                    & (
+                        bottom.is_null()
+                        | bottom.is_nan()
+                        | (bottom.diff().over("point_id") < 0).fill_null(False)
+                    )
+                )
+                .unique(maintain_order=True)
+                .sort()
+                .implode(),
+                duplicated=pl.col("point_id")
+                .filter(~pl.struct("point_id", "bottom").is_first_distinct())
+                .implode(),
+            )
+            .collect()
+        )
+        not_increasing = result["not_increasing"][0].to_list()
+        if not_increasing:
+            raise AttributeError(
+                "Elements in the bottom column must be monotonically increasing for:"
+                f" {', '.join(map(str, not_increasing))}."
+            )
+        duplicated = result["duplicated"][0].to_list()
+        if duplicated:
+            raise AttributeError(
+                f"The DataFrame contains duplicate point_id and bottom: {', '.join(duplicated)}."
+            )
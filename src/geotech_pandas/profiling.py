@@ -0,0 +1,281 @@
+"""Instrumentation for timing accessor methods and their internal phases."""
+
+import functools
+import logging
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import Any, TypeVar
+
+import pandas as pd
+
+from geotech_pandas.config import get_option
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+logger = logging.getLogger(__name__)
+
+_active_profilers: list["Profiler"] = []
+
+# Running peaks of traced memory, in bytes, of the profiled calls that are currently executing.
+_memory_peaks: list[int] = []
+
+
+class Profiler:
+    """Collector of the calls recorded while profiling is enabled.
+
+    Each record holds the name of the profiled method or phase, its wall time in seconds, and the
+    number of rows that it processed. The wall time of a method includes the wall time of the
+    phases that it calls.
+
+    If memory tracking is enabled, each record also holds the peak memory and the net memory
+    allocated by the call in bytes, as traced by :mod:`tracemalloc`, and the ratio of the peak
+    memory to the memory usage of the DataFrame that the call processed, which is roughly the
+    number of full-frame copies that the call held at once. Note that tracing memory slows down
+    the calls, so the wall times are inflated while memory tracking is enabled.
+
+    Parameters
+    ----------
+    log: bool, default False
+        If `True`, each recorded call is also emitted as a structured log event through the
+        ``geotech_pandas.profiling`` logger.
+    memory: bool, default False
+        If `True`, the memory used by each call is also recorded.
+    """
+
+    def __init__(self, log: bool = False, memory: bool = False) -> None:
+        self.log = log
+        self.memory = memory
+        self.records: list[dict[str, Any]] = []
+
+    def _record(self, record: dict[str, Any]) -> None:
+        """Add a record of a profiled call.
+
+        Parameters
+        ----------
+        record: dict
+            Record with the qualified ``name`` of the profiled method or phase, its ``wall_time``
+            in seconds, the number of ``rows`` processed, and the ``peak_memory``,
+            ``allocated_memory`` and ``peak_memory_ratio`` if memory was traced.
+        """
+        self.records.append(record)
+
+    def reset(self) -> None:
+        """Remove all records."""
+        self.records.clear()
+
+    def to_frame(self) -> pd.DataFrame:
+        """Return a summary of the records for each profiled method or phase.
+
+        Returns
+        -------
+        :external:class:`~pandas.DataFrame`
+            DataFrame indexed by ``name`` with the number of ``calls``, the total ``rows``
+            processed, the total ``wall_time`` and the ``mean_wall_time`` per call, sorted by the
+            total ``wall_time`` in descending order. If memory tracking is enabled, the maximum
+            ``peak_memory``, the total ``allocated_memory`` and the maximum ``peak_memory_ratio``
+            per call are also included.
+        """
+        columns = ["name", "wall_time", "rows"]
+        aggregations = {
+            "calls": ("wall_time", "size"),
+            "rows": ("rows", "sum"),
+            "wall_time": ("wall_time", "sum"),
+        }
+        if self.memory:
+            columns.extend(["peak_memory", "allocated_memory", "peak_memory_ratio"])
+            aggregations.update(
+                {
+                    "peak_memory": ("peak_memory", "max"),
+                    "allocated_memory": ("allocated_memory", "sum"),
+                    "peak_memory_ratio": ("peak_memory_ratio", "max"),
+                }
+            )
+
+        records = pd.DataFrame(self.records, columns=columns)
+        summary = records.groupby("name").agg(**aggregations)
+        summary.insert(3, "mean_wall_time", summary["wall_time"] / summary["calls"])
+        return summary.sort_values("wall_time", ascending=False)
+
+
+_session_profiler = Profiler()
+
+
+def get_profiler() -> Profiler:
+    """Return the session profiler used when the ``profile`` option is enabled.
+
+    Returns
+    -------
+    Profiler
+        Session profiler.
+    """
+    return _session_profiler
+
+
+@contextmanager
+def profile(log: bool = False, memory: bool = False) -> Iterator[Profiler]:
+    """Record the accessor calls made inside a ``with`` block.
+
+    Parameters
+    ----------
+    log: bool, default False
+        If `True`, each recorded call is also emitted as a structured log event through the
+        ``geotech_pandas.profiling`` logger.
+    memory: bool, default False
+        If `True`, the peak memory, the allocated memory and the peak memory ratio of each call
+        are also recorded.
+
+    Yields
+    ------
+    Profiler
+        Profiler that holds the records of the block.
+
+    Examples
+    --------
+    >>> import geotech_pandas
+    >>> df = pd.DataFrame({"point_id": ["BH-1", "BH-1"], "bottom": [1.0, 2.0]})
+    >>> with geotech_pandas.profile() as p:
+    ...     top = df.geotech.layer.get_top()
+    >>> p.to_frame().loc["LayerDataFrameAccessor.get_top", "calls"]
+    np.int64(1)
+    """
+    profiler = Profiler(log=log, memory=memory)
+    _active_profilers.append(profiler)
+    try:
+        yield profiler
+    finally:
+        _active_profilers.remove(profiler)
+
+
+def _get_active_profilers() -> list[Profiler]:
+    """Return the profilers that should record the current call."""
+    if get_option("profile"):
+        _session_profiler.memory = get_option("profile.memory")
+        return [*_active_profilers, _session_profiler]
+    return _active_profilers
+
+
+def _get_frame(args: tuple, kwargs: dict) -> pd.DataFrame | pd.Series | None:
+    """Return the first DataFrame-like argument of a call.
+
+    Accessors are represented by their underlying DataFrame.
+    """
+    for arg in [*args, *kwargs.values()]:
+        if isinstance(arg, pd.DataFrame | pd.Series):
+            return arg
+        if isinstance(getattr(arg, "_obj", None), pd.DataFrame):
+            return arg._obj
+    return None
+
+
+def _start_memory_trace() -> tuple[int, bool]:
+    """Start tracing the memory of a profiled call.
+
+    Returns
+    -------
+    tuple of int and bool
+        Traced memory at the start of the call, in bytes, and whether tracing was started by this
+        call.
+    """
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+
+    # Resetting the peak would lose the peak of an enclosing call, so fold it into its running peak
+    # first.
+    current, peak = tracemalloc.get_traced_memory()
+    if _memory_peaks:
+        _memory_peaks[-1] = max(_memory_peaks[-1], peak)
+    tracemalloc.reset_peak()
+    _memory_peaks.append(current)
+    return current, started
+
+
+def _stop_memory_trace(start: int, started: bool) -> tuple[int, int]:
+    """Stop tracing the memory of a profiled call.
+
+    Parameters
+    ----------
+    start: int
+        Traced memory at the start of the call, in bytes.
+    started: bool
+        Whether tracing was started by the call.
+
+    Returns
+    -------
+    tuple of int
+        Peak memory and net allocated memory of the call, in bytes.
+    """
+    current, peak = tracemalloc.get_traced_memory()
+    peak = max(_memory_peaks.pop(), peak)
+    if _memory_peaks:
+        _memory_peaks[-1] = max(_memory_peaks[-1], peak)
+    if started:
+        tracemalloc.stop()
+    return peak - start, current - start
+
+
+def profiled(func: F) -> F:
+    """Decorate a method or phase to be recorded by the active profilers.
+
+    When profiling is disabled, the decorated function is called directly.
+
+    Parameters
+    ----------
+    func: callable
+        Method or phase to profile.
+
+    Returns
+    -------
+    callable
+        Decorated method or phase.
+    """
+    name = func.__qualname__
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        profilers = _get_active_profilers()
+        if not profilers:
+            return func(*args, **kwargs)
+
+        memory = any(profiler.memory for profiler in profilers)
+        if memory:
+            memory_start, started = _start_memory_trace()
+
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            wall_time = time.perf_counter() - start
+            frame = _get_frame(args, kwargs)
+            record: dict[str, Any] = {
+                "name": name,
+                "wall_time": wall_time,
+                "rows": 0 if frame is None else len(frame),
+            }
+            if memory:
+                peak_memory, allocated_memory = _stop_memory_trace(memory_start, started)
+                frame_memory = 0 if frame is None else frame.memory_usage(deep=False)
+                if isinstance(frame_memory, pd.Series):
+                    frame_memory = frame_memory.sum()
+                record.update(
+                    {
+                        "peak_memory": peak_memory,
+                        "allocated_memory": allocated_memory,
+                        "peak_memory_ratio": peak_memory / frame_memory if frame_memory else 0.0,
+                    }
+                )
+
+            for profiler in profilers:
+                profiler._record(record)
+            if get_option("profile.log") or any(profiler.log for profiler in profilers):
+                logger.info(
+                    "%s: %.6f s, %d rows",
+                    name,
+                    wall_time,
+                    record["rows"],
+                    extra={"geotech_profile": record},
+                )
+
+    return wrapper  # type: ignore[return-value]
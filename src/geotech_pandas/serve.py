@@ -0,0 +1,480 @@
+"""Local HTTP server that batches concurrent requests into single accessor calls.
+
+Requests that carry only a few points are dominated by the overhead of building a DataFrame,
+validating it and calling the accessor. :class:`BatchServer` collects the requests that arrive
+within a short time window, concatenates the DataFrames of the requests for the same method into a
+single DataFrame, makes a single accessor call in a process pool, and splits the result back to each
+request.
+
+The server only depends on the standard library and speaks a minimal subset of HTTP/1.1:
+
+- ``POST /compute`` with a JSON body that holds the ``method`` path under the ``geotech`` accessor,
+  such as ``"in_situ.spt.get_n_value"``, the ``data`` as a mapping of column names to lists of
+  values, and optional ``kwargs`` for the method. The response holds the ``result``, where Series
+  are given as ``{"name": ..., "data": [...]}`` and DataFrames as
+  ``{"columns": [...], "data": [[...], ...]}``.
+- ``GET /metrics`` returns the metrics of :meth:`BatchServer.get_metrics`.
+
+The server is meant for internal tools on a trusted network and listens on the loopback interface
+by default.
+"""
+
+import asyncio
+import collections
+import concurrent.futures
+import itertools
+import json
+import multiprocessing
+import time
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from geotech_pandas.utils import call_method, resolve_method
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed"}
+
+_LATENCY_SAMPLES = 10_000
+
+
+def _to_json(result: Any) -> Any:
+    """Return a JSON-serializable representation of a Series or DataFrame result."""
+    if isinstance(result, pd.DataFrame | pd.Series):
+        return json.loads(result.to_json(orient="split", index=False))
+    raise TypeError(f"Unsupported result type: {type(result).__name__}.")
+
+
+def _compute(
+    method: str, kwargs: dict[str, Any], frames: list[pd.DataFrame]
+) -> list[tuple[bool, Any]]:
+    """Compute a batch of requests with a single accessor call.
+
+    The :term:`point_id` of each request is prefixed with the position of the request, so that
+    points of different requests with the same :term:`point_id` are kept apart. If the batch fails,
+    for example because one of the requests is invalid, each request is computed separately so that
+    only the invalid requests fail.
+
+    Parameters
+    ----------
+    method: str
+        Dotted path of the method under the ``geotech`` accessor.
+    kwargs: dict
+        Keyword arguments of the method.
+    frames: list of :external:class:`~pandas.DataFrame`
+        DataFrame of each request.
+
+    Returns
+    -------
+    list of tuple
+        For each request, whether it succeeded, and its JSON-serializable result or error message.
+    """
+    parts = resolve_method(method)
+    lengths = [len(frame) for frame in frames]
+    try:
+        batch = pd.concat(
+            [
+                frame.assign(
+                    point_id=(f"{i}/" + frame["point_id"].astype(str)).where(
+                        frame["point_id"].notna()
+                    )
+                )
+                for i, frame in enumerate(frames)
+            ],
+            ignore_index=True,
+        )
+        result = call_method(batch, parts, **kwargs)
+        if len(result) != len(batch):
+            raise ValueError(f"{method} does not return a result for each layer.")
+        if isinstance(result, pd.DataFrame) and "point_id" in result:
+            result = result.assign(point_id=result["point_id"].str.split("/", n=1).str[1])
+        offsets = np.cumsum([0, *lengths])
+        return [
+            (True, _to_json(result.iloc[start:end])) for start, end in itertools.pairwise(offsets)
+        ]
+    except Exception:
+        return [_compute_single(parts, kwargs, frame) for frame in frames]
+
+
+def _compute_single(
+    parts: list[str], kwargs: dict[str, Any], frame: pd.DataFrame
+) -> tuple[bool, Any]:
+    """Compute a single request, returning the error message if it fails."""
+    try:
+        return True, _to_json(call_method(frame, parts, **kwargs))
+    except Exception as error:
+        return False, f"{type(error).__name__}: {error}"
+
+
+class _Batch:
+    """Requests for the same method and keyword arguments that are computed together."""
+
+    def __init__(self, method: str, kwargs: dict[str, Any]) -> None:
+        self.method = method
+        self.kwargs = kwargs
+        self.frames: list[pd.DataFrame] = []
+        self.futures: list[asyncio.Future] = []
+        self.rows = 0
+        self.handle: asyncio.TimerHandle | None = None
+
+
+class BatchServer:
+    """Asyncio HTTP server that batches concurrent requests into single accessor calls.
+
+    Requests for the same method and keyword arguments that arrive within `window` seconds of the
+    first request are computed together. A batch is computed early once it holds `max_rows` layers.
+
+    Parameters
+    ----------
+    host: str, default "127.0.0.1"
+        Host to listen on.
+    port: int, default 0
+        Port to listen on. If 0, a free port is chosen, see :attr:`address`.
+    window: float, default 0.005
+        Time window, in seconds, for collecting the requests of a batch.
+    max_rows: int, default 1_000_000
+        Number of layers that triggers the computation of a batch before the end of its window.
+    processes: int, optional
+        Number of worker processes for computing the batches. If `None`, the number of CPUs is
+        used. If 0, the batches are computed in a thread of the server process instead, which
+        avoids copying the DataFrames between processes. The worker processes are spawned, so
+        scripts that start the server must guard it with ``if __name__ == "__main__":``.
+
+    Examples
+    --------
+    >>> import asyncio
+    >>> from geotech_pandas.serve import BatchServer, submit
+    >>> df = pd.DataFrame({"point_id": ["BH-1", "BH-1"], "bottom": [1.0, 2.0]})
+    >>> async def main():
+    ...     async with BatchServer(processes=0) as server:
+    ...         return await submit(*server.address, "layer.get_top", df)
+    >>> asyncio.run(main())
+    0    0.0
+    1    1.0
+    Name: top, dtype: float64
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        window: float = 0.005,
+        max_rows: int = 1_000_000,
+        processes: int | None = None,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.window = window
+        self.max_rows = max_rows
+        self.processes = processes
+        self._server: asyncio.Server | None = None
+        self._executor: concurrent.futures.Executor | None = None
+        self._batches: dict[str, _Batch] = {}
+        self._tasks: set[asyncio.Task] = set()
+        self._reset_metrics()
+
+    def _reset_metrics(self) -> None:
+        self._start = time.perf_counter()
+        self._requests = 0
+        self._errors = 0
+        self._batch_count = 0
+        self._rows = 0
+        self._compute_time = 0.0
+        self._latencies: collections.deque[float] = collections.deque(maxlen=_LATENCY_SAMPLES)
+
+    @property
+    def address(self) -> tuple[str, int]:
+        """Host and port that the server listens on."""
+        if self._server is None:
+            return self.host, self.port
+        host, port = self._server.sockets[0].getsockname()[:2]
+        return host, port
+
+    async def start(self) -> None:
+        """Start listening for requests."""
+        if self.processes == 0:
+            self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        else:
+            self._executor = concurrent.futures.ProcessPoolExecutor(
+                max_workers=self.processes, mp_context=multiprocessing.get_context("spawn")
+            )
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self._reset_metrics()
+
+    async def close(self) -> None:
+        """Stop listening, finish the pending batches and shut down the workers."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        for key in list(self._batches):
+            self._flush(key)
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    async def serve_forever(self) -> None:
+        """Start the server if needed and serve requests until cancelled."""
+        if self._server is None:
+            await self.start()
+        try:
+            await asyncio.Event().wait()
+        finally:
+            await self.close()
+
+    async def __aenter__(self) -> "BatchServer":  # noqa: D105
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:  # noqa: D105
+        await self.close()
+
+    def get_metrics(self) -> dict[str, float]:
+        """Return the latency and throughput metrics since the server started.
+
+        Returns
+        -------
+        dict
+            Number of ``requests``, failed requests or ``errors``, ``batches`` and ``rows``
+            computed, the ``mean_batch_size`` in requests, the total ``compute_time`` of the
+            batches in seconds, the mean, median and 95th percentile of the request latency in
+            seconds, computed over the most recent requests, and the ``throughput`` in requests
+            per second.
+        """
+        latencies = np.array(self._latencies)
+        elapsed = time.perf_counter() - self._start
+        return {
+            "requests": self._requests,
+            "errors": self._errors,
+            "batches": self._batch_count,
+            "rows": self._rows,
+            "mean_batch_size": self._requests / self._batch_count if self._batch_count else 0.0,
+            "compute_time": self._compute_time,
+            "latency_mean": float(latencies.mean()) if len(latencies) else 0.0,
+            "latency_p50": float(np.percentile(latencies, 50)) if len(latencies) else 0.0,
+            "latency_p95": float(np.percentile(latencies, 95)) if len(latencies) else 0.0,
+            "throughput": self._requests / elapsed if elapsed else 0.0,
+        }
+
+    async def compute(self, method: str, frame: pd.DataFrame, **kwargs: Any) -> Any:
+        """Add a request to the batch of its method and wait for its result.
+
+        Parameters
+        ----------
+        method: str
+            Dotted path of the method under the ``geotech`` accessor.
+        frame: :external:class:`~pandas.DataFrame`
+            DataFrame of the request.
+        **kwargs
+            Keyword arguments of the method.
+
+        Returns
+        -------
+        dict
+            JSON-serializable result of the request.
+
+        Raises
+        ------
+        ValueError
+            When `method` is unknown or the calculation fails.
+        """
+        resolve_method(method)
+        start = time.perf_counter()
+        loop = asyncio.get_running_loop()
+        key = json.dumps([method, kwargs], sort_keys=True)
+        batch = self._batches.get(key)
+        if batch is None:
+            batch = self._batches[key] = _Batch(method, kwargs)
+            batch.handle = loop.call_later(self.window, self._flush, key)
+
+        future = loop.create_future()
+        batch.frames.append(frame)
+        batch.futures.append(future)
+        batch.rows += len(frame)
+        if batch.rows >= self.max_rows:
+            self._flush(key)
+
+        try:
+            return await future
+        finally:
+            self._requests += 1
+            self._latencies.append(time.perf_counter() - start)
+
+    def _flush(self, key: str) -> None:
+        """Start computing the batch of `key`."""
+        batch = self._batches.pop(key, None)
+        if batch is None:
+            return
+        if batch.handle is not None:
+            batch.handle.cancel()
+        task = asyncio.ensure_future(self._run(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: _Batch) -> None:
+        """Compute a batch in the executor and resolve the futures of its requests."""
+        start = time.perf_counter()
+        try:
+            results = await asyncio.get_running_loop().run_in_executor(
+                self._executor, _compute, batch.method, batch.kwargs, batch.frames
+            )
+        except Exception as error:
+            results = [(False, f"{type(error).__name__}: {error}")] * len(batch.futures)
+
+        self._compute_time += time.perf_counter() - start
+        self._batch_count += 1
+        self._rows += batch.rows
+        for future, (ok, result) in zip(batch.futures, results, strict=True):
+            if future.done():
+                continue
+            if ok:
+                future.set_result(result)
+            else:
+                self._errors += 1
+                future.set_exception(ValueError(result))
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Handle an HTTP connection with a single request."""
+        try:
+            status, body = await self._respond(reader)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            writer.close()
+            return
+
+        payload = json.dumps(body).encode()
+        writer.write(
+            f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(payload)}\r\n"
+            "Connection: close\r\n\r\n".encode()
+            + payload
+        )
+        try:
+            await writer.drain()
+        finally:
+            writer.close()
+
+    async def _respond(self, reader: asyncio.StreamReader) -> tuple[int, Any]:
+        """Read an HTTP request and return the status and body of its response."""
+        head = await reader.readuntil(b"\r\n\r\n")
+        request_line, *header_lines = head.decode("latin-1").split("\r\n")
+        verb, path, _ = request_line.split(" ", 2)
+        headers = {}
+        for line in header_lines:
+            if ":" in line:
+                name, value = line.split(":", 1)
+                headers[name.strip().lower()] = value.strip()
+        content = await reader.readexactly(int(headers.get("content-length", 0)))
+
+        if path == "/metrics":
+            return (200, self.get_metrics()) if verb == "GET" else (405, {"error": "Use GET."})
+        if path != "/compute":
+            return 404, {"error": f"Unknown path: {path}."}
+        if verb != "POST":
+            return 405, {"error": "Use POST."}
+
+        try:
+            request = json.loads(content)
+            frame = pd.DataFrame(request["data"])
+            kwargs = request.get("kwargs") or {}
+            result = await self.compute(request["method"], frame, **kwargs)
+        except (ValueError, KeyError, TypeError) as error:
+            return 400, {"error": str(error)}
+        return 200, {"result": result}
+
+
+def _from_json(result: dict[str, Any]) -> pd.Series | pd.DataFrame:
+    """Return the Series or DataFrame of a JSON result."""
+    if "columns" in result:
+        return pd.DataFrame(result["data"], columns=result["columns"])
+    return pd.Series(result["data"], name=result.get("name"))
+
+
+async def submit(
+    host: str, port: int, method: str, frame: pd.DataFrame, **kwargs: Any
+) -> pd.Series | pd.DataFrame:
+    """Send a request to a :class:`BatchServer` and return its result.
+
+    The DataFrame and the result are sent as JSON, so extension dtypes are not preserved and
+    missing values become `NaN` or `None`.
+
+    Parameters
+    ----------
+    host: str
+        Host of the server.
+    port: int
+        Port of the server.
+    method: str
+        Dotted path of the method under the ``geotech`` accessor, such as
+        ``"in_situ.spt.get_n_value"``.
+    frame: :external:class:`~pandas.DataFrame`
+        DataFrame to compute.
+    **kwargs
+        JSON-serializable keyword arguments of the method.
+
+    Returns
+    -------
+    :external:class:`~pandas.Series` or :external:class:`~pandas.DataFrame`
+        Result of the method, with a default index.
+
+    Raises
+    ------
+    ValueError
+        When the server rejects the request or the calculation fails.
+    """
+    body = json.dumps(
+        {"method": method, "data": json.loads(frame.to_json(orient="columns")), "kwargs": kwargs}
+    ).encode()
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        writer.write(
+            f"POST /compute HTTP/1.1\r\nHost: {host}\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode()
+            + body
+        )
+        await writer.drain()
+        response = await reader.read()
+    finally:
+        writer.close()
+
+    head, _, content = response.partition(b"\r\n\r\n")
+    status = int(head.split(b" ", 2)[1])
+    payload = json.loads(content)
+    if status != 200:  # noqa: PLR2004
+        raise ValueError(payload["error"])
+    return _from_json(payload["result"])
+
+
+def run(
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    window: float = 0.005,
+    max_rows: int = 1_000_000,
+    processes: int | None = None,
+) -> None:
+    """Run a :class:`BatchServer` until interrupted.
+
+    Parameters
+    ----------
+    host: str, default "127.0.0.1"
+        Host to listen on.
+    port: int, default 8000
+        Port to listen on.
+    window: float, default 0.005
+        Time window, in seconds, for collecting the requests of a batch.
+    max_rows: int, default 1_000_000
+        Number of layers that triggers the computation of a batch before the end of its window.
+    processes: int, optional
+        Number of worker processes for computing the batches. If `None`, the number of CPUs is
+        used. If 0, the batches are computed in a thread of the server process.
+
+    Notes
+    -----
+    The worker processes are spawned, so scripts that run the server must guard the call with
+    ``if __name__ == "__main__":``.
+    """
+    server = BatchServer(host, port, window, max_rows, processes)
+    asyncio.run(server.serve_forever())
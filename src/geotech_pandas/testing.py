@@ -0,0 +1,170 @@
+"""Synthetic data generators for testing and benchmarking geotech-pandas."""
+
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from geotech_pandas.in_situ.spt import BLOWS_INC_MAX, BLOWS_TOTAL_MAX, PEN_INC_MIN
+
+HAMMERS = [
+    ("jp", "donut hammer", "free fall"),
+    ("jp", "donut hammer", "rope and pulley"),
+    ("us", "safety hammer", "rope and pulley"),
+    ("us", "donut hammer", "rope and pulley"),
+    ("ar", "donut hammer", "rope and pulley"),
+    ("cn", "donut hammer", "free fall"),
+    ("cn", "donut hammer", "rope and pulley"),
+]
+
+LIQUID_LIMIT_DROPS = [(15, 25), (20, 30), (25, 36)]
+
+
+def _make_spt(
+    rng: np.random.Generator, bottom: np.ndarray, n_points: int, layers_per_point: int
+) -> dict[str, Any]:
+    """Return SPT columns with blows that increase with depth.
+
+    Around 1% of the samples are hammer weight. Samples are stopped with a partial penetration once
+    an increment reaches 50 blows or the total reaches 100 blows, and the remaining increments are
+    left as `NA`.
+    """
+    n = len(bottom)
+    blows = rng.poisson((2 + 2.5 * bottom)[:, None] * np.array([0.8, 1.0, 1.1])).astype(float)
+    blows[rng.random(n) < 0.01] = 0  # noqa: PLR2004
+    pen = np.full((n, 3), float(PEN_INC_MIN))
+
+    total = np.cumsum(blows, axis=1)
+    stop = (blows >= BLOWS_INC_MAX) | (total >= BLOWS_TOTAL_MAX)
+    rows = np.flatnonzero(stop.any(axis=1))
+    inc = stop[rows].argmax(axis=1)
+    previous = np.where(inc > 0, total[rows, np.maximum(inc - 1, 0)], 0)
+    blows[rows, inc] = np.minimum(
+        np.minimum(blows[rows, inc], BLOWS_INC_MAX), BLOWS_TOTAL_MAX - previous
+    )
+    pen[rows, inc] = rng.integers(10, PEN_INC_MIN, len(rows))
+    after = np.arange(3) > inc[:, None]
+    blows[rows] = np.where(after, np.nan, blows[rows])
+    pen[rows] = np.where(after, np.nan, pen[rows])
+
+    hammer = np.array(HAMMERS, dtype=object)[rng.integers(0, len(HAMMERS), n_points)]
+    hammer = np.repeat(hammer, layers_per_point, axis=0)
+
+    return {
+        "sample_type": np.full(n, "spt", dtype=object),
+        "sample_number": np.tile(np.arange(1, layers_per_point + 1), n_points),
+        "blows_1": pd.array(blows[:, 0], dtype="Int64"),
+        "blows_2": pd.array(blows[:, 1], dtype="Int64"),
+        "blows_3": pd.array(blows[:, 2], dtype="Int64"),
+        "pen_1": pd.array(pen[:, 0], dtype="Int64"),
+        "pen_2": pd.array(pen[:, 1], dtype="Int64"),
+        "pen_3": pd.array(pen[:, 2], dtype="Int64"),
+        "spt_hammer_country_ref": hammer[:, 0],
+        "spt_hammer_type": hammer[:, 1],
+        "spt_hammer_release": hammer[:, 2],
+    }
+
+
+def _make_atterberg(rng: np.random.Generator, n: int) -> dict[str, Any]:
+    """Return natural moisture content masses and Atterberg limit trial columns.
+
+    The liquid limit trials follow a flow curve with a random liquid limit and flow index, while the
+    plastic limit trials scatter around a plastic limit that is lower than the liquid limit.
+    """
+    columns: dict[str, Any] = {}
+
+    container = rng.uniform(15.0, 25.0, n)
+    dry_soil = rng.uniform(80.0, 150.0, n)
+    moisture_content = rng.uniform(15.0, 45.0, n)
+    columns["moisture_content_mass_moist"] = (
+        container + dry_soil * (1 + moisture_content / 100)
+    ).round(2)
+    columns["moisture_content_mass_dry"] = (container + dry_soil).round(2)
+    columns["moisture_content_mass_container"] = container.round(2)
+
+    liquid_limit = rng.uniform(25.0, 80.0, n)
+    flow_index = rng.uniform(5.0, 20.0, n)
+    for trial, (low, high) in enumerate(LIQUID_LIMIT_DROPS, start=1):
+        drops = rng.integers(low, high, n)
+        columns[f"liquid_limit_{trial}_drops"] = drops
+        columns[f"liquid_limit_{trial}_moisture_content"] = (
+            liquid_limit - flow_index * np.log10(drops / 25) + rng.normal(0.0, 0.3, n)
+        ).round(1)
+
+    plastic_limit = liquid_limit * rng.uniform(0.45, 0.75, n)
+    for trial in (1, 2):
+        columns[f"plastic_limit_{trial}_moisture_content"] = (
+            plastic_limit + rng.normal(0.0, 0.3, n)
+        ).round(1)
+
+    return columns
+
+
+def make_boreholes(
+    n_points: int,
+    layers_per_point: int,
+    with_spt: bool = True,
+    with_atterberg: bool = True,
+    seed: int | None = None,
+) -> pd.DataFrame:
+    """Return a synthetic :external:class:`~pandas.DataFrame` of boreholes.
+
+    The generated DataFrame passes the validation of the ``geotech`` accessor, where each point has
+    ``layers_per_point`` layers with thicknesses between 0.5 m and 2.0 m. This is mainly intended
+    for testing and benchmarking at arbitrary scales.
+
+    Parameters
+    ----------
+    n_points: int
+        Number of points or boreholes.
+    layers_per_point: int
+        Number of layers in each point.
+    with_spt: bool, default True
+        If `True`, include an SPT sample with hammer details for every layer. The blows increase
+        with depth and deep samples become refusals. The blows and penetrations are stored as
+        nullable integers.
+    with_atterberg: bool, default True
+        If `True`, include natural moisture content masses, three liquid limit trials and two
+        plastic limit trials for every layer.
+    seed: int, optional
+        Seed of the random number generator for reproducible DataFrames.
+
+    Returns
+    -------
+    :external:class:`~pandas.DataFrame`
+        DataFrame with :term:`point_id`, :term:`bottom` and :term:`top` columns, and the SPT and
+        Atterberg limit columns if requested.
+
+    Examples
+    --------
+    >>> from geotech_pandas.testing import make_boreholes
+    >>> df = make_boreholes(2, 3, with_spt=False, with_atterberg=False, seed=0)
+    >>> df
+      point_id  bottom   top
+    0     BH-1    1.46  0.00
+    1     BH-1    2.36  1.46
+    2     BH-1    2.92  2.36
+    3     BH-2    0.52  0.00
+    4     BH-2    2.24  0.52
+    5     BH-2    4.11  2.24
+    """
+    rng = np.random.default_rng(seed)
+    n = n_points * layers_per_point
+
+    width = len(str(n_points))
+    point_id = pd.Index([f"BH-{i:0{width}d}" for i in range(1, n_points + 1)], dtype=object)
+    thickness = rng.uniform(0.5, 2.0, (n_points, layers_per_point)).round(2)
+    bottom = np.cumsum(thickness, axis=1).round(2)
+    top = np.concatenate([np.zeros((n_points, 1)), bottom[:, :-1]], axis=1)
+
+    columns: dict[str, Any] = {
+        "point_id": point_id.repeat(layers_per_point),
+        "bottom": bottom.ravel(),
+        "top": top.ravel(),
+    }
+    if with_spt:
+        columns.update(_make_spt(rng, bottom.ravel(), n_points, layers_per_point))
+    if with_atterberg:
+        columns.update(_make_atterberg(rng, n))
+
+    return pd.DataFrame(columns, index=pd.RangeIndex(n))
@@ -1,17 +1,232 @@
 """Internal utilities."""
 
+import functools
+import importlib
+import threading
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+import numpy as np
+import pandas as pd
+
+from geotech_pandas.config import get_option
+
+F = TypeVar("F", bound=Callable[..., Any])
+
 
 class SubAccessor:
     """A property-like object for both classes and class instances.
 
     This is required for sphinx autodoc to work correctly on subaccessors.
+
+    The subaccessor can be given as a class or as a ``"module:class"`` path, where the module is
+    only imported on the first access of the subaccessor. This keeps ``import geotech_pandas``
+    from importing every subpackage and their dependencies.
     """
 
     def __init__(self, accessor) -> None:
         self._accessor = accessor
 
-    def __get__(self, obj, cls):
+    def _resolve(self):
+        """Import and cache the subaccessor class if it was given as a path."""
+        if isinstance(self._accessor, str):
+            module, name = self._accessor.split(":")
+            self._accessor = getattr(importlib.import_module(module), name)
+        return self._accessor
+
+    def __get__(self, obj, cls):  # noqa: D105
+        accessor = self._resolve()
         if obj is None:
-            return self._accessor
+            return accessor
+
+        return accessor(obj)
+
+
+_NUMPY_DTYPES: dict[str, np.dtype] = {
+    "b": np.dtype("bool"),
+    "i": np.dtype("int64"),
+    "f": np.dtype("float64"),
+}
+_NUMPY_NULLABLE_DTYPES: dict[str, pd.api.extensions.ExtensionDtype] = {
+    "b": pd.BooleanDtype(),
+    "i": pd.Int64Dtype(),
+    "f": pd.Float64Dtype(),
+    "s": pd.StringDtype(),
+}
+
+_nesting = threading.local()
+
+
+def _get_kind(series: pd.Series) -> str | None:
+    """Return the kind of values in `series` regardless of its dtype backend.
+
+    Returns
+    -------
+    str or None
+        ``"b"`` for booleans, ``"i"`` for integers, ``"f"`` for floats, ``"s"`` for strings, or
+        `None` for anything else.
+    """
+    if pd.api.types.is_bool_dtype(series.dtype):
+        return "b"
+    if pd.api.types.is_integer_dtype(series.dtype):
+        return "i"
+    if pd.api.types.is_float_dtype(series.dtype):
+        return "f"
+
+    inferred = pd.api.types.infer_dtype(series, skipna=True)
+    return {
+        "boolean": "b",
+        "integer": "i",
+        "floating": "f",
+        "mixed-integer-float": "f",
+        "string": "s",
+    }.get(inferred)
+
+
+def resolve_method(method: str) -> list[str]:
+    """Split and validate the dotted path of a method under the ``geotech`` accessor.
+
+    Parameters
+    ----------
+    method: str
+        Dotted path of the method, such as ``"in_situ.spt.get_n_value"``.
+
+    Returns
+    -------
+    list of str
+        Parts of the path.
+
+    Raises
+    ------
+    ValueError
+        When `method` is not a public method of the ``geotech`` accessor.
+    """
+    from geotech_pandas.accessor import GeotechDataFrameAccessor  # noqa: PLC0415
+
+    parts = method.split(".") if isinstance(method, str) else []
+    accessor: Any = GeotechDataFrameAccessor
+    for part in parts:
+        if not part.isidentifier() or part.startswith("_") or not hasattr(accessor, part):
+            break
+        accessor = getattr(accessor, part)
+    else:
+        if parts and callable(accessor) and not isinstance(accessor, type):
+            return parts
+    raise ValueError(f"Unknown method: {method!r}.")
+
+
+def call_method(df: pd.DataFrame, parts: list[str] | tuple[str, ...], *args, **kwargs) -> Any:
+    """Call the method at the path `parts` of the ``geotech`` accessor of `df`.
+
+    Parameters
+    ----------
+    df: :external:class:`~pandas.DataFrame`
+        DataFrame to call the method on.
+    parts: list or tuple of str
+        Parts of the path of the method, see :func:`resolve_method`.
+    *args, **kwargs
+        Arguments of the method.
+
+    Returns
+    -------
+    Any
+        Result of the method.
+    """
+    accessor: Any = df.geotech
+    for part in parts:
+        accessor = getattr(accessor, part)
+    return accessor(*args, **kwargs)
+
+
+def convert_dtype_backend(series: pd.Series, dtype_backend: str | None) -> pd.Series:
+    """Return `series` converted to the dtype of its kind in `dtype_backend`.
+
+    With the ``"numpy"`` backend, missing values become `NaN`, where integers with missing values
+    become ``float64`` and booleans with missing values become ``object``, as pandas would read
+    them from a CSV file. Series with values of any other kind are returned as is.
+
+    Parameters
+    ----------
+    series: :external:class:`~pandas.Series`
+        Series to convert.
+    dtype_backend: {"numpy", "numpy_nullable", "pyarrow"} or None
+        Dtype backend to convert to. If `None`, `series` is returned as is.
+
+    Returns
+    -------
+    :external:class:`~pandas.Series`
+        Converted series.
+
+    Raises
+    ------
+    ImportError
+        When `dtype_backend` is ``"pyarrow"`` and pyarrow is not installed.
+    """
+    kind = _get_kind(series)
+    if dtype_backend is None or kind is None:
+        return series
+
+    if dtype_backend == "numpy_nullable":
+        return series.astype(_NUMPY_NULLABLE_DTYPES[kind])
+
+    if dtype_backend == "pyarrow":
+        try:
+            import pyarrow as pa  # noqa: PLC0415
+        except ImportError as error:
+            raise ImportError("pyarrow is required for the 'pyarrow' dtype backend.") from error
+        arrow_types = {"b": pa.bool_(), "i": pa.int64(), "f": pa.float64(), "s": pa.string()}
+        return series.astype(pd.ArrowDtype(arrow_types[kind]))
+
+    na = series.isna()
+    if not na.any() and kind in _NUMPY_DTYPES:
+        return series.astype(_NUMPY_DTYPES[kind])
+    if kind in {"i", "f"}:
+        return series.astype("float64")
+    return series.astype(object).mask(na, np.nan)
+
+
+def with_dtype_backend(func: F) -> F:
+    """Decorate an accessor method to convert its result to the ``dtype_backend`` option.
+
+    Only the result of the outermost decorated call is converted. This way, accessor methods that
+    use the results of other accessor methods always work with the dtypes of their calculation.
+    Results returned as arrays with ``as_array=True`` are never converted.
+
+    Parameters
+    ----------
+    func: callable
+        Accessor method that returns a :external:class:`~pandas.Series`, or a
+        :external:class:`~pandas.DataFrame` where each column is converted.
+
+    Returns
+    -------
+    callable
+        Decorated accessor method.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        dtype_backend = get_option("dtype_backend")
+        if dtype_backend is None or getattr(_nesting, "depth", 0):
+            return func(*args, **kwargs)
+
+        _nesting.depth = 1
+        try:
+            result = func(*args, **kwargs)
+        finally:
+            _nesting.depth = 0
+        if isinstance(result, tuple):
+            return result
+        if isinstance(result, pd.DataFrame):
+            converted = pd.DataFrame(
+                {
+                    i: convert_dtype_backend(result.iloc[:, i], dtype_backend)
+                    for i in range(result.shape[1])
+                },
+                index=result.index,
+            )
+            converted.columns = result.columns
+            return converted
+        return convert_dtype_backend(result, dtype_backend)
 
-        return self._accessor(obj)
+    return wrapper  # type: ignore[return-value]
@@ -1,8 +1,10 @@
 """Test if accessors are registered with their namespaces as expected."""
 
+import warnings
 from functools import reduce
 
 import pandas as pd
+import pandas._testing as tm
 import pytest
 
 import geotech_pandas  # noqa: F401
@@ -11,6 +13,7 @@ from geotech_pandas.in_situ.in_situ import InSituDataFrameAccessor
 from geotech_pandas.lab.lab import LabDataFrameAccessor
 from geotech_pandas.layer import LayerDataFrameAccessor
 from geotech_pandas.point import PointDataFrameAccessor
+from geotech_pandas.testing import make_boreholes
 
 
 @pytest.fixture
@@ -52,3 +55,64 @@ def test_dataframe_accessor(df, namespaces, accessor):
         Equivalent accessor class of the given namespace.
     """
     assert isinstance(reduce(getattr, namespaces, df), accessor)
+
+
+def test_optimize():
+    """Test if ``optimize`` converts the known columns to memory-efficient dtypes."""
+    df = make_boreholes(5, 10, seed=0)
+    df.loc[0, "blows_1"] = pd.NA
+    df["pen_3"] = df["pen_3"].astype("float64")
+    df.loc[0, "pen_3"] = float("nan")
+    result, report = df.geotech.optimize(report=True)
+
+    assert isinstance(result["point_id"].dtype, pd.CategoricalDtype)
+    assert isinstance(result["spt_hammer_type"].dtype, pd.CategoricalDtype)
+    assert result["sample_number"].dtype == "uint8"
+    assert result["blows_1"].dtype == "UInt8"
+    assert result["pen_3"].dtype == "UInt8"
+    assert result["bottom"].dtype == "float64"
+    assert (report["saved"] > 0).all()
+    assert "bottom" not in report.index
+
+
+@pytest.mark.parametrize(
+    ("values", "dtype"),
+    [
+        ([1, 255], "uint8"),
+        ([1, 256], "uint16"),
+        ([1, None, 70000], "UInt32"),
+        ([1, -1], "int64"),
+        ([1.5, 2.0], "float64"),
+        (["1", "2"], "object"),
+    ],
+)
+def test_optimize_unsigned(values, dtype):
+    """Test if unsigned columns are downcast only when their values fit."""
+    df = pd.DataFrame(
+        {
+            "point_id": ["BH-1"] * len(values),
+            "bottom": [float(i) for i in range(len(values))],
+            "blows_1": values,
+        }
+    )
+    assert df.geotech.optimize()["blows_1"].dtype == dtype
+
+
+@pytest.mark.parametrize(
+    ("subaccessor", "method"),
+    [
+        ("layer", "get_top"),
+        ("in_situ.spt", "get_report"),
+        ("in_situ.spt", "get_n_value"),
+        ("in_situ.spt", "get_typical_hammer_efficiency_factor"),
+        ("lab.index", "get_liquid_limit"),
+    ],
+)
+def test_optimize_methods(subaccessor, method):
+    """Test if accessor methods return the same values for an optimized DataFrame."""
+    df = make_boreholes(5, 10, seed=0)
+    expected = reduce(getattr, [*subaccessor.split("."), method], df.geotech)()
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        result = reduce(getattr, [*subaccessor.split("."), method], df.geotech.optimize().geotech)()
+    tm.assert_series_equal(result, expected, check_dtype=False)
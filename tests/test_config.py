@@ -0,0 +1,35 @@
+"""Test global options."""
+
+import pytest
+
+import geotech_pandas
+
+
+def test_set_option():
+    """Test if ``set_option`` changes the value returned by ``get_option``."""
+    geotech_pandas.set_option("profile", True)
+    assert geotech_pandas.get_option("profile") is True
+    geotech_pandas.reset_option("profile")
+    assert geotech_pandas.get_option("profile") is False
+
+
+def test_option_context():
+    """Test if ``option_context`` restores the previous value after the block."""
+    with geotech_pandas.option_context(profile=True):
+        assert geotech_pandas.get_option("profile") is True
+    assert geotech_pandas.get_option("profile") is False
+
+
+@pytest.mark.parametrize(
+    "method",
+    [
+        geotech_pandas.get_option,
+        geotech_pandas.reset_option,
+        lambda key: geotech_pandas.set_option(key, True),
+        lambda key: geotech_pandas.option_context(**{key: True}).__enter__(),
+    ],
+)
+def test_unknown_option(method):
+    """Test if a ``KeyError`` is raised for unknown options."""
+    with pytest.raises(KeyError, match="Unknown option: 'unknown'"):
+        method("unknown")
@@ -0,0 +1,124 @@
+"""Test the ``geotech`` accessor on Dask DataFrames."""
+
+from typing import TYPE_CHECKING
+
+import pandas as pd
+import pandas._testing as tm
+import pytest
+
+from geotech_pandas.testing import make_boreholes
+
+if TYPE_CHECKING:
+    import dask.dataframe
+
+dd = pytest.importorskip("dask.dataframe")
+geotech_dask = pytest.importorskip("geotech_pandas.dask")
+
+
+@pytest.fixture
+def df() -> pd.DataFrame:
+    """Return synthetic boreholes with SPT and Atterberg limit columns."""
+    return make_boreholes(50, 7, seed=0)
+
+
+@pytest.fixture
+def ddf(df) -> "dask.dataframe.DataFrame":
+    """Return the boreholes as a Dask DataFrame with points that span two partitions."""
+    return dd.from_pandas(df, npartitions=4)
+
+
+def test_align_partitions(ddf):
+    """Test if no point spans two partitions and the order of the layers is kept."""
+    aligned = geotech_dask.align_partitions(ddf, npartitions=3)
+    aligned.geotech.validate()
+    assert aligned.npartitions == 3  # noqa: PLR2004
+    tm.assert_frame_equal(aligned.compute().sort_index(), ddf.compute())
+    for i in range(aligned.npartitions):
+        partition = aligned.get_partition(i).compute()
+        for _, point in partition.groupby("point_id"):
+            assert point.index.is_monotonic_increasing
+
+
+def test_validate_split_points(ddf):
+    """Test if points that span two partitions are rejected."""
+    with pytest.raises(AttributeError, match="span two partitions"):
+        ddf.geotech.validate()
+
+
+def test_validate_partitions(df):
+    """Test if each partition is validated by the pandas accessor."""
+    df.loc[1, "bottom"] = 0.0
+    ddf = geotech_dask.align_partitions(dd.from_pandas(df, npartitions=2))
+    with pytest.raises(AttributeError, match="monotonically increasing"):
+        ddf.geotech.validate()
+
+
+def test_missing_columns(ddf):
+    """Test if Dask DataFrames without the required columns are rejected."""
+    with pytest.raises(AttributeError, match="point_id"):
+        ddf.drop(columns="point_id").geotech  # noqa: B018
+
+
+@pytest.mark.parametrize(
+    "method",
+    [
+        "layer.get_top",
+        "layer.get_center",
+        "in_situ.spt.get_n_value",
+        "in_situ.spt.is_refusal",
+        "in_situ.spt.get_report",
+        "in_situ.spt.get_typical_hammer_efficiency_factor",
+        "lab.index.get_liquid_limit",
+    ],
+)
+def test_methods(df, ddf, method):
+    """Test if methods mapped over the partitions match the pandas methods and their metadata."""
+    dask_accessor = geotech_dask.align_partitions(ddf).geotech
+    pandas_accessor = df.geotech
+    for name in method.split("."):
+        dask_accessor = getattr(dask_accessor, name)
+        pandas_accessor = getattr(pandas_accessor, name)
+
+    result = dask_accessor()
+    expected = pandas_accessor()
+    assert result.dtype == expected.dtype
+    tm.assert_series_equal(result.compute().sort_index(), expected)
+
+
+def test_meta_missing_values():
+    """Test if the metadata matches the result when only some partitions have missing values."""
+    df = pd.DataFrame({"point_id": ["BH-1", "BH-1", "BH-2", None], "bottom": [1, 2, 1, 3]})
+    ddf = dd.from_pandas(df, npartitions=2)
+
+    result = ddf.geotech.layer.get_top()
+
+    assert result.dtype == "float64"
+    assert result.compute().dtype == result.dtype
+    assert result.partitions[0].compute().dtype == result.dtype
+
+
+def test_meta_missing_booleans(df):
+    """Test if booleans of NumPy columns have the dtype of the metadata in every partition."""
+    columns = ["blows_1", "blows_2", "blows_3", "pen_1", "pen_2", "pen_3"]
+    df[columns] = df[columns].astype("float64")
+    df.loc[0, columns] = float("nan")
+    ddf = geotech_dask.align_partitions(dd.from_pandas(df, npartitions=4))
+
+    result = ddf.geotech.in_situ.spt.is_refusal()
+
+    assert result.compute().dtype == result.dtype
+    assert all(partition.compute().dtype == result.dtype for partition in result.partitions)
+
+
+def test_unknown_method(ddf):
+    """Test if private and unknown methods are not exposed."""
+    with pytest.raises(AttributeError):
+        ddf.geotech.layer._validate_columns  # noqa: B018
+    with pytest.raises(AttributeError):
+        ddf.geotech.layer.get_bottom  # noqa: B018
+
+
+def test_as_array(ddf):
+    """Test if methods that return arrays are rejected."""
+    with pytest.raises(TypeError, match="Series or DataFrame"):
+        ddf.geotech.layer.get_top(as_array=True)
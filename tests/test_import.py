@@ -1,8 +1,50 @@
 """Test geotech-pandas."""
 
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
 import geotech_pandas
 
 
 def test_import() -> None:
     """Test that the package can be imported."""
     assert isinstance(geotech_pandas.__name__, str)
+
+
+@pytest.mark.parametrize(
+    ("code", "module", "imported"),
+    [
+        ("", "statsmodels", False),
+        ("", "geotech_pandas.in_situ", False),
+        ("", "geotech_pandas.lab", False),
+        ("df.geotech.layer.get_top()", "statsmodels", False),
+        ("df.geotech.layer.get_top()", "numba", False),
+        ("", "geotech_pandas.serve", False),
+        ("df.geotech.in_situ", "geotech_pandas.in_situ", True),
+        ("df.geotech.lab.index", "statsmodels", False),
+        ("geotech_pandas.lab", "geotech_pandas.lab", True),
+    ],
+)
+def test_lazy_import(code, module, imported) -> None:
+    """Test if heavy subpackages and dependencies are only imported when needed."""
+    script = textwrap.dedent(
+        f"""
+        import sys
+        import pandas as pd
+        import geotech_pandas
+        df = pd.DataFrame({{"point_id": ["BH-1"], "bottom": [1.0]}})
+        {code}
+        sys.exit(int({module!r} in sys.modules))
+        """
+    )
+    result = subprocess.run([sys.executable, "-c", script], check=False)
+    assert result.returncode == int(imported)
+
+
+def test_unknown_attribute() -> None:
+    """Test if an ``AttributeError`` is raised for unknown attributes of the package."""
+    with pytest.raises(AttributeError, match="has no attribute 'unknown'"):
+        geotech_pandas.unknown  # noqa: B018
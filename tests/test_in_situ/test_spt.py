@@ -1,12 +1,15 @@
 """Test ``spt`` subaccessor methods."""
 
+import sys
 from functools import reduce
 
+import numpy as np
 import pandas as pd
 import pandas._testing as tm
 import pytest
 
-from geotech_pandas.in_situ import SPTDataFrameAccessor
+import geotech_pandas
+from geotech_pandas.in_situ import SPTDataFrameAccessor, spt
 
 
 @pytest.fixture
@@ -181,3 +184,474 @@ def test_any_with_na_error(df):
     mask = df[["blows_2", "blows_3"]] >= max_value
     with pytest.raises(ValueError, match="`values` and `mask` must have the same shape."):
         df.geotech.in_situ.spt._any_with_na_rows(values, mask)
+
+
+@pytest.mark.parametrize(
+    "method",
+    [
+        "get_main_drive",
+        "is_refusal",
+        "is_hammer_weight",
+        "get_n_value",
+        "get_report",
+    ],
+)
+def test_spt_methods_pyarrow(df, method):
+    """Test if the methods return the same values for a DataFrame backed by pyarrow."""
+    pytest.importorskip("pyarrow")
+    expected = getattr(df.geotech.in_situ.spt, method)()
+    result = getattr(df.convert_dtypes(dtype_backend="pyarrow").geotech.in_situ.spt, method)()
+    tm.assert_series_equal(result, expected, check_dtype=False)
+
+
+@pytest.mark.parametrize(
+    "method",
+    [
+        "get_seating_pen",
+        "get_main_pen",
+        "get_total_pen",
+        "get_seating_drive",
+        "get_main_drive",
+        "get_total_drive",
+        "is_refusal",
+        "is_hammer_weight",
+        "get_n_value",
+        "get_typical_hammer_efficiency_factor",
+    ],
+)
+def test_spt_methods_as_array(df, method):
+    """Test if `as_array=True` returns the values and missing value mask of the Series."""
+    expected = getattr(df.geotech.in_situ.spt, method)()
+    values, na = getattr(df.geotech.in_situ.spt, method)(as_array=True)
+    assert isinstance(values, np.ndarray)
+    np.testing.assert_array_equal(na, expected.isna().to_numpy())
+    np.testing.assert_array_equal(values[~na], expected[~na].to_numpy(dtype=values.dtype))
+
+
+@pytest.mark.parametrize("kwargs", [{}, {"refusal": 100, "limit": True}, {"refusal": pd.NA}])
+def test_compute_all(df, kwargs):
+    """Test if `compute_all` returns the same results as each method."""
+    spt = df.geotech.in_situ.spt
+    result = spt.compute_all(**kwargs)
+    expected = pd.DataFrame(
+        {
+            "seating_pen": spt.get_seating_pen(),
+            "main_pen": spt.get_main_pen(),
+            "total_pen": spt.get_total_pen(),
+            "seating_drive": spt.get_seating_drive(),
+            "main_drive": spt.get_main_drive(),
+            "total_drive": spt.get_total_drive(),
+            "is_refusal": spt.is_refusal(),
+            "is_hammer_weight": spt.is_hammer_weight(),
+            "n_value": spt.get_n_value(**kwargs),
+        }
+    )
+    tm.assert_frame_equal(result, expected)
+
+
+def test_compute_all_read_once(df, mocker):
+    """Test if the blows and penetrations are only read once by each method of a subaccessor."""
+    spt = df.geotech.in_situ.spt
+    read = mocker.spy(spt, "_get_float_array")
+    spt.compute_all()
+    spt.get_n_value()
+    spt.get_report()
+    assert read.call_count == 3  # noqa: PLR2004
+
+
+def test_compute_after_change(df):
+    """Test if a held subaccessor returns the results of the current blows and penetrations."""
+    spt = df.geotech.in_situ.spt
+    spt.compute_all()
+    df.loc[0, "blows_2"] = 60
+    expected = df.geotech.in_situ.spt
+    tm.assert_series_equal(spt.get_n_value(), expected.get_n_value())
+    tm.assert_series_equal(spt.get_report(), expected.get_report())
+    assert spt.get_n_value().iloc[0] == 50  # noqa: PLR2004
+
+
+def test_compute_all_dtype_backend(df):
+    """Test if the `dtype_backend` option converts each column of `compute_all`."""
+    pytest.importorskip("pyarrow")
+    with geotech_pandas.option_context(dtype_backend="pyarrow"):
+        result = df.geotech.in_situ.spt.compute_all()
+    assert all(isinstance(dtype, pd.ArrowDtype) for dtype in result.dtypes)
+
+
+def test_numpy_missing_blows():
+    """Test if `NaN` blows of NumPy columns are not zero and leave no missing booleans."""
+    df = pd.DataFrame(
+        {
+            "point_id": ["nan_hw", "hw", "all_na", "zero_na_pen"],
+            "bottom": [1.0, 1.0, 1.0, 1.0],
+            "sample_type": ["spt", "spt", "spt", "spt"],
+            "sample_number": [1, 1, 1, 1],
+            "blows_1": [np.nan, 0.0, np.nan, 0.0],
+            "blows_2": [0.0, 0.0, np.nan, 0.0],
+            "blows_3": [0.0, 0.0, np.nan, 0.0],
+            "pen_1": [150.0, 150.0, np.nan, np.nan],
+            "pen_2": [150.0, 150.0, np.nan, np.nan],
+            "pen_3": [150.0, 150.0, np.nan, np.nan],
+        }
+    )
+    spt_accessor = df.geotech.in_situ.spt
+
+    tm.assert_series_equal(
+        spt_accessor.is_hammer_weight(),
+        pd.Series([False, True, False, False], name="is_hammer_weight"),
+    )
+    tm.assert_series_equal(
+        spt_accessor.is_refusal(), pd.Series([False, False, False, False], name="is_refusal")
+    )
+    tm.assert_series_equal(
+        spt_accessor.get_report(),
+        pd.Series(
+            ["-,0.0,0.0 N=0.0", "0.0,0.0,0.0 N=0.0(HW)", pd.NA, "0.0,0.0,0.0 N=0.0"],
+            name="spt_report",
+            dtype="string",
+        ),
+    )
+
+
+def test_get_report_float(df):
+    """Test if the report formats float columns like `astype("string")`."""
+    columns = ["blows_1", "blows_2", "blows_3", "pen_1", "pen_2", "pen_3"]
+    df[columns] = df[columns].astype("float64")
+    result = df.geotech.in_situ.spt.get_report()
+    assert result.iloc[0] == "23.0,25.0,24.0 N=49.0"
+    assert result.iloc[3] == "45.0,47.0,50.0/100.0mm N=97.0/250.0mm(R)"
+    assert result.iloc[5] == "50.0/50.0mm,-,- N=(R)"
+    assert result.isna().tolist() == df["spt_report"].isna().tolist()
+
+
+@pytest.mark.parametrize("pyarrow", [True, False])
+def test_parse_report(df, monkeypatch, pyarrow):
+    """Test if the report strings are parsed back into the SPT columns and remarks."""
+    if not pyarrow:
+        monkeypatch.setitem(sys.modules, "pyarrow", None)
+    columns = ["blows_1", "blows_2", "blows_3", "pen_1", "pen_2", "pen_3"]
+    report = df.geotech.in_situ.spt.get_report()
+    spt_rows = df["sample_type"].eq("spt")
+
+    result = spt.parse_report(report)
+
+    tm.assert_frame_equal(result.loc[spt_rows, columns], df.loc[spt_rows, columns].astype("Int64"))
+    assert result.loc[spt_rows, "is_refusal"].tolist() == df.loc[spt_rows, "is_refusal"].tolist()
+    assert (
+        result.loc[spt_rows, "is_hammer_weight"].tolist()
+        == df.loc[spt_rows, "is_hammer_weight"].tolist()
+    )
+    assert result["is_parsed"].tolist() == [True, True, pd.NA, True, True, True, True, True]
+    assert result.loc[~spt_rows].isna().all(axis=None)
+
+
+def test_parse_report_unparseable():
+    """Test if strings that do not follow the report format are flagged instead of raising."""
+    series = pd.Series(
+        ["1.5,2,3 N=5", "12,25,50/75mm N=75/225mm(R)", "12,25", "N=12", "", "R"],
+        index=list("abcdef"),
+    )
+    result = spt.parse_report(series)
+    assert result.index.tolist() == list("abcdef")
+    assert result["is_parsed"].tolist() == [True, True, False, False, False, False]
+    assert result["blows_1"].dtype == "Float64"
+    assert result["blows_1"].tolist()[:2] == [1.5, 12.0]
+    assert result.loc[["c", "d", "e", "f"]].drop(columns="is_parsed").isna().all(axis=None)
+
+
+@pytest.fixture
+def registry():
+    """Restore the typical hammer efficiency factors after a test."""
+    yield spt
+    spt.reset_hammer_efficiency_factors()
+
+
+def test_register_hammer_efficiency_factor(df, registry):
+    """Test if registered hammers are valid and replace the factors of known hammers."""
+    registry.register_hammer_efficiency_factor("ph", "safety hammer", "automatic", 0.85)
+    registry.register_hammer_efficiency_factor("jp", "donut hammer", "free fall", 0.8)
+    df.loc[2, ["spt_hammer_country_ref", "spt_hammer_type", "spt_hammer_release"]] = [
+        "ph",
+        "safety hammer",
+        "automatic",
+    ]
+    df.loc[7, "spt_hammer_release"] = "automatic"
+
+    result = df.geotech.in_situ.spt.get_typical_hammer_efficiency_factor()
+
+    expected = df["spt_hammer_efficiency_factor"].copy()
+    expected[[0, 2, 7]] = [0.8, 0.85, pd.NA]
+    tm.assert_series_equal(result, expected)
+
+
+def test_register_hammer_efficiency_factor_invalid(registry):
+    """Test if factors outside of (0, 1] are rejected."""
+    with pytest.raises(ValueError, match="greater than 0 and at most 1"):
+        registry.register_hammer_efficiency_factor("ph", "safety hammer", "automatic", 1.5)
+
+
+@pytest.mark.parametrize(
+    ("column", "value"),
+    [
+        ("spt_hammer_country_ref", "ph"),
+        ("spt_hammer_type", "automatic hammer"),
+        ("spt_hammer_release", "automatic"),
+    ],
+)
+def test_get_typical_hammer_efficiency_factor_invalid(df, column, value):
+    """Test if values that are not in the registered hammers are rejected."""
+    df[column] = df[column].astype(object)
+    df.loc[0, column] = value
+    with pytest.raises(ValueError, match=f"Invalid value found in '{column}': \\['{value}'\\]"):
+        df.geotech.in_situ.spt.get_typical_hammer_efficiency_factor()
+
+
+@pytest.fixture
+def corrections(df) -> pd.DataFrame:
+    """Return the DataFrame fixture with borehole, sampler, rod length and stress columns."""
+    return df.assign(
+        spt_borehole_diameter=[100.0, 150.0, 100.0, 200.0, 250.0, 100.0, 115.0, 116.0],
+        spt_sampler_type=[
+            "standard sampler",
+            "sampler without liners",
+            "standard sampler",
+            "standard sampler",
+            "standard sampler",
+            None,
+            "standard sampler",
+            "sampler without liners",
+        ],
+        spt_rod_length=[2.0, 3.0, 5.0, 8.0, 12.0, 5.0, -1.0, 10.0],
+        vertical_effective_stress=[50.0, -10.0, 100.0, 400.0, 100.0, 100.0, 100.0, 0.0],
+    )
+
+
+def test_get_n60(corrections):
+    """Test if the N-value is corrected with the factors of each sample."""
+    result = corrections.geotech.in_situ.spt.get_n60()
+    expected = pd.Series(
+        [49 * 1.3 * 0.75, 0.0, None, 50 * 1.15 * 0.95, None, None, None, 50 / 1.2 * 1.05 * 1.2],
+        name="n60",
+        dtype="Float64",
+    )
+    tm.assert_series_equal(result, expected)
+
+
+def test_get_n1_60(corrections):
+    """Test if the corrected N-value is normalized with a limited overburden factor."""
+    result = corrections.geotech.in_situ.spt.get_n1_60()
+    expected = pd.Series(
+        [49 * 1.3 * 0.75 * 2**0.5, None, None, 50 * 1.15 * 0.95 * 0.5, None, None, None, 89.25],
+        name="n1_60",
+        dtype="Float64",
+    )
+    tm.assert_series_equal(result, expected)
+
+
+def test_get_n60_invalid_sampler(corrections):
+    """Test if unknown samplers are rejected."""
+    corrections.loc[0, "spt_sampler_type"] = "split barrel"
+    with pytest.raises(ValueError, match="Invalid value found in 'spt_sampler_type'"):
+        corrections.geotech.in_situ.spt.get_n60()
+
+
+def test_get_n60_missing_columns(df):
+    """Test if the correction columns are required."""
+    with pytest.raises(AttributeError, match="spt_borehole_diameter"):
+        df.geotech.in_situ.spt.get_n60()
+
+
+@pytest.fixture
+def correlations():
+    """Restore the published correlations after a test."""
+    yield spt
+    spt.reset_correlations()
+
+
+def test_correlate(corrections):
+    """Test if every published correlation is evaluated from the corrected N-values."""
+    spt_accessor = corrections.geotech.in_situ.spt
+    n60 = spt_accessor.get_n60().to_numpy(dtype="float64", na_value=np.nan)
+    n1_60 = spt_accessor.get_n1_60().to_numpy(dtype="float64", na_value=np.nan)
+    stress = corrections["vertical_effective_stress"].to_numpy()
+
+    result = spt_accessor.correlate()
+
+    assert result.columns.tolist() == [name for name, _, _ in spt.CORRELATIONS]
+    assert (result.dtypes == "Float64").all()
+    expected = {
+        "phi_peck": 27.1 + 0.3 * n1_60 - 0.00054 * n1_60**2,
+        "phi_hatanaka": np.sqrt(20 * n1_60) + 20,
+        "phi_kulhawy": np.degrees(np.arctan((n60 / (12.2 + 20.3 * stress / 100)) ** 0.34)),
+        "su_stroud": 4.4 * n60,
+        "e_kulhawy": 500 * n60,
+        "dr_skempton": 100 * np.sqrt(n1_60 / 60),
+    }
+    for name, values in expected.items():
+        np.testing.assert_allclose(
+            result[name].to_numpy(dtype="float64", na_value=np.nan), values, err_msg=name
+        )
+
+
+def test_correlate_shared_inputs(corrections, mocker):
+    """Test if the inputs shared by the correlations are calculated once."""
+    spt_accessor = corrections.geotech.in_situ.spt
+    compute = mocker.spy(SPTDataFrameAccessor, "_compute")
+    get_n60 = mocker.spy(SPTDataFrameAccessor, "_get_n60")
+    spt_accessor.correlate(["phi_peck", "phi_kulhawy", "su_stroud", "dr_skempton"])
+    assert compute.call_count == 1
+    assert get_n60.call_count == 1
+
+
+def test_register_correlation(corrections, correlations):
+    """Test if registered correlations may use columns and replace published correlations."""
+    correlations.register_correlation("su_stroud", ["n60"], lambda n60: 5.0 * n60)
+    correlations.register_correlation(
+        "ratio", ["n_value", "bottom"], lambda n_value, bottom: n_value / bottom
+    )
+
+    result = corrections.geotech.in_situ.spt.correlate(["su_stroud", "ratio"])
+
+    n60 = corrections.geotech.in_situ.spt.get_n60()
+    tm.assert_series_equal(result["su_stroud"], (5.0 * n60).rename("su_stroud"))
+    tm.assert_series_equal(
+        result["ratio"],
+        corrections.geotech.in_situ.spt.get_n_value().astype("Float64").rename("ratio"),
+    )
+    assert correlations.get_correlations()["correlation"].tolist()[-1] == "ratio"
+
+    correlations.reset_correlations()
+    assert "ratio" not in correlations.get_correlations()["correlation"].tolist()
+
+
+def test_register_correlation_invalid(correlations):
+    """Test if correlations without inputs or a callable are rejected."""
+    with pytest.raises(ValueError, match="at least one input"):
+        correlations.register_correlation("empty", [], lambda: 0.0)
+    with pytest.raises(TypeError, match="must be callable"):
+        correlations.register_correlation("constant", ["n60"], 1.0)
+
+
+def test_correlate_invalid(corrections, correlations):
+    """Test if unknown correlations and missing input columns are rejected."""
+    with pytest.raises(ValueError, match="Unknown correlation: \\['phi_unknown'\\]"):
+        corrections.geotech.in_situ.spt.correlate(["phi_peck", "phi_unknown"])
+
+    correlations.register_correlation("su_pi", ["n60", "plasticity_index"], np.multiply)
+    with pytest.raises(AttributeError, match="plasticity_index"):
+        corrections.geotech.in_situ.spt.correlate(["su_pi"])
+
+
+@pytest.fixture
+def liquefaction() -> pd.DataFrame:
+    """Return loose, medium and dense sand layers with every column for liquefaction."""
+    return pd.DataFrame(
+        {
+            "point_id": ["BH-1", "BH-1", "BH-2", "BH-3"],
+            "top": [0.0, 1.5, 0.0, 0.0],
+            "bottom": [1.5, 3.0, 3.0, 1.0],
+            "sample_type": ["spt", "spt", "spt", "uds"],
+            "sample_number": [1, 2, 1, 1],
+            "blows_1": [2, 6, 12, None],
+            "blows_2": [3, 7, 15, None],
+            "blows_3": [3, 8, 18, None],
+            "pen_1": [150, 150, 150, None],
+            "pen_2": [150, 150, 150, None],
+            "pen_3": [150, 150, 150, None],
+            "spt_hammer_country_ref": "us",
+            "spt_hammer_type": "safety hammer",
+            "spt_hammer_release": "rope and pulley",
+            "spt_borehole_diameter": 100.0,
+            "spt_sampler_type": "standard sampler",
+            "spt_rod_length": [2.0, 4.0, 4.0, 2.0],
+            "vertical_total_stress": [14.0, 42.0, 28.0, 9.0],
+            "vertical_effective_stress": [9.0, 22.0, 15.0, 9.0],
+            "fines_content": [10.0, 10.0, 5.0, 40.0],
+        }
+    )
+
+
+def test_get_stress_reduction():
+    """Test if the stress reduction coefficient follows Blake (1996) at a few depths."""
+    result = spt._get_stress_reduction(np.array([0.0, 5.0, 10.0]))
+    np.testing.assert_allclose(result, [1.0, 0.9655, 0.9049], atol=1e-4)
+
+
+def test_get_liquefaction_factor_of_safety(liquefaction):
+    """Test if the factor of safety of each layer is calculated for every scenario."""
+    result = liquefaction.geotech.in_situ.spt.get_liquefaction_factor_of_safety(
+        magnitudes=[[6.5], [7.5]], pgas=[0.1, 0.3]
+    )
+
+    # Loose layer with a magnitude scaling factor of 1 and a peak ground acceleration of 0.3 g.
+    n1_60cs = np.exp(1.76 - 190 / 10.0**2) + (0.99 + 10.0**1.5 / 1000) * 6 * 0.75 * 1.7
+    crr = 1 / (34 - n1_60cs) + n1_60cs / 135 + 50 / (10 * n1_60cs + 45) ** 2 - 1 / 200
+    depth = 0.75
+    rd = (1 - 0.4113 * depth**0.5 + 0.04052 * depth + 0.001753 * depth**1.5) / (
+        1 - 0.4177 * depth**0.5 + 0.05729 * depth - 0.006205 * depth**1.5 + 0.001210 * depth**2
+    )
+    csr = 0.65 * 0.3 * 14.0 / 9.0 * rd
+
+    assert result.shape == (4, 4)
+    assert result.columns.tolist() == [(6.5, 0.1), (6.5, 0.3), (7.5, 0.1), (7.5, 0.3)]
+    assert result.columns.names == ["magnitude", "pga"]
+    assert (result.dtypes == "Float64").all()
+    assert result.loc[0, (7.5, 0.3)] == pytest.approx(crr * 10**2.24 / 7.5**2.56 / csr)
+    assert result.loc[0, (6.5, 0.3)] == pytest.approx(
+        result.loc[0, (7.5, 0.3)] * (7.5 / 6.5) ** 2.56
+    )
+    assert result.loc[0, (7.5, 0.1)] == pytest.approx(result.loc[0, (7.5, 0.3)] * 3)
+    assert (result.loc[2] == np.inf).all()
+    assert result.loc[3].isna().all()
+
+
+def test_get_liquefaction_potential_index(liquefaction):
+    """Test if the index of each point sums the weighted severity of its liquefiable layers."""
+    spt_accessor = liquefaction.geotech.in_situ.spt
+    factor_of_safety = spt_accessor.get_liquefaction_factor_of_safety(7.5, 0.3)[(7.5, 0.3)]
+    severity = 1 - factor_of_safety[[0, 1]].to_numpy(dtype="float64")
+    expected = (severity * (10 - 0.5 * np.array([0.75, 2.25])) * 1.5).sum()
+
+    result = spt_accessor.get_liquefaction_potential_index(magnitudes=7.5, pgas=[0.1, 0.3])
+
+    assert result.index.tolist() == ["BH-1", "BH-2", "BH-3"]
+    assert result.index.name == "point_id"
+    assert result[(7.5, 0.3)].tolist() == pytest.approx([expected, 0.0, 0.0])
+    assert result[(7.5, 0.1)].tolist() == [0.0, 0.0, 0.0]
+
+
+def test_get_liquefaction_potential_index_dtype_backend(liquefaction):
+    """Test if the `dtype_backend` option keeps the labels of the scenarios."""
+    with geotech_pandas.option_context(dtype_backend="pyarrow"):
+        result = liquefaction.geotech.in_situ.spt.get_liquefaction_potential_index(7.5, [0.1, 0.3])
+    assert result.columns.names == ["magnitude", "pga"]
+    assert (result.dtypes == "double[pyarrow]").all()
+
+
+@pytest.mark.parametrize("memory_budget", [1, 8, 24, 64])
+def test_get_liquefaction_potential_index_chunks(liquefaction, memory_budget):
+    """Test if the index is the same for unsorted points that are split into chunks."""
+    liquefaction = liquefaction.iloc[[2, 0, 3, 1]]
+    spt_accessor = liquefaction.geotech.in_situ.spt
+    magnitudes = np.array([[6.0], [7.0], [8.0]])
+    pgas = np.array([0.2, 0.4])
+
+    expected = spt_accessor.get_liquefaction_potential_index(magnitudes, pgas)
+    result = spt_accessor.get_liquefaction_potential_index(
+        magnitudes, pgas, memory_budget=memory_budget
+    )
+
+    tm.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize(
+    ("magnitudes", "pgas", "match"),
+    [
+        (7.5, [0.1, 0.0], "must be positive"),
+        ([6.5, 7.5], [0.1, 0.2, 0.3], "broadcast"),
+    ],
+)
+def test_get_liquefaction_factor_of_safety_invalid_scenarios(liquefaction, magnitudes, pgas, match):
+    """Test if scenarios that are not positive or cannot be broadcast are rejected."""
+    with pytest.raises(ValueError, match=match):
+        liquefaction.geotech.in_situ.spt.get_liquefaction_factor_of_safety(magnitudes, pgas)
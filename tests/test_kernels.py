@@ -0,0 +1,112 @@
+"""Test kernels for loops over the layers of each point."""
+
+import numpy as np
+import pandas as pd
+import pandas._testing as tm
+import pytest
+
+import geotech_pandas
+from geotech_pandas import kernels
+
+pytest.importorskip("numba")
+
+SIZE = 1000
+
+
+@pytest.fixture
+def point_id() -> pd.Series:
+    """Return unordered point IDs with a missing value and a single-layer point."""
+    return pd.Series(["BH-2", "BH-1", "BH-2", None, "BH-1", "BH-3", "BH-2"])
+
+
+@pytest.fixture
+def values() -> np.ndarray:
+    """Return random values that are increasing within some of the points."""
+    rng = np.random.default_rng(0)
+    values = np.cumsum(rng.uniform(0.5, 2.0, SIZE))
+    values[rng.integers(0, SIZE, 50)] = np.nan
+    values[rng.integers(0, SIZE, 50)] = 0.0
+    return values
+
+
+@pytest.fixture
+def offsets() -> np.ndarray:
+    """Return offsets of points with up to 30 layers, including empty points."""
+    rng = np.random.default_rng(0)
+    offsets = np.concatenate([[0], np.cumsum(rng.integers(0, 30, 100))])
+    return offsets[offsets <= SIZE]
+
+
+def test_get_groups(point_id):
+    """Test if ``get_groups`` stably groups the layers and excludes missing point IDs."""
+    order, offsets, labels = kernels.get_groups(point_id)
+    tm.assert_numpy_array_equal(order, np.array([1, 4, 0, 2, 6, 5]))
+    tm.assert_numpy_array_equal(offsets, np.array([0, 2, 5, 6]))
+    tm.assert_numpy_array_equal(labels, np.array(["BH-1", "BH-2", "BH-3"], dtype=object))
+
+
+@pytest.mark.parametrize("fill_value", [0.0, np.nan])
+def test_group_shift(values, offsets, fill_value):
+    """Test if the backends of ``group_shift`` give identical results."""
+    values = values[: offsets[-1]]
+    with geotech_pandas.option_context(kernel_backend="numba"):
+        numba_result = kernels.group_shift(values, offsets, fill_value)
+    with geotech_pandas.option_context(kernel_backend="numpy"):
+        numpy_result = kernels.group_shift(values, offsets, fill_value)
+    tm.assert_numpy_array_equal(numba_result, numpy_result)
+
+
+def test_group_is_increasing(values, offsets):
+    """Test if the backends of ``group_is_increasing`` give identical results."""
+    values = values[: offsets[-1]]
+    with geotech_pandas.option_context(kernel_backend="numba"):
+        numba_result = kernels.group_is_increasing(values, offsets)
+    with geotech_pandas.option_context(kernel_backend="numpy"):
+        numpy_result = kernels.group_is_increasing(values, offsets)
+    tm.assert_numpy_array_equal(numba_result, numpy_result)
+    assert numpy_result.any()
+    assert not numpy_result.all()
+
+
+def test_get_top():
+    """Test if the backends of ``get_top`` give identical results on unordered points."""
+    df = pd.DataFrame(
+        {
+            "point_id": ["BH-2", "BH-1", "BH-2", "BH-3", "BH-1", "BH-2"],
+            "bottom": [1.0, 2.5, 2.0, 4.0, 3.0, 3.5],
+        }
+    )
+    with geotech_pandas.option_context(kernel_backend="numba"):
+        numba_result = df.geotech.layer.get_top()
+    with geotech_pandas.option_context(kernel_backend="numpy"):
+        numpy_result = df.geotech.layer.get_top()
+    tm.assert_series_equal(numba_result, numpy_result)
+
+
+@pytest.mark.parametrize(
+    ("backend", "size", "expected"),
+    [
+        ("numba", 1, "numba"),
+        ("numpy", kernels.NUMBA_MIN_SIZE, "numpy"),
+        ("auto", 1, "numpy"),
+        ("auto", kernels.NUMBA_MIN_SIZE, "numba"),
+    ],
+)
+def test_get_backend(backend, size, expected):
+    """Test if ``get_backend`` follows the ``kernel_backend`` option."""
+    with geotech_pandas.option_context(kernel_backend=backend):
+        assert kernels.get_backend(size) == expected
+
+
+def test_get_backend_without_numba(mocker):
+    """Test if ``get_backend`` falls back to NumPy, or raises if Numba is requested."""
+    mocker.patch("geotech_pandas.kernels._is_numba_installed", return_value=False)
+    assert kernels.get_backend() == "numpy"
+    with geotech_pandas.option_context(kernel_backend="numba"), pytest.raises(ImportError):
+        kernels.get_backend()
+
+
+def test_invalid_backend():
+    """Test if an unknown kernel backend is rejected."""
+    with pytest.raises(ValueError, match="kernel_backend"):
+        geotech_pandas.set_option("kernel_backend", "cython")
@@ -2,11 +2,14 @@
 
 from functools import reduce
 
+import numpy as np
 import pandas as pd
 import pandas._testing as tm
 import pytest
 
+import geotech_pandas
 from geotech_pandas.lab import IndexDataFrameAccessor
+from geotech_pandas.lab.index import USCS_SYMBOLS
 
 
 def test_accessor():
@@ -73,3 +76,367 @@ def test_index_methods(df, method, column, rename, kwargs):
     result = result() if kwargs is None else result(**kwargs)
     expected = df[column] if rename is None else df[column].rename(rename)
     tm.assert_series_equal(result, expected, check_exact=False, rtol=0.01, atol=0.01)
+
+
+LAB_METHODS = ["get_moisture_content", "get_liquid_limit", "get_plastic_limit"]
+
+
+@pytest.mark.parametrize("method", LAB_METHODS)
+def test_index_methods_sparse(df, method):
+    """Test if methods return sparse results with the same values for sparse columns."""
+    sparse_df = df.copy()
+    for column in df.columns.drop(["point_id", "bottom"]):
+        if pd.api.types.is_float_dtype(df[column]) or pd.api.types.is_integer_dtype(df[column]):
+            sparse_df[column] = df[column].astype(pd.SparseDtype("float64", float("nan")))
+
+    expected = getattr(df.geotech.lab.index, method)()
+    result = getattr(sparse_df.geotech.lab.index, method)()
+    assert isinstance(result.dtype, pd.SparseDtype)
+    tm.assert_series_equal(
+        result.sparse.to_dense(), expected.astype("float64"), check_exact=False, rtol=0.01
+    )
+
+
+@pytest.mark.parametrize("method", LAB_METHODS)
+def test_index_methods_samples(df, method):
+    """Test if methods return the results of a sample table joined back to the layers."""
+    layers = pd.DataFrame(
+        {"point_id": ["bh-1", "bh-1", "bh-2", "bh-3"], "bottom": [0.5, 1.0, 1.0, 2.0]}
+    )
+    samples = df.iloc[[1, 0]].reset_index(drop=True)
+
+    expected = getattr(df.geotech.lab.index, method)().iloc[[0, 0, 1, 0]].set_axis(layers.index)
+    expected[[0, 3]] = pd.NA
+    result = getattr(layers.geotech.lab.index, method)(samples=samples)
+    tm.assert_series_equal(result, expected)
+
+
+@pytest.mark.parametrize(
+    "method",
+    [
+        "get_moisture_content",
+        "get_liquid_limit",
+        "get_plastic_limit",
+        "is_nonplastic",
+        "get_plasticity_index",
+        "get_liquidity_index",
+    ],
+)
+def test_index_methods_as_array(df, method):
+    """Test if `as_array=True` returns the values and missing value mask of the Series."""
+    expected = getattr(df.geotech.lab.index, method)()
+    values, na = getattr(df.geotech.lab.index, method)(as_array=True)
+    np.testing.assert_array_equal(na, expected.isna().to_numpy())
+    np.testing.assert_array_equal(values[~na], expected[~na].to_numpy(dtype=values.dtype))
+
+
+def test_get_moisture_contents(df):
+    """Test if the moisture contents of every prefix are calculated in one pass."""
+    df = df.assign(
+        liquid_limit_1_mass_moist=[23.51, 20.0, None, None, None],
+        liquid_limit_1_mass_dry=[17.85, 15.0, None, None, None],
+        liquid_limit_1_mass_container=[3.30, 5.0, None, None, None],
+    )
+    result = df.geotech.lab.index.get_moisture_contents()
+
+    assert result.columns.tolist() == ["moisture_content", "liquid_limit_1_moisture_content"]
+    tm.assert_series_equal(result["moisture_content"], df.geotech.lab.index.get_moisture_content())
+    tm.assert_series_equal(
+        result["liquid_limit_1_moisture_content"],
+        df.geotech.lab.index.get_moisture_content(prefix="liquid_limit_1"),
+    )
+    tm.assert_frame_equal(
+        df.geotech.lab.index.get_moisture_contents(prefixes=["liquid_limit_1"]), result.iloc[:, 1:]
+    )
+
+
+def test_get_moisture_contents_sparse(df):
+    """Test if each moisture content keeps the dtype of its own columns."""
+    columns = ["moisture_content_mass_moist", "moisture_content_mass_dry"]
+    sparse_df = df.assign(
+        **{column: df[column].astype(pd.SparseDtype("float64", np.nan)) for column in columns},
+        other_mass_moist=[2.0, None, None, None, None],
+        other_mass_dry=[1.0, None, None, None, None],
+        other_mass_container=[0.0, None, None, None, None],
+    )
+    result = sparse_df.geotech.lab.index.get_moisture_contents()
+
+    assert isinstance(result["moisture_content"].dtype, pd.SparseDtype)
+    assert result["other_moisture_content"].dtype == "float64"
+    assert result["other_moisture_content"].tolist()[0] == 100.0  # noqa: PLR2004
+    tm.assert_series_equal(
+        result["moisture_content"].sparse.to_dense(),
+        df.geotech.lab.index.get_moisture_content().astype("float64"),
+    )
+
+
+def test_get_moisture_contents_samples(df):
+    """Test if the moisture contents of a sample table are joined back to the layers."""
+    layers = pd.DataFrame({"point_id": ["bh-2", "bh-9"], "bottom": [1, 1]})
+    result = layers.geotech.lab.index.get_moisture_contents(samples=df)
+    expected = df.geotech.lab.index.get_moisture_contents().iloc[[1, 4]].set_axis(layers.index)
+    tm.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize(
+    ("prefixes", "error", "match"),
+    [
+        ([], ValueError, "At least one prefix"),
+        (None, ValueError, "No columns ending with"),
+        (["missing"], AttributeError, "missing_mass_moist"),
+    ],
+)
+def test_get_moisture_contents_invalid(prefixes, error, match):
+    """Test if missing prefixes are rejected."""
+    df = pd.DataFrame({"point_id": ["bh-1"], "bottom": [1.0]})
+    with pytest.raises(error, match=match):
+        df.geotech.lab.index.get_moisture_contents(prefixes=prefixes)
+
+
+def test_get_liquid_limit_row_order(df):
+    """Test if the liquid limit is aligned with the layers by position in any row order."""
+    shuffled = df.iloc[[3, 0, 4, 2, 1]].set_axis(["a", "b", "c", "d", "e"])
+    expected = df.geotech.lab.index.get_liquid_limit().iloc[[3, 0, 4, 2, 1]]
+    result = shuffled.geotech.lab.index.get_liquid_limit()
+    tm.assert_series_equal(result, expected.set_axis(shuffled.index))
+
+
+def test_get_flow_curve(df):
+    """Test if the flow curve has the liquid limit, flow index and fit diagnostics."""
+    result = df.geotech.lab.index.get_flow_curve()
+
+    expected_liquid_limit = df.geotech.lab.index.get_liquid_limit()
+    tm.assert_series_equal(result["liquid_limit"], expected_liquid_limit)
+    # The flow index is the slope of the moisture content over a log cycle of the drops.
+    drops = np.log10([23, 28, 33])
+    slope = np.polyfit(drops, [48.1, 46.7, 46.1], 1)[0]
+    assert result.loc[0, "flow_index"] == pytest.approx(-slope)
+    assert result["flow_curve_trials"].tolist() == [3, 3, 3, 3, pd.NA]
+    assert result["flow_curve_r_squared"].iloc[:4].between(0, 1).all()
+    assert result["flow_curve_trials"].dtype == "Int64"
+
+
+@pytest.mark.parametrize(
+    ("drops", "moisture_content", "expected"),
+    [
+        ([23.0, 28.0, None], [48.1, None, 46.1], [None, None, None, 1]),
+        ([25.0, 25.0, 25.0], [48.1, 46.7, 46.1], [None, None, None, 3]),
+        ([20.0, 30.0, 0.0], [40.0, 40.0, 40.0], [40.0, 0.0, None, 2]),
+    ],
+)
+def test_get_flow_curve_degenerate(drops, moisture_content, expected):
+    """Test if samples without a defined line or coefficient of determination are `NA`."""
+    df = pd.DataFrame(
+        {
+            "point_id": ["bh-1"],
+            "bottom": [1.0],
+            **{f"liquid_limit_{n + 1}_drops": [value] for n, value in enumerate(drops)},
+            **{
+                f"liquid_limit_{n + 1}_moisture_content": [value]
+                for n, value in enumerate(moisture_content)
+            },
+        }
+    )
+    result = df.geotech.lab.index.get_flow_curve().iloc[0]
+    assert [None if pd.isna(value) else value for value in result] == expected
+
+
+def test_get_flow_curve_samples(df):
+    """Test if the flow curve of a sample table is joined back to the layers."""
+    layers = pd.DataFrame({"point_id": ["bh-2", "bh-9"], "bottom": [1, 1]})
+    result = layers.geotech.lab.index.get_flow_curve(samples=df)
+    expected = df.geotech.lab.index.get_flow_curve().iloc[[1, 4]].set_axis(layers.index)
+    tm.assert_frame_equal(result, expected)
+
+
+USCS_COLUMNS = [
+    "liquid_limit",
+    "plastic_limit",
+    "plasticity_index",
+    "fines_content",
+    "gravel_content",
+    "coefficient_of_uniformity",
+    "coefficient_of_curvature",
+]
+
+
+@pytest.mark.parametrize(
+    ("values", "expected"),
+    [
+        ((45.0, 23.0, 22.0, 85.0, 0.0, None, None), "CL"),
+        ((22.0, 17.0, 5.0, 60.0, None, None, None), "CL-ML"),
+        ((35.0, 32.0, 3.0, 60.0, None, None, None), "ML"),
+        ((65.0, 25.0, 40.0, 70.0, 5.0, None, None), "CH"),
+        ((65.0, 45.0, 20.0, 70.0, 5.0, None, None), "MH"),
+        ((30.0, None, None, 55.0, None, None, None), "ML"),
+        ((30.0, 32.0, None, 55.0, None, None, None), "ML"),
+        ((None, None, None, 3.0, 60.0, 12.0, 1.5), "GW"),
+        ((None, None, None, 3.0, 60.0, 5.0, 4.0), "GP"),
+        ((None, None, None, 4.0, 30.0, 8.0, 2.0), "SW"),
+        ((None, None, None, 4.0, 30.0, 5.0, 2.0), "SP"),
+        ((30.0, 18.0, 12.0, 8.0, 20.0, 3.0, 0.8), "SP-SC"),
+        ((25.0, None, None, 10.0, 60.0, 12.0, 1.5), "GW-GM"),
+        ((22.0, 17.0, 5.0, 12.0, 30.0, 8.0, 2.0), "SW-SC"),
+        ((40.0, 15.0, 25.0, 20.0, 50.0, None, None), "GC"),
+        ((22.0, 17.0, 5.0, 30.0, 20.0, None, None), "SC-SM"),
+        ((45.0, 35.0, 10.0, 49.0, 10.0, None, None), "SM"),
+        ((None, None, None, None, 10.0, 4.0, 1.5), None),
+        ((None, None, None, 3.0, 60.0, None, 1.5), None),
+        ((None, None, None, 20.0, None, None, None), None),
+        ((30.0, 5.0, 25.0, 70.0, None, None, None), None),
+        ((None, None, None, 55.0, None, None, None), None),
+        ((None, None, None, 10.0, 60.0, 12.0, 1.5), None),
+        ((None, None, None, 30.0, 20.0, None, None), None),
+    ],
+)
+def test_get_uscs_classification(values, expected):
+    """Test if each zone of the plasticity chart and gradation criteria gets its group symbol."""
+    df = pd.DataFrame(
+        {
+            "point_id": ["bh-1"],
+            "bottom": [1.0],
+            **{
+                column: pd.array([value], dtype="Float64")
+                for column, value in zip(USCS_COLUMNS, values, strict=True)
+            },
+        }
+    )
+    result = df.geotech.lab.index.get_uscs_classification()
+
+    assert isinstance(result.dtype, pd.CategoricalDtype)
+    assert result.name == "uscs_classification"
+    assert (None if pd.isna(result.iloc[0]) else result.iloc[0]) == expected
+
+
+def test_get_uscs_classification_dtype_backend():
+    """Test if the classification stays categorical with every dtype backend."""
+    df = pd.DataFrame(
+        [(45.0, 23.0, 22.0, 85.0, 0.0, None, None), (None, None, None, 3.0, 60.0, 12.0, 1.5)],
+        columns=USCS_COLUMNS,
+        dtype="float64",
+    ).assign(point_id="bh-1", bottom=[1.0, 2.0])
+    for dtype_backend in ["numpy", "numpy_nullable", "pyarrow"]:
+        with geotech_pandas.option_context(dtype_backend=dtype_backend):
+            result = df.geotech.lab.index.get_uscs_classification()
+        assert result.dtype == pd.CategoricalDtype(USCS_SYMBOLS)
+        assert result.tolist() == ["CL", "GW"]
+
+
+def test_get_uscs_classification_nonplastic():
+    """Test if a nonplastic silt is classified from the plasticity index of the accessor."""
+    df = pd.DataFrame(
+        {
+            "point_id": ["bh-1", "bh-1"],
+            "bottom": [1.0, 2.0],
+            "liquid_limit": [28.0, 28.0],
+            "plastic_limit": [None, 30.0],
+            "fines_content": [70.0, 30.0],
+            "gravel_content": [0.0, 10.0],
+            "coefficient_of_uniformity": [None, None],
+            "coefficient_of_curvature": [None, None],
+        }
+    )
+    df["plasticity_index"] = df.geotech.lab.index.get_plasticity_index()
+    result = df.geotech.lab.index.get_uscs_classification()
+    assert result.tolist() == ["ML", "SM"]
+
+
+@pytest.fixture
+def gradation() -> pd.DataFrame:
+    """Return sieve results of a well-graded gravel, a sand, a clay and an incomplete curve."""
+    sizes = [75.0, 19.0, 4.75, 2.0, 0.425, 0.075]
+    passing: list[list[float | None]] = [
+        [100.0, 70.0, 45.0, 30.0, 12.0, 3.0],
+        [100.0, 100.0, 95.0, 80.0, 40.0, 8.0],
+        [100.0, 100.0, 100.0, 99.0, 95.0, 85.0],
+        [None, None, None, 55.0, 40.0, 20.0],
+    ]
+    return pd.DataFrame(
+        {
+            "point_id": ["bh-1", "bh-1", "bh-2", "bh-3"],
+            "bottom": [1.0, 2.0, 1.0, 1.0],
+            **{f"sieve_{n + 1}_size": size for n, size in enumerate(sizes)},
+            **{f"sieve_{n + 1}_passing": [row[n] for row in passing] for n in range(len(sizes))},
+        }
+    ).convert_dtypes()
+
+
+def test_get_gradation(gradation):
+    """Test if the grain sizes are interpolated linearly in the logarithm of the size."""
+    result = gradation.geotech.lab.index.get_gradation()
+
+    sizes = np.log10([0.075, 0.425, 2.0, 4.75, 19.0, 75.0])
+    passing = [3.0, 12.0, 30.0, 45.0, 70.0, 100.0]
+    expected = 10 ** np.interp([10.0, 30.0, 60.0], passing, sizes)
+    np.testing.assert_allclose(result.loc[0, ["d10", "d30", "d60"]].to_numpy(float), expected)
+    assert result.loc[0, "coefficient_of_uniformity"] == pytest.approx(expected[2] / expected[0])
+    assert result.loc[0, "coefficient_of_curvature"] == pytest.approx(
+        expected[1] ** 2 / (expected[0] * expected[2])
+    )
+    assert result.loc[:2, "gravel_content"].tolist() == [55.0, 5.0, 0.0]
+    assert result.loc[:2, "sand_content"].tolist() == [42.0, 87.0, 15.0]
+    assert result.loc[:2, "fines_content"].tolist() == [3.0, 8.0, 85.0]
+    assert result.loc[2, ["d10", "d30", "d60"]].isna().all()
+    assert result.loc[3, ["d10", "d60", "gravel_content"]].isna().all()
+    assert result.loc[3, "d30"] == pytest.approx(10 ** np.interp(30, [20, 40], sizes[:2]))
+    assert (result.dtypes == "Float64").all()
+
+
+def test_get_gradation_unsorted(gradation):
+    """Test if sieves in any order and decreasing percentages passing are handled."""
+    reordered = gradation.rename(
+        columns={
+            f"sieve_{n}_{value}": f"sieve_{7 - n}_{value}"
+            for value in ["size", "passing"]
+            for n in range(1, 7)
+        }
+    )
+    tm.assert_frame_equal(
+        reordered.geotech.lab.index.get_gradation(), gradation.geotech.lab.index.get_gradation()
+    )
+
+    gradation.loc[0, "sieve_2_passing"] = 40.0
+    result = gradation.geotech.lab.index.get_gradation(sieves=6)
+    assert result.loc[0, "gravel_content"] == 55.0  # noqa: PLR2004
+    assert result.loc[0, "d60"] == pytest.approx(10 ** np.interp(60, [45, 100], np.log10([19, 75])))
+
+
+def test_get_gradation_sieve_results(gradation):
+    """Test if a long table of sieve results gives the same results joined to the layers."""
+    sieve_results = pd.concat(
+        [
+            gradation[["point_id", "bottom", f"sieve_{n}_size", f"sieve_{n}_passing"]].set_axis(
+                ["point_id", "bottom", "sieve_size", "sieve_passing"], axis=1
+            )
+            for n in range(1, 7)
+        ],
+        ignore_index=True,
+    ).sample(frac=1, random_state=0)
+    layers = pd.DataFrame({"point_id": ["bh-2", "bh-9", "bh-1"], "bottom": [1.0, 1.0, 1.0]})
+
+    result = layers.geotech.lab.index.get_gradation(sieve_results=sieve_results)
+    expected = gradation.geotech.lab.index.get_gradation().iloc[[2, 0, 0]].set_axis(layers.index)
+    expected.iloc[1] = pd.NA
+    tm.assert_frame_equal(result, expected)
+
+
+def test_get_gradation_invalid(gradation):
+    """Test if missing sieve columns are rejected."""
+    layers = gradation[["point_id", "bottom"]]
+    with pytest.raises(ValueError, match="No sieve_"):
+        layers.geotech.lab.index.get_gradation()
+    with pytest.raises(AttributeError, match="sieve_7_size"):
+        gradation.geotech.lab.index.get_gradation(sieves=7)
+    with pytest.raises(AttributeError, match="sieve_passing"):
+        layers.geotech.lab.index.get_gradation(sieve_results=layers.assign(sieve_size=1.0))
+
+
+def test_get_gradation_classification(gradation):
+    """Test if the gradation can be used to classify the soil."""
+    result = gradation.assign(
+        **gradation.geotech.lab.index.get_gradation(),
+        liquid_limit=[None, 25.0, 60.0, None],
+        plastic_limit=[None, None, 25.0, None],
+        plasticity_index=[None, None, 35.0, None],
+    ).geotech.lab.index.get_uscs_classification()
+    assert result.tolist()[:3] == ["GW", "SP-SM", "CH"]
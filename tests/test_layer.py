@@ -2,6 +2,7 @@
 
 from functools import reduce
 
+import numpy as np
 import pandas as pd
 import pandas._testing as tm
 import pytest
@@ -85,6 +86,28 @@ def test_split_at_depth_series():
     tm.assert_frame_equal(result, expected)
 
 
+def test_split_at_depth_series_index():
+    """Test if ``split_at_depth`` aligns a ``Series`` of depths with the layers by label."""
+    expected = pd.DataFrame(
+        {
+            "point_id": ["BH-1", "BH-1", "BH-1", "BH-2", "BH-2", "BH-2"],
+            "bottom": [0.5, 1.0, 2.0, 1.5, 3.0, 4.0],
+            "top": [0.0, 0.5, 1.0, 0.0, 1.5, 3.0],
+        }
+    )
+    result = pd.DataFrame(
+        {
+            "point_id": ["BH-1", "BH-1", "BH-2", "BH-2"],
+            "bottom": [1.0, 2.0, 3.0, 4.0],
+            "top": [0.0, 1.0, 0.0, 3.0],
+        },
+        index=[10, 11, 12, 13],
+    )
+    depth = pd.Series([1.5, 1.5, 0.5, 0.5], index=[13, 12, 11, 10])
+    result = result.geotech.layer.split_at(depth=depth)
+    tm.assert_frame_equal(result, expected)
+
+
 def test_split_at_depth_str():
     """Test if ``split_at_depth`` with ``depth`` as a ``str`` value will return the correct
     result.
@@ -149,3 +172,23 @@ def test_split_at_depth_no_index_reset():
     )
     result = result.geotech.layer.split_at(depth=0.5, reset_index=False)
     tm.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize("method", ["get_top", "get_center", "get_thickness"])
+def test_layer_methods_as_array(df, method):
+    """Test if `as_array=True` returns the values and missing value mask of the Series."""
+    expected = getattr(df.geotech.layer, method)()
+    values, na = getattr(df.geotech.layer, method)(as_array=True)
+    np.testing.assert_array_equal(na, expected.isna().to_numpy())
+    np.testing.assert_array_equal(values, expected.to_numpy())
+
+
+def test_get_top_unordered_points():
+    """Test if the top is shifted within each point when the layers of a point are not
+    contiguous.
+    """  # noqa: D205
+    df = pd.DataFrame(
+        {"point_id": ["BH-1", "BH-2", "BH-1", "BH-2"], "bottom": [1.0, 2.0, 3.0, 4.0]}
+    )
+    expected = pd.Series([0.0, 0.0, 1.0, 2.0], name="top")
+    tm.assert_series_equal(df.geotech.layer.get_top(), expected)
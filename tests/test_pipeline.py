@@ -0,0 +1,136 @@
+"""Test the out-of-core pipeline runner."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from geotech_pandas import pipeline
+from geotech_pandas.testing import make_boreholes
+
+pytest.importorskip("pyarrow")
+
+STEPS = [
+    "layer.get_top",
+    ("in_situ.spt.get_n_value", {"refusal": 100}),
+    "in_situ.spt.get_report",
+    "lab.index.get_liquid_limit",
+    "lab.index.get_plastic_limit",
+]
+
+
+@pytest.fixture
+def df() -> pd.DataFrame:
+    """Return synthetic boreholes with an unknown ``top`` to be calculated by the pipeline."""
+    return make_boreholes(20, 7, seed=0).drop(columns="top")
+
+
+def _get_expected(df: pd.DataFrame) -> pd.DataFrame:
+    """Return the results of the steps on the whole DataFrame."""
+    df = df.assign(top=df.geotech.layer.get_top())
+    return df.assign(
+        n_value=df.geotech.in_situ.spt.get_n_value(refusal=100),
+        spt_report=df.geotech.in_situ.spt.get_report(),
+        liquid_limit=df.geotech.lab.index.get_liquid_limit(),
+        plastic_limit=df.geotech.lab.index.get_plastic_limit(),
+    )
+
+
+def _add_depth_class(df: pd.DataFrame) -> pd.DataFrame:
+    """Add whether each layer is deeper than 5 m."""
+    return df.assign(deep=df["bottom"] > 5.0)  # noqa: PLR2004
+
+
+@pytest.mark.parametrize(("suffix", "n_workers"), [("csv", None), ("parquet", None), ("csv", 2)])
+def test_run(tmp_path, df, suffix, n_workers):
+    """Test if the chunks are processed and written in order like the whole DataFrame."""
+    source = tmp_path / f"boreholes.{suffix}"
+    if suffix == "csv":
+        df.to_csv(source, index=False)
+    else:
+        df.to_parquet(source, index=False)
+
+    counters = pipeline.run(
+        source, tmp_path / "result.parquet", STEPS, chunksize=10, n_workers=n_workers
+    )
+
+    result = pd.read_parquet(tmp_path / "result.parquet")
+    expected = _get_expected(df)
+    assert counters["rows"] == len(df)
+    assert counters["points"] == df["point_id"].nunique()
+    assert counters["chunks"] > 1
+    assert list(result.columns) == list(expected.columns)
+    assert result["point_id"].tolist() == expected["point_id"].tolist()
+    for column in ["top", "n_value", "liquid_limit", "plastic_limit"]:
+        np.testing.assert_allclose(
+            result[column].to_numpy(dtype="float64", na_value=np.nan),
+            expected[column].to_numpy(dtype="float64", na_value=np.nan),
+        )
+    assert result["spt_report"].tolist() == expected["spt_report"].tolist()
+
+
+def test_run_callable_step(tmp_path, df):
+    """Test if callables can be used as steps and progress is reported after each chunk."""
+    df.to_csv(tmp_path / "boreholes.csv", index=False)
+    reports = []
+
+    pipeline.run(
+        tmp_path / "boreholes.csv",
+        tmp_path / "result.parquet",
+        ["layer.get_top", _add_depth_class],
+        chunksize=50,
+        progress=reports.append,
+    )
+
+    result = pd.read_parquet(tmp_path / "result.parquet")
+    assert result["deep"].tolist() == (df["bottom"] > 5.0).tolist()  # noqa: PLR2004
+    assert [report["chunks"] for report in reports] == list(range(1, len(reports) + 1))
+    assert reports[-1]["rows"] == len(df)
+    assert reports[-1]["rows_per_second"] > 0
+
+
+def test_run_dataframe_step(tmp_path, df):
+    """Test if the columns of steps that return a DataFrame are added to the chunk."""
+    df.to_csv(tmp_path / "boreholes.csv", index=False)
+
+    counters = pipeline.run(
+        tmp_path / "boreholes.csv",
+        tmp_path / "result.parquet",
+        ["in_situ.spt.compute_all"],
+        chunksize=10,
+    )
+
+    result = pd.read_parquet(tmp_path / "result.parquet")
+    expected = df.geotech.in_situ.spt.compute_all()
+    assert counters["points"] == df["point_id"].nunique()
+    assert list(result.columns) == [*df.columns, *expected.columns]
+    assert result["point_id"].tolist() == df["point_id"].tolist()
+    np.testing.assert_allclose(
+        result["n_value"].to_numpy(dtype="float64", na_value=np.nan),
+        expected["n_value"].to_numpy(dtype="float64", na_value=np.nan),
+    )
+
+
+def test_iter_point_chunks():
+    """Test if points are never split, including points that are longer than a chunk."""
+    point_id = pd.Series(["BH-1"] * 2 + ["BH-2"] * 5 + ["BH-3"] * 2)
+    chunks = [pd.DataFrame({"point_id": point_id[i : i + 3]}) for i in range(0, 9, 3)]
+
+    result = [chunk["point_id"].tolist() for chunk in pipeline.iter_point_chunks(iter(chunks))]
+
+    assert result == [["BH-1"] * 2, ["BH-2"] * 5, ["BH-3"] * 2]
+
+
+def test_iter_point_chunks_not_contiguous():
+    """Test if points that are not contiguous in the source are rejected."""
+    chunks = [
+        pd.DataFrame({"point_id": ["BH-1", "BH-2"]}),
+        pd.DataFrame({"point_id": ["BH-3", "BH-1"]}),
+    ]
+    with pytest.raises(ValueError, match="contiguous in the source for: BH-1"):
+        list(pipeline.iter_point_chunks(iter(chunks)))
+
+
+def test_unknown_step(tmp_path, df):
+    """Test if unknown steps are rejected before reading the source."""
+    with pytest.raises(ValueError, match="Unknown method"):
+        pipeline.run(tmp_path / "missing.csv", tmp_path / "result.parquet", ["layer.get_tops"])
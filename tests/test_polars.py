@@ -0,0 +1,155 @@
+"""Test the ``geotech`` namespace on Polars frames."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from geotech_pandas.testing import make_boreholes
+
+pl = pytest.importorskip("polars")
+pytest.importorskip("geotech_pandas.polars")
+
+
+@pytest.fixture
+def df() -> pd.DataFrame:
+    """Return synthetic boreholes with missing, hammer weight and nonplastic samples."""
+    df = make_boreholes(20, 10, seed=0)
+    df.loc[3, ["blows_1", "blows_2", "blows_3", "pen_1", "pen_2", "pen_3"]] = pd.NA
+    df.loc[4, ["blows_2", "pen_2"]] = pd.NA
+    df.loc[5, ["blows_1", "blows_2", "blows_3"]] = 0
+    df.loc[6, ["blows_1", "blows_2", "blows_3"]] = 0
+    df.loc[6, ["pen_1", "pen_2", "pen_3"]] = pd.NA
+    df.loc[7, "liquid_limit_2_moisture_content"] = np.nan
+    df.loc[8, "plastic_limit_1_moisture_content"] = np.nan
+    df["moisture_content"] = df.geotech.lab.index.get_moisture_content()
+    df["liquid_limit"] = df.geotech.lab.index.get_liquid_limit()
+    df["plastic_limit"] = df.geotech.lab.index.get_plastic_limit()
+    df.loc[9, "liquid_limit"] = pd.NA
+    df.loc[10, "plastic_limit"] = 90.0
+    df["plasticity_index"] = df.geotech.lab.index.get_plasticity_index()
+    return df
+
+
+@pytest.mark.parametrize(
+    "method",
+    [
+        "layer.get_top",
+        "layer.get_center",
+        "layer.get_thickness",
+        "in_situ.spt.get_seating_pen",
+        "in_situ.spt.get_main_pen",
+        "in_situ.spt.get_total_pen",
+        "in_situ.spt.get_seating_drive",
+        "in_situ.spt.get_main_drive",
+        "in_situ.spt.get_total_drive",
+        "in_situ.spt.is_refusal",
+        "in_situ.spt.is_hammer_weight",
+        "in_situ.spt.get_n_value",
+        "in_situ.spt.get_report",
+        "in_situ.spt.get_typical_hammer_efficiency_factor",
+        "lab.index.get_moisture_content",
+        "lab.index.get_liquid_limit",
+        "lab.index.get_plastic_limit",
+        "lab.index.is_nonplastic",
+        "lab.index.get_plasticity_index",
+        "lab.index.get_liquidity_index",
+    ],
+)
+def test_methods(df, method):
+    """Test if the expressions of a lazy query match the pandas methods."""
+    lf = pl.from_pandas(df).lazy()
+    pandas_accessor = df.geotech
+    polars_namespace = lf.geotech
+    for name in method.split("."):
+        pandas_accessor = getattr(pandas_accessor, name)
+        polars_namespace = getattr(polars_namespace, name)
+
+    expected = pandas_accessor()
+    result = lf.select(polars_namespace()).collect().to_series()
+
+    assert result.name == expected.name
+    if pd.api.types.is_numeric_dtype(expected.dtype) and not pd.api.types.is_bool_dtype(
+        expected.dtype
+    ):
+        np.testing.assert_allclose(
+            result.to_numpy().astype("float64"),
+            expected.to_numpy(dtype="float64", na_value=np.nan),
+        )
+    else:
+        assert result.to_list() == [None if pd.isna(value) else value for value in expected]
+
+
+@pytest.mark.parametrize(("refusal", "limit"), [(50, False), (30, True), (None, False)])
+def test_get_n_value(df, refusal, limit):
+    """Test if the N-value options match the pandas method."""
+    expected = df.geotech.in_situ.spt.get_n_value(
+        refusal=pd.NA if refusal is None else refusal, limit=limit
+    )
+    frame = pl.from_pandas(df)
+    result = frame.select(frame.geotech.in_situ.spt.get_n_value(refusal, limit)).to_series()
+    assert result.to_list() == [None if pd.isna(value) else value for value in expected]
+
+
+def test_is_hammer_weight_missing_blows():
+    """Test if missing blows are not zero for hammer weight samples."""
+    frame = pl.DataFrame(
+        {
+            "point_id": ["BH-1", "BH-2", "BH-3"],
+            "bottom": [1.0, 1.0, 1.0],
+            "sample_type": ["spt", "spt", "spt"],
+            "sample_number": [1, 1, 1],
+            "blows_1": [None, 0, None],
+            "blows_2": [0, 0, None],
+            "blows_3": [0, 0, None],
+            "pen_1": [150, 150, 150],
+            "pen_2": [150, 150, 150],
+            "pen_3": [150, 150, 150],
+        }
+    )
+    result = frame.select(frame.geotech.in_situ.spt.is_hammer_weight()).to_series()
+    assert result.to_list() == [False, True, None]
+
+
+def test_get_top_unordered_points():
+    """Test if ``get_top`` shifts within each point regardless of the row order."""
+    frame = pl.DataFrame(
+        {"point_id": ["BH-2", "BH-1", "BH-2", None, "BH-1"], "bottom": [1.0, 2.0, 3.0, 1.0, 4.0]}
+    )
+    result = frame.select(frame.geotech.layer.get_top()).to_series()
+    assert result.to_list() == [0.0, 0.0, 1.0, None, 2.0]
+
+
+def test_missing_columns():
+    """Test if the column contract is checked against the schema."""
+    lf = pl.LazyFrame({"point_id": ["BH-1"], "bottom": [1.0]})
+    with pytest.raises(AttributeError, match="blows_1"):
+        lf.geotech.in_situ.spt  # noqa: B018
+    with pytest.raises(AttributeError, match="geotech"):
+        pl.LazyFrame({"point_id": ["BH-1"]}).geotech  # noqa: B018
+
+
+@pytest.mark.parametrize(
+    ("bottom", "match"),
+    [
+        ([1.0, 0.5, 1.0], "monotonically increasing for: BH-1"),
+        ([1.0, None, 1.0], "monotonically increasing for: BH-1"),
+        ([1.0, 1.0, 1.0], "duplicate point_id and bottom: BH-1"),
+    ],
+)
+def test_validate(bottom, match):
+    """Test if ``validate`` checks the bottom column like the pandas accessor."""
+    lf = pl.LazyFrame({"point_id": ["BH-1", "BH-1", "BH-2"], "bottom": bottom})
+    with pytest.raises(AttributeError, match=match):
+        lf.geotech.validate()
+
+
+def test_invalid_hammer(df):
+    """Test if unknown hammers are rejected for DataFrames and left as null for LazyFrames."""
+    df.loc[0, "spt_hammer_type"] = "automatic hammer"
+    frame = pl.from_pandas(df)
+    with pytest.raises(ValueError, match="automatic hammer"):
+        frame.geotech.in_situ.spt.get_typical_hammer_efficiency_factor()
+
+    lf = frame.lazy()
+    expression = lf.geotech.in_situ.spt.get_typical_hammer_efficiency_factor()
+    assert lf.select(expression).collect().to_series()[0] is None
@@ -0,0 +1,94 @@
+"""Test profiling of accessor methods."""
+
+import logging
+
+import pandas as pd
+import pytest
+
+import geotech_pandas
+from geotech_pandas.profiling import get_profiler
+
+
+@pytest.fixture
+def df() -> pd.DataFrame:
+    """Return common DataFrame for profiling."""
+    return pd.DataFrame(
+        {
+            "point_id": ["BH-1", "BH-1", "BH-2"],
+            "bottom": [1.0, 2.0, 1.0],
+            "liquid_limit_1_drops": [23, None, 17],
+            "liquid_limit_1_moisture_content": [48.1, None, 42.4],
+            "liquid_limit_2_drops": [28, None, 25],
+            "liquid_limit_2_moisture_content": [46.7, None, 41.5],
+            "liquid_limit_3_drops": [33, None, 34],
+            "liquid_limit_3_moisture_content": [46.1, None, 40.9],
+        }
+    )
+
+
+def test_profile(df):
+    """Test if methods and internal phases are recorded inside the ``profile`` block."""
+    with geotech_pandas.profile() as p:
+        df.geotech.layer.get_top()
+        df.geotech.lab.index.get_liquid_limit()
+    result = p.to_frame()
+
+    assert result.loc["LayerDataFrameAccessor.get_top", "calls"] == 1
+    assert result.loc["LayerDataFrameAccessor.get_top", "rows"] == len(df)
+    assert result.loc["IndexDataFrameAccessor._transform_liquid_limit_data", "calls"] == 1
+    assert result.loc["_get_linear_fits", "calls"] == 1
+    assert "GeotechPandasBase._validate_monotony" in result.index
+    assert (result["wall_time"] >= result["mean_wall_time"]).all()
+
+
+def test_profile_disabled(df):
+    """Test if nothing is recorded outside of the ``profile`` block."""
+    with geotech_pandas.profile() as p:
+        pass
+    df.geotech.layer.get_top()
+    assert p.to_frame().empty
+
+
+def test_profile_option(df):
+    """Test if the session profiler records calls while the ``profile`` option is enabled."""
+    get_profiler().reset()
+    with geotech_pandas.option_context(profile=True):
+        df.geotech.layer.get_top()
+    df.geotech.layer.get_top()
+    assert get_profiler().to_frame().loc["LayerDataFrameAccessor.get_top", "calls"] == 1
+    get_profiler().reset()
+
+
+def test_profile_log(df, caplog):
+    """Test if structured log events are emitted when ``log`` is `True`."""
+    with (
+        caplog.at_level(logging.INFO, logger="geotech_pandas.profiling"),
+        geotech_pandas.profile(log=True),
+    ):
+        df.geotech.layer.get_top()
+    events = [record.geotech_profile for record in caplog.records]
+    assert {"name": "LayerDataFrameAccessor.get_top", "rows": len(df)}.items() <= next(
+        event for event in events if event["name"] == "LayerDataFrameAccessor.get_top"
+    ).items()
+
+
+def test_profile_memory(df):
+    """Test if memory usage is recorded when ``memory`` is `True`."""
+    with geotech_pandas.profile(memory=True) as p:
+        df.geotech.lab.index.get_liquid_limit()
+    result = p.to_frame()
+
+    assert {"peak_memory", "allocated_memory", "peak_memory_ratio"} <= set(result.columns)
+    assert result.loc["IndexDataFrameAccessor.get_liquid_limit", "peak_memory"] > 0
+    assert (
+        result.loc["IndexDataFrameAccessor.get_liquid_limit", "peak_memory"]
+        >= result.loc["IndexDataFrameAccessor._transform_liquid_limit_data", "peak_memory"]
+    )
+    assert result.loc["IndexDataFrameAccessor.get_liquid_limit", "peak_memory_ratio"] > 0
+
+
+def test_profile_memory_disabled(df):
+    """Test if memory usage is not recorded by default."""
+    with geotech_pandas.profile() as p:
+        df.geotech.layer.get_top()
+    assert "peak_memory" not in p.to_frame().columns
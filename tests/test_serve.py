@@ -0,0 +1,108 @@
+"""Test the request-batching server."""
+
+import asyncio
+import json
+
+import pandas as pd
+import pandas._testing as tm
+import pytest
+
+from geotech_pandas.serve import BatchServer, submit
+
+
+@pytest.fixture
+def frames() -> list[pd.DataFrame]:
+    """Return requests with SPT samples, where all requests use the same ``point_id``."""
+    return [
+        pd.DataFrame(
+            {
+                "point_id": ["BH-1", "BH-1"],
+                "bottom": [1.0 + i, 2.0 + i],
+                "sample_type": ["spt", "spt"],
+                "sample_number": [1, 2],
+                "blows_1": [2, 10 + i],
+                "blows_2": [3, 20],
+                "blows_3": [4, 30],
+                "pen_1": [150, 150],
+                "pen_2": [150, 150],
+                "pen_3": [150, 150],
+            }
+        )
+        for i in range(5)
+    ]
+
+
+def test_batching(frames):
+    """Test if concurrent requests are computed in a single batch with separate results."""
+
+    async def main():
+        async with BatchServer(window=0.05, processes=0) as server:
+            results = await asyncio.gather(
+                *[submit(*server.address, "in_situ.spt.get_n_value", frame) for frame in frames]
+            )
+            return results, server.get_metrics()
+
+    results, metrics = asyncio.run(main())
+    for frame, result in zip(frames, results, strict=True):
+        expected = frame.geotech.in_situ.spt.get_n_value().astype("float64")
+        tm.assert_series_equal(result.astype("float64"), expected)
+    assert metrics["requests"] == len(frames)
+    assert metrics["batches"] == 1
+    assert metrics["mean_batch_size"] == len(frames)
+    assert metrics["rows"] == 2 * len(frames)
+
+
+def test_process_pool(frames):
+    """Test if batches are computed in worker processes."""
+
+    async def main():
+        async with BatchServer(processes=1) as server:
+            return await submit(*server.address, "layer.get_top", frames[1])
+
+    tm.assert_series_equal(asyncio.run(main()), pd.Series([0.0, 2.0], name="top"))
+
+
+def test_invalid_request(frames):
+    """Test if an invalid request fails without failing the rest of its batch."""
+    frames[0] = frames[0].assign(bottom=[2.0, 1.0])
+
+    async def main():
+        async with BatchServer(window=0.05, processes=0) as server:
+            return await asyncio.gather(
+                *[submit(*server.address, "layer.get_top", frame) for frame in frames],
+                return_exceptions=True,
+            )
+
+    results = asyncio.run(main())
+    assert isinstance(results[0], ValueError)
+    assert "BH-1" in str(results[0])
+    assert all(isinstance(result, pd.Series) for result in results[1:])
+
+
+@pytest.mark.parametrize("method", ["layer.get_tops", "layer._validate", "layer", "to_csv"])
+def test_unknown_method(frames, method):
+    """Test if methods outside the ``geotech`` accessor are rejected."""
+
+    async def main():
+        async with BatchServer(processes=0) as server:
+            await submit(*server.address, method, frames[0])
+
+    with pytest.raises(ValueError, match="Unknown method"):
+        asyncio.run(main())
+
+
+def test_metrics_endpoint():
+    """Test if the metrics are served over HTTP."""
+
+    async def main():
+        async with BatchServer(processes=0) as server:
+            reader, writer = await asyncio.open_connection(*server.address)
+            writer.write(b"GET /metrics HTTP/1.1\r\nHost: localhost\r\n\r\n")
+            await writer.drain()
+            response = await reader.read()
+            writer.close()
+            return response
+
+    head, _, content = asyncio.run(main()).partition(b"\r\n\r\n")
+    assert head.startswith(b"HTTP/1.1 200 OK")
+    assert json.loads(content)["requests"] == 0
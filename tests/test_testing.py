@@ -0,0 +1,47 @@
+"""Test synthetic data generators."""
+
+import pandas as pd
+import pandas._testing as tm
+import pytest
+
+import geotech_pandas  # noqa: F401
+from geotech_pandas.testing import make_boreholes
+
+
+@pytest.mark.parametrize(
+    ("with_spt", "with_atterberg", "columns"),
+    [
+        (False, False, 3),
+        (True, False, 14),
+        (False, True, 14),
+        (True, True, 25),
+    ],
+)
+def test_make_boreholes_shape(with_spt, with_atterberg, columns):
+    """Test if the generated DataFrame has the requested rows and columns."""
+    df = make_boreholes(4, 5, with_spt=with_spt, with_atterberg=with_atterberg, seed=0)
+    assert df.shape == (20, columns)
+    assert df.geotech.point.ids == ["BH-1", "BH-2", "BH-3", "BH-4"]
+
+
+def test_make_boreholes_seed():
+    """Test if the same seed generates the same DataFrame."""
+    tm.assert_frame_equal(make_boreholes(3, 4, seed=1), make_boreholes(3, 4, seed=1))
+
+
+def test_make_boreholes_valid():
+    """Test if the generated DataFrame is accepted by the accessor methods."""
+    df = make_boreholes(20, 15, seed=2)
+
+    tm.assert_series_equal(df.geotech.layer.get_top(), df["top"])
+
+    spt = df.geotech.in_situ.spt
+    assert spt.get_report().notna().all()
+    assert spt.is_refusal().any()
+    assert spt.get_typical_hammer_efficiency_factor().notna().all()
+
+    index = df.geotech.lab.index
+    liquid_limit = index.get_liquid_limit()
+    assert liquid_limit.notna().all()
+    assert (index.get_plastic_limit() < liquid_limit).all()
+    assert pd.Series.between(index.get_moisture_content(), 15.0, 45.0).all()
@@ -0,0 +1,95 @@
+"""Test internal utilities."""
+
+import numpy as np
+import pandas as pd
+import pandas._testing as tm
+import pytest
+
+import geotech_pandas
+from geotech_pandas.testing import make_boreholes
+from geotech_pandas.utils import convert_dtype_backend
+
+METHODS = [
+    ("layer", "get_top"),
+    ("layer", "get_center"),
+    ("layer", "get_thickness"),
+    ("in_situ.spt", "get_seating_pen"),
+    ("in_situ.spt", "get_main_pen"),
+    ("in_situ.spt", "get_total_pen"),
+    ("in_situ.spt", "get_seating_drive"),
+    ("in_situ.spt", "get_main_drive"),
+    ("in_situ.spt", "get_total_drive"),
+    ("in_situ.spt", "is_refusal"),
+    ("in_situ.spt", "is_hammer_weight"),
+    ("in_situ.spt", "get_n_value"),
+    ("in_situ.spt", "get_report"),
+    ("in_situ.spt", "get_typical_hammer_efficiency_factor"),
+    ("lab.index", "get_moisture_content"),
+    ("lab.index", "get_liquid_limit"),
+    ("lab.index", "get_plastic_limit"),
+]
+
+
+@pytest.mark.parametrize(
+    ("series", "dtype_backend", "expected"),
+    [
+        (pd.Series([1, None], dtype="Int64"), "numpy", pd.Series([1.0, np.nan])),
+        (pd.Series([1, 2], dtype="Int64"), "numpy", pd.Series([1, 2])),
+        (pd.Series([True, None], dtype=object), "numpy", pd.Series([True, np.nan])),
+        (
+            pd.Series([True, pd.NA], dtype=object),
+            "numpy_nullable",
+            pd.Series([True, None], dtype="boolean"),
+        ),
+        (pd.Series(["a", pd.NA], dtype="string"), "numpy", pd.Series(["a", np.nan], dtype=object)),
+        (pd.Series([1.5, np.nan]), "numpy_nullable", pd.Series([1.5, None], dtype="Float64")),
+        (pd.Series([1.5, np.nan]), None, pd.Series([1.5, np.nan])),
+        (pd.Series([pd.Timestamp(0)]), "numpy_nullable", pd.Series([pd.Timestamp(0)])),
+    ],
+)
+def test_convert_dtype_backend(series, dtype_backend, expected):
+    """Test if series are converted to the dtype of their kind in the dtype backend."""
+    tm.assert_series_equal(convert_dtype_backend(series, dtype_backend), expected)
+
+
+@pytest.mark.parametrize(("subaccessor", "method"), METHODS)
+@pytest.mark.parametrize("dtype_backend", ["numpy", "numpy_nullable", "pyarrow"])
+def test_dtype_backend_option(subaccessor, method, dtype_backend):
+    """Test if the results of accessor methods follow the ``dtype_backend`` option."""
+    if dtype_backend == "pyarrow":
+        pytest.importorskip("pyarrow")
+
+    df = make_boreholes(3, 10, seed=0)
+    df.loc[[2, 12], ["blows_1", "blows_2", "blows_3", "pen_1", "pen_2", "pen_3"]] = pd.NA
+    accessor = df.geotech
+    for name in subaccessor.split("."):
+        accessor = getattr(accessor, name)
+
+    default = getattr(accessor, method)()
+    with geotech_pandas.option_context(dtype_backend=dtype_backend):
+        result = getattr(accessor, method)()
+
+    if dtype_backend == "numpy":
+        assert not isinstance(result.dtype, pd.api.extensions.ExtensionDtype)
+    elif dtype_backend == "numpy_nullable":
+        assert isinstance(result.dtype, pd.api.extensions.ExtensionDtype)
+        assert not isinstance(result.dtype, pd.ArrowDtype)
+    else:
+        assert isinstance(result.dtype, pd.ArrowDtype)
+    tm.assert_series_equal(result.isna(), default.isna())
+    tm.assert_series_equal(result.dropna().astype(object), default.dropna().astype(object))
+
+
+def test_dtype_backend_option_invalid():
+    """Test if invalid dtype backends are rejected."""
+    with pytest.raises(ValueError, match="Invalid value for option 'dtype_backend'"):
+        geotech_pandas.set_option("dtype_backend", "arrow")
+
+
+def test_dtype_backend_option_as_array():
+    """Test if results returned as arrays are not converted by the ``dtype_backend`` option."""
+    df = make_boreholes(3, 10, seed=0)
+    with geotech_pandas.option_context(dtype_backend="numpy_nullable"):
+        values, na = df.geotech.in_situ.spt.get_n_value(as_array=True)
+    assert values.dtype == "float64"
+    assert na.dtype == "bool"